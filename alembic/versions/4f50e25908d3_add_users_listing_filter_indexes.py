@@ -0,0 +1,69 @@
+"""add_users_listing_filter_indexes
+
+Revision ID: 4f50e25908d3
+Revises: a2f3e6b94010
+Create Date: 2026-10-16 11:47:03.918442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f50e25908d3'
+down_revision: Union[str, Sequence[str], None] = 'a2f3e6b94010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so that writes to users are not blocked meanwhile
+    with op.get_context().autocommit_block():
+        # Active users in id order: active-only pages read off the index
+        op.create_index(
+            'ix_users_active_id',
+            'users',
+            ['id'],
+            postgresql_where=sa.text('active'),
+            postgresql_concurrently=True,
+        )
+        # Rows are appended in created_at order, so block range min/max
+        # summaries narrow created_at ranges at a fraction of a B-tree size
+        op.create_index(
+            'ix_users_created_at',
+            'users',
+            ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+        # updated_at is not correlated with row order, hence a B-tree
+        op.create_index(
+            'ix_users_updated_at',
+            'users',
+            ['updated_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_updated_at',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_created_at',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_active_id',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
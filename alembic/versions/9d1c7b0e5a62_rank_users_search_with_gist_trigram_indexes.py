@@ -0,0 +1,83 @@
+"""rank_users_search_with_gist_trigram_indexes
+
+Revision ID: 9d1c7b0e5a62
+Revises: 4f50e25908d3
+Create Date: 2026-10-17 10:21:36.482907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d1c7b0e5a62'
+down_revision: Union[str, Sequence[str], None] = '4f50e25908d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GiST trigram indexes serve ILIKE like the GIN ones and can also be
+    # read in similarity order (KNN ``<->``) to rank search matches. The
+    # new indexes are built before the old ones go, concurrently, so that
+    # searches stay indexed and writes are not blocked meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_name_trgm_gist',
+            'users',
+            ['name'],
+            postgresql_using='gist',
+            postgresql_ops={'name': 'gist_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_email_trgm_gist',
+            'users',
+            ['email'],
+            postgresql_using='gist',
+            postgresql_ops={'email': 'gist_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_email_trgm',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_name_trgm',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_name_trgm',
+            'users',
+            ['name'],
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_email_trgm',
+            'users',
+            ['email'],
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_email_trgm_gist',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_name_trgm_gist',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,55 @@
+"""add_users_search_trigram_indexes
+
+Revision ID: a2f3e6b94010
+Revises: fc568cf57513
+Create Date: 2026-10-16 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2f3e6b94010'
+down_revision: Union[str, Sequence[str], None] = 'fc568cf57513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently so that writes to users are not blocked meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_name_trgm',
+            'users',
+            ['name'],
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_email_trgm',
+            'users',
+            ['email'],
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_email_trgm',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_name_trgm',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
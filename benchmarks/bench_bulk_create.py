@@ -0,0 +1,76 @@
+"""
+Benchmark insert throughput of per-user create vs bulk create.
+
+Usage:
+    python -m benchmarks.bench_bulk_create [--rows N]
+
+Set ``BENCH_DATABASE_URL`` to run against PostgreSQL (see
+``benchmarks.common.database_url``).
+"""
+
+import argparse
+import time
+from typing import List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import database_url
+from core.application.dto.user_dto import CreateUserDto
+from core.application.use_cases.bulk_create_users_use_case import (
+    BulkCreateUsersUseCase,
+)
+from core.application.use_cases.create_user_use_case import (
+    CreateUserUseCase,
+)
+from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
+    UserRepositoryPostgresAdapter,
+)
+from infrastructure.database.models.user_model import Base
+
+
+def _dtos(prefix: str, rows: int) -> List[CreateUserDto]:
+    """Build ``rows`` create DTOs with unique emails."""
+    return [
+        CreateUserDto(name=f"User {i}", email=f"{prefix}{i}@example.com")
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print rows per second for each mode."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    engine = create_engine(database_url())
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    with session_factory() as session:
+        use_case = CreateUserUseCase(UserRepositoryPostgresAdapter(session))
+        started = time.perf_counter()
+        for dto in _dtos("single", args.rows):
+            use_case.execute(dto)
+        single = time.perf_counter() - started
+
+    with session_factory() as session:
+        bulk_use_case = BulkCreateUsersUseCase(
+            UserRepositoryPostgresAdapter(session)
+        )
+        started = time.perf_counter()
+        bulk_use_case.execute(_dtos("bulk", args.rows))
+        bulk = time.perf_counter() - started
+
+    print(f"rows={args.rows}")
+    print(f"{'mode':>8} {'seconds':>10} {'rows/s':>12}")
+    print(f"{'single':>8} {single:>10.3f} {args.rows / single:>12.0f}")
+    print(f"{'bulk':>8} {bulk:>10.3f} {args.rows / bulk:>12.0f}")
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark file import throughput and memory.
+
+Writes an NDJSON file of ``--rows`` users, imports it through
+``ImportUsersUseCase`` and reports rows per minute and, with
+``--trace-memory``, peak traced memory.
+On PostgreSQL this exercises the COPY path; on SQLite the INSERT fallback.
+
+Usage:
+    python -m benchmarks.bench_import [--rows N] [--trace-memory]
+
+Set ``BENCH_DATABASE_URL`` to run against PostgreSQL (see
+``benchmarks.common.database_url``).
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import database_url
+from core.application.use_cases.import_users_use_case import (
+    ImportUsersUseCase,
+)
+from infrastructure.adapters.files.user_file_reader import (
+    NDJSON,
+    read_user_rows,
+)
+from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
+    UserRepositoryPostgresAdapter,
+)
+from infrastructure.database.models.user_model import Base
+
+
+def _write_file(path: str, rows: int) -> None:
+    """Write ``rows`` NDJSON users with unique emails."""
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(rows):
+            record = {"name": f"User {i}", "email": f"user{i}@example.com"}
+            file.write(json.dumps(record) + "\n")
+
+
+def main() -> None:
+    """Run the benchmark and print throughput and peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="report peak memory (tracemalloc slows the import down)",
+    )
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "users.ndjson")
+    _write_file(path, args.rows)
+
+    engine = create_engine(database_url())
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    with open(path, "rb") as stream, session_factory() as session:
+        use_case = ImportUsersUseCase(UserRepositoryPostgresAdapter(session))
+        if args.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        result = use_case.execute(read_user_rows(stream, NDJSON))
+        elapsed = time.perf_counter() - started
+        if args.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    print(f"rows={args.rows} dialect={engine.dialect.name}")
+    print(f"created={result.created} rejected={result.rejected}")
+    print(f"seconds={elapsed:.1f} rows/min={args.rows / elapsed * 60:.0f}")
+    if args.trace_memory:
+        print(f"peak traced memory={peak / 2**20:.1f} MiB")
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark ``GET /users`` throughput with and without the fast JSON path.
+
+``schema`` is the previous response path: every DTO is copied into a
+``UserResponseSchema``, which FastAPI validates again against the
+``response_model`` and encodes through ``jsonable_encoder``. ``orjson`` is
+the current router, which encodes the DTOs straight with orjson. Both run
+in-process through the ASGI test client, on the same listing use case and
+database.
+
+Usage:
+    python -m benchmarks.bench_list_endpoint [--rows N] [--requests N]
+
+Set ``BENCH_DATABASE_URL`` to run against PostgreSQL (see
+``benchmarks.common.database_url``).
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime
+from typing import Iterator, List
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.common import database_url
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.application.use_cases.list_users_use_case import (
+    ListUsersUseCase,
+)
+from infrastructure.api.responses import FastJSONResponse
+from infrastructure.api.routers import user_router
+from infrastructure.api.schemas.user_schema import UserResponseSchema
+from infrastructure.database.models.user_model import Base, UserModel
+from infrastructure.database.session import get_db
+
+LIMITS = (100, 1000)
+
+
+def _seed(engine: Engine, rows: int) -> None:
+    """Insert ``rows`` users."""
+    now = datetime.now(UTC)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [
+                {
+                    "name": f"User {i}",
+                    "email": f"user{i}@example.com",
+                    "active": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(rows)
+            ],
+        )
+
+
+def _schema_app() -> FastAPI:
+    """Build an app listing users through the response model."""
+    app = FastAPI()
+
+    @app.get("/users", response_model=List[UserResponseSchema])
+    def list_users(
+        limit: int = 100,
+        repository: UserRepositoryPort = Depends(
+            user_router.get_read_user_repository
+        ),
+    ) -> List[UserResponseSchema]:
+        page = ListUsersUseCase(repository).execute_page(limit=limit)
+        return [UserResponseSchema.model_validate(dto) for dto in page.items]
+
+    return app
+
+
+def _orjson_app() -> FastAPI:
+    """Build an app with the users router."""
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(user_router.router)
+    return app
+
+
+def _requests_per_second(
+    client: TestClient, limit: int, requests: int
+) -> float:
+    """Return how many listing requests of ``limit`` users run a second."""
+    # Warm up statement and connection caches before timing
+    for _ in range(5):
+        client.get("/users", params={"limit": limit}).raise_for_status()
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get("/users", params={"limit": limit})
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Run the benchmark and print requests per second for each path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine(database_url())
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    _seed(engine, args.rows)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db() -> Iterator[Session]:
+        with session_factory() as session:
+            yield session
+
+    print(f"rows={args.rows} requests={args.requests}")
+    print(f"{'path':>8} {'limit':>6} {'req/s':>10} {'users/s':>12}")
+    for name, app in (("schema", _schema_app()), ("orjson", _orjson_app())):
+        app.dependency_overrides[get_db] = override_get_db
+        with TestClient(app) as client:
+            for limit in LIMITS:
+                rate = _requests_per_second(client, limit, args.requests)
+                print(
+                    f"{name:>8} {limit:>6} {rate:>10.1f} "
+                    f"{rate * limit:>12.0f}"
+                )
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark memory and construction cost of the user models.
+
+Reports bytes per object and objects built a second for ``User``,
+``EmailAddress`` and the user DTOs, which are slotted dataclasses, next to
+``dict`` twins: the same dataclasses (and validation) without
+``__slots__``, as they were before. Bytes per object count the instance
+only, not the field values, which are shared between instances here.
+
+Usage:
+    python -m benchmarks.bench_model_memory [--count N]
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.application.dto.user_dto import (
+    CreateUserDto,
+    UpdateUserDto,
+    UserResponseDto,
+)
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+
+# Dunder methods of the models that are not generated by @dataclass
+MODEL_DUNDERS = ("__post_init__", "__str__")
+# Construction is timed this many times and the best run is kept
+TIMING_RUNS = 3
+
+
+def _dict_twin(cls: type) -> type:
+    """Rebuild a slotted dataclass as a plain one, with a ``__dict__``."""
+    fields = dataclasses.fields(cls)
+    field_names = {model_field.name for model_field in fields}
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name in MODEL_DUNDERS
+        or (not name.startswith("__") and name not in field_names)
+    }
+    specs: List[Tuple[Any, ...]] = [
+        (model_field.name, model_field.type)
+        if model_field.default is dataclasses.MISSING
+        else (
+            model_field.name,
+            model_field.type,
+            dataclasses.field(default=model_field.default),
+        )
+        for model_field in fields
+    ]
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        specs,
+        namespace=namespace,
+        frozen=cls.__dataclass_params__.frozen,
+    )
+
+
+def _factories(
+    user: type, email_address: type, create: type, update: type, read: type
+) -> Dict[str, Callable[[], object]]:
+    """Get a factory building each model from shared field values."""
+    now = datetime.now(UTC)
+    email = email_address("john.doe@example.com")
+    return {
+        "User": lambda: user(1, "John Doe", email, True, now, now),
+        "EmailAddress": lambda: email_address("john.doe@example.com"),
+        "CreateUserDto": lambda: create("John Doe", "john.doe@example.com"),
+        "UpdateUserDto": lambda: update(name="John Doe"),
+        "UserResponseDto": lambda: read(
+            1, "John Doe", "john.doe@example.com", True, now, now
+        ),
+    }
+
+
+def _bytes_per_object(factory: Callable[[], object], count: int) -> float:
+    """Return the memory allocated per object for ``count`` objects."""
+    objects: List[object] = [None] * count
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        objects[i] = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def _objects_per_second(factory: Callable[[], object], count: int) -> float:
+    """
+    Return how many objects ``factory`` builds a second.
+
+    The garbage collector is off while timing, like in ``timeit``: its
+    pauses on a million new objects would swamp the difference.
+    """
+    objects: List[object] = [None] * count
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for i in range(count):
+            objects[i] = factory()
+        return count / (time.perf_counter() - started)
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    """Run the benchmark and print memory and throughput per model."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    slotted_models = (
+        User,
+        EmailAddress,
+        CreateUserDto,
+        UpdateUserDto,
+        UserResponseDto,
+    )
+    variants = (
+        ("slots", _factories(*slotted_models)),
+        ("dict", _factories(*map(_dict_twin, slotted_models))),
+    )
+
+    print(f"count={args.count}")
+    print(f"{'model':>16} {'layout':>6} {'bytes/obj':>10} {'objs/s':>12}")
+    for model in variants[0][1]:
+        for layout, factories in variants:
+            factory = factories[model]
+            size = _bytes_per_object(factory, args.count)
+            rate = max(
+                _objects_per_second(factory, args.count)
+                for _ in range(TIMING_RUNS)
+            )
+            print(f"{model:>16} {layout:>6} {size:>10.1f} {rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
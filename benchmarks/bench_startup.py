@@ -0,0 +1,90 @@
+"""
+Benchmark the cold start of the app.
+
+Imports ``main`` in fresh interpreters with ``python -X importtime`` and
+prints the median import time and interpreter wall time with the sync and
+the async routers (``DATABASE_ASYNC``), then the modules that took longest
+themselves.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--top N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+MODES = {"sync": "false", "async": "true"}
+
+
+def _import_times(
+    database_async: str,
+) -> Tuple[Dict[str, Tuple[int, int]], float]:
+    """
+    Import ``main`` in a new interpreter.
+
+    Returns:
+        The (self, cumulative) import microseconds by module, and the
+        seconds the interpreter ran.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "DATABASE_ASYNC": database_async},
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split(
+            "|"
+        )
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times, wall
+
+
+def main() -> None:
+    """Run the benchmark and print import times per router."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"runs={args.runs}")
+    print(f"{'mode':>6} {'import main ms':>15} {'wall ms':>8} {'modules':>8}")
+    self_times: Dict[str, List[int]] = defaultdict(list)
+    for mode, database_async in MODES.items():
+        totals, walls = [], []
+        for _ in range(args.runs):
+            times, wall = _import_times(database_async)
+            totals.append(times["main"][1] / 1000)
+            walls.append(wall * 1000)
+            if mode == "sync":
+                for module, (self_us, _) in times.items():
+                    self_times[module].append(self_us)
+        print(
+            f"{mode:>6} {statistics.median(totals):>15.1f} "
+            f"{statistics.median(walls):>8.1f} {len(times):>8}"
+        )
+
+    print("\nslowest modules to import themselves (sync, median ms):")
+    slowest = sorted(
+        self_times.items(),
+        key=lambda item: statistics.median(item[1]),
+        reverse=True,
+    )
+    for module, samples in slowest[:args.top]:
+        print(f"{statistics.median(samples) / 1000:>8.1f}  {module}")
+
+
+if __name__ == "__main__":
+    main()
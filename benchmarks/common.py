@@ -0,0 +1,19 @@
+"""Shared helpers for benchmarks."""
+
+import os
+import tempfile
+
+
+def database_url() -> str:
+    """
+    Return the benchmark database URL.
+
+    Uses ``BENCH_DATABASE_URL`` when set, otherwise an on-disk SQLite
+    database in a temporary directory. Benchmarks drop and recreate the
+    ``users`` table, so never point it at real data.
+    """
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if url:
+        return url
+    path = os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+    return f"sqlite:///{path}"
@@ -1,11 +1,36 @@
 """User DTOs."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+# Fields of a user, in response order; sparse fieldsets pick among them
+USER_FIELDS = ("id", "name", "email", "active", "created_at", "updated_at")
 
-@dataclass
+
+def normalize_fields(
+    fields: Optional[Sequence[str]],
+) -> Optional[Tuple[str, ...]]:
+    """
+    Check a sparse fieldset and put it in ``USER_FIELDS`` order.
+
+    Duplicates are dropped; the fixed order keeps one statement per set of
+    fields whatever order they were asked in.
+
+    Raises:
+        ValueError: If no field is given or a field does not exist.
+    """
+    if fields is None:
+        return None
+    unknown = [name for name in fields if name not in USER_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    if not fields:
+        raise ValueError("At least one field is required")
+    return tuple(name for name in USER_FIELDS if name in fields)
+
+
+@dataclass(slots=True)
 class CreateUserDto:
     """DTO for creating a user."""
 
@@ -14,7 +39,7 @@ class CreateUserDto:
     active: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUserDto:
     """DTO for updating a user."""
 
@@ -23,7 +48,7 @@ class UpdateUserDto:
     active: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserResponseDto:
     """DTO for user response."""
 
@@ -33,3 +58,85 @@ class UserResponseDto:
     active: bool
     created_at: datetime
     updated_at: datetime
+
+
+# A user read for a response: its DTO, or a dict of a sparse fieldset
+UserRow = Union[UserResponseDto, Dict[str, Any]]
+
+
+@dataclass
+class UserFilterDto:
+    """
+    DTO for the filters of a users listing.
+
+    ``created_after`` is inclusive and ``created_before`` exclusive;
+    ``updated_since`` is inclusive. Filters left as None are not applied.
+    """
+
+    active: Optional[bool] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    updated_since: Optional[datetime] = None
+
+
+@dataclass
+class UserPageDto:
+    """
+    DTO for a keyset-paginated page of users.
+
+    Items are dicts holding only the requested fields when the listing
+    asked for a sparse fieldset.
+    """
+
+    items: List[UserRow]
+    next_cursor: Optional[str] = None
+    # Users matching the listing's filters across all pages, when asked
+    # for, and whether it was counted ("exact") or "estimate"d
+    total_count: Optional[int] = None
+    total_count_mode: Optional[str] = None
+
+
+@dataclass
+class UserBatchDto:
+    """DTO for users looked up by id, in request order."""
+
+    users: List[UserResponseDto]
+    missing_ids: List[int]
+
+
+@dataclass
+class BulkCreateUserResultDto:
+    """DTO for the outcome of one row of a bulk create."""
+
+    index: int
+    user: Optional[UserResponseDto] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportUserRowDto:
+    """DTO for one parsed row of a users import file."""
+
+    line: int
+    user: Optional[CreateUserDto] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportUserRejectionDto:
+    """DTO for a row of a users import that was rejected."""
+
+    line: int
+    error: str
+
+
+@dataclass
+class ImportUsersResultDto:
+    """DTO for the outcome of a users import."""
+
+    received: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    rejected: int = 0
+    rejections: List[ImportUserRejectionDto] = field(default_factory=list)
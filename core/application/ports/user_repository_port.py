@@ -1,7 +1,24 @@
 """User repository port."""
 
-from typing import List, Optional, Protocol
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+from core.application.dto.user_dto import (
+    UserFilterDto,
+    UserResponseDto,
+    UserRow,
+)
 from core.domain.entities.user import User
 
 
@@ -9,25 +26,208 @@ class UserRepositoryPort(Protocol):
     """Port for user repository operations."""
 
     def create(self, user: User) -> User:
-        """Create a new user."""
+        """
+        Create a new user.
+
+        Raises:
+            DuplicateEmailError: If the email already belongs to a user.
+        """
+        ...
+
+    def upsert_by_email(self, user: User) -> Tuple[User, bool]:
+        """
+        Create a user, or update the user that already has its email.
+
+        An existing user keeps its id and ``created_at``; its name, active
+        status and ``updated_at`` are overwritten.
+
+        Returns:
+            The created or updated user, and whether it was created.
+        """
+        ...
+
+    def create_many(self, users: Sequence[User]) -> List[Optional[User]]:
+        """
+        Create many users in a single transaction.
+
+        Emails must be unique within ``users``. Returns the created users in
+        input order, with None for users whose email already exists.
+        """
+        ...
+
+    def import_users(
+        self, chunks: Iterable[Sequence[User]], upsert: bool = False
+    ) -> Tuple[int, int]:
+        """
+        Load users in a single transaction, consuming ``chunks`` lazily.
+
+        Users whose email already exists, in the table or earlier in the
+        import, are skipped; with ``upsert`` they overwrite the name, active
+        status and ``updated_at`` of that user instead (last one wins).
+
+        Returns:
+            The number of users created and the number updated.
+        """
         ...
 
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by id."""
         ...
 
+    def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """
+        Get a user by id as a response DTO, for read-only callers.
+
+        The stored row is trusted: it was validated when written, so it is
+        mapped to the DTO without building (and validating) the entity.
+        """
+        ...
+
+    def get_fields_by_id(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get only some fields of a user by id.
+
+        Only the columns of ``fields`` (names of ``USER_FIELDS``) are read;
+        the user comes back as a dict of them, without building the entity.
+        """
+        ...
+
+    def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """
+        Get the users with the given ids in a single query.
+
+        Users come in no particular order; ids without a user are left out.
+        """
+        ...
+
+    def get_many_responses(
+        self, user_ids: Sequence[int]
+    ) -> List[UserResponseDto]:
+        """
+        Get the users with the given ids as response DTOs.
+
+        Like ``get_many``, for read-only callers (see
+        ``get_response_by_id``).
+        """
+        ...
+
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         ...
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination."""
+    def get_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """Get which of the given emails already belong to a user."""
+        ...
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+    ) -> List[User]:
+        """
+        Get all users ordered by id with pagination.
+
+        When ``after_id`` is given, only users with an id greater than it
+        are returned (keyset pagination) and ``skip`` is ignored. Only users
+        matching ``filters``, if given, are returned.
+        """
+        ...
+
+    def get_all_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_count: bool = False,
+    ) -> Tuple[List[UserRow], Optional[int]]:
+        """
+        Get a page of users like ``get_all``, for read-only callers.
+
+        Users are trusted response DTOs (see ``get_response_by_id``), or
+        dicts of ``fields`` (names of ``USER_FIELDS``) when given. With
+        ``with_count`` all users matching ``filters`` are counted too,
+        exactly, regardless of ``skip`` and ``after_id``.
+
+        Returns:
+            The page of users, and the count, or None without
+            ``with_count``.
+        """
+        ...
+
+    def estimate_count(
+        self, filters: Optional[UserFilterDto] = None
+    ) -> int:
+        """
+        Estimate how many users match ``filters``.
+
+        Cheap whatever the table size, but possibly off by the drift since
+        the database last gathered statistics.
+        """
+        ...
+
+    def search(self, query: str, limit: int = 20) -> List[User]:
+        """
+        Search users by partial name or email, best matches first.
+
+        Users whose name or email contains ``query`` (case-insensitive) are
+        ranked by trigram similarity to it, ties by id.
+        """
+        ...
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[User]:
+        """
+        Iterate over all users ordered by id.
+
+        Rows are fetched ``batch_size`` at a time from a server-side cursor,
+        so memory use does not grow with the number of users. The
+        underlying cursor is released when the iterator is exhausted or
+        closed.
+        """
+        ...
+
+    def iter_all_fields(
+        self, fields: Sequence[str], batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all users like ``iter_all``, as dicts of ``fields``."""
         ...
 
     def update(self, user: User) -> User:
         """Update an existing user."""
         ...
 
+    def update_fields(
+        self,
+        user_id: int,
+        changes: Mapping[str, Any],
+        expected: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[User]:
+        """
+        Apply a partial update to a user in a single statement.
+
+        Args:
+            user_id: Id of the user to update.
+            changes: New values by field name.
+            expected: Current values by field name the user must have for
+                the update to apply (compare-and-set preconditions).
+
+        Returns:
+            The updated user, or None if no user was updated because it does
+            not exist, a precondition did not hold or ``changes`` would not
+            change any field (``updated_at`` aside).
+
+        Raises:
+            DuplicateEmailError: If the new email belongs to another user.
+        """
+        ...
+
     def delete(self, user_id: int) -> bool:
         """Delete a user by id."""
         ...
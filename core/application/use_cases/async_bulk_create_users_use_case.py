@@ -0,0 +1,53 @@
+"""Async bulk create users use case."""
+
+from typing import List, Sequence
+
+from core.application.dto.user_dto import (
+    BulkCreateUserResultDto,
+    CreateUserDto,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.bulk_create_users_use_case import (
+    BulkCreateUsersUseCase,
+)
+
+
+class AsyncBulkCreateUsersUseCase:
+    """Use case for creating many users at once through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(
+        self, dtos: Sequence[CreateUserDto]
+    ) -> List[BulkCreateUserResultDto]:
+        """
+        Execute the bulk create users use case.
+
+        Same semantics as ``BulkCreateUsersUseCase.execute``.
+        """
+        candidates, errors = BulkCreateUsersUseCase.build_users(dtos)
+
+        emails = [str(user.email) for _, user in candidates]
+        existing_emails = (
+            await self._user_repository.get_existing_emails(emails)
+            if emails
+            else set()
+        )
+        candidates = BulkCreateUsersUseCase.reject_existing(
+            candidates, existing_emails, errors
+        )
+
+        created_users = (
+            await self._user_repository.create_many(
+                [user for _, user in candidates]
+            )
+            if candidates
+            else []
+        )
+        return BulkCreateUsersUseCase.build_results(
+            len(dtos), candidates, created_users, errors
+        )
@@ -0,0 +1,75 @@
+"""Async create user use case."""
+
+from datetime import UTC, datetime
+from typing import Tuple
+
+from core.application.dto.user_dto import (
+    CreateUserDto,
+    UserResponseDto,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+
+
+class AsyncCreateUserUseCase:
+    """Use case for creating a user through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(
+        self, dto: CreateUserDto, upsert: bool = False
+    ) -> Tuple[UserResponseDto, bool]:
+        """
+        Execute the create user use case.
+
+        Email uniqueness is enforced by the repository in the same write, so
+        no lookup is made beforehand.
+
+        Args:
+            dto: User to create.
+            upsert: If True, update the user that already has this email
+                instead of failing (used by sync jobs).
+
+        Returns:
+            The user, and whether it was created rather than updated.
+
+        Raises:
+            DuplicateEmailError: If the email is taken and ``upsert`` is
+                False.
+        """
+        # Create domain entity
+        email = EmailAddress(dto.email)
+        now = datetime.now(UTC)
+        user = User(
+            id=None,
+            name=dto.name,
+            email=email,
+            active=dto.active,
+            created_at=now,
+            updated_at=now,
+        )
+
+        # Save via repository
+        created = True
+        if upsert:
+            created_user, created = (
+                await self._user_repository.upsert_by_email(user)
+            )
+        else:
+            created_user = await self._user_repository.create(user)
+
+        # Map to response DTO
+        result = UserResponseDto(
+            id=created_user.id or 0,
+            name=created_user.name,
+            email=str(created_user.email),
+            active=created_user.active,
+            created_at=created_user.created_at,
+            updated_at=created_user.updated_at,
+        )
+        return result, created
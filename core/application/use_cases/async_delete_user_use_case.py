@@ -0,0 +1,17 @@
+"""Async delete user use case."""
+
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+
+
+class AsyncDeleteUserUseCase:
+    """Use case for deleting a user through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(self, user_id: int) -> bool:
+        """Execute the delete user use case."""
+        return await self._user_repository.delete(user_id)
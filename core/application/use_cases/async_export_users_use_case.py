@@ -0,0 +1,47 @@
+"""Async export users use case."""
+
+from typing import Any, AsyncIterator, Dict, Sequence
+
+from core.application.dto.user_dto import (
+    UserResponseDto,
+    normalize_fields,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.export_users_use_case import (
+    ExportUsersUseCase,
+)
+
+
+class AsyncExportUsersUseCase:
+    """Use case for exporting every user through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[UserResponseDto]:
+        """Execute the export users use case."""
+        async for user in self._user_repository.iter_all(
+            batch_size=batch_size
+        ):
+            yield ExportUsersUseCase._to_response_dto(user)
+
+    def execute_fields(
+        self, fields: Sequence[str], batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the export users use case for a sparse fieldset.
+
+        See ``ExportUsersUseCase.execute_fields``.
+
+        Raises:
+            ValueError: If no field is given or a field does not exist.
+        """
+        normalized = normalize_fields(fields) or ()
+        return self._user_repository.iter_all_fields(
+            normalized, batch_size=batch_size
+        )
@@ -0,0 +1,33 @@
+"""Async get many users use case."""
+
+from typing import Sequence
+
+from core.application.dto.user_dto import UserBatchDto
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.get_many_users_use_case import (
+    GetManyUsersUseCase,
+)
+
+
+class AsyncGetManyUsersUseCase:
+    """Use case for getting many users by id through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(self, user_ids: Sequence[int]) -> UserBatchDto:
+        """
+        Execute the get many users use case.
+
+        See ``GetManyUsersUseCase.execute``.
+        """
+        unique_ids = GetManyUsersUseCase.unique_ids(user_ids)
+        users = (
+            await self._user_repository.get_many_responses(unique_ids)
+            if unique_ids
+            else []
+        )
+        return GetManyUsersUseCase.build_batch(unique_ids, users)
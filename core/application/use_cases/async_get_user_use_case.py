@@ -0,0 +1,43 @@
+"""Async get user use case."""
+
+from typing import Any, Dict, Optional, Sequence
+
+from core.application.dto.user_dto import (
+    UserResponseDto,
+    normalize_fields,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+
+
+class AsyncGetUserUseCase:
+    """Use case for getting a user by id through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(self, user_id: int) -> Optional[UserResponseDto]:
+        """
+        Execute the get user use case.
+
+        See ``GetUserUseCase.execute``.
+        """
+        return await self._user_repository.get_response_by_id(user_id)
+
+    async def execute_fields(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute the get user use case for a sparse fieldset.
+
+        See ``GetUserUseCase.execute_fields``.
+
+        Raises:
+            ValueError: If no field is given or a field does not exist.
+        """
+        normalized = normalize_fields(fields) or ()
+        return await self._user_repository.get_fields_by_id(
+            user_id, normalized
+        )
@@ -0,0 +1,45 @@
+"""Async import users use case."""
+
+from typing import AsyncIterable, AsyncIterator, List, Sequence
+
+from core.application.dto.user_dto import (
+    ImportUserRowDto,
+    ImportUsersResultDto,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.import_users_use_case import (
+    ImportUsersUseCase,
+)
+from core.domain.entities.user import User
+
+
+class AsyncImportUsersUseCase:
+    """Use case for importing users through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(
+        self,
+        chunks: AsyncIterable[Sequence[ImportUserRowDto]],
+        upsert: bool = False,
+    ) -> ImportUsersResultDto:
+        """
+        Execute the import users use case.
+
+        Rows arrive already chunked, so that the caller can parse them off
+        the event loop; see ``ImportUsersUseCase.execute``.
+        """
+        result = ImportUsersResultDto()
+
+        async def validated_chunks() -> AsyncIterator[List[User]]:
+            async for chunk in chunks:
+                yield ImportUsersUseCase.validate_rows(chunk, result)
+
+        created, updated = await self._user_repository.import_users(
+            validated_chunks(), upsert=upsert
+        )
+        return ImportUsersUseCase.finish(result, created, updated)
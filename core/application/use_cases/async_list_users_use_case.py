@@ -0,0 +1,148 @@
+"""Async list users use case."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.application.dto.user_dto import (
+    UserFilterDto,
+    UserPageDto,
+    UserRow,
+    normalize_fields,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.list_users_use_case import (
+    COUNT_AUTO,
+    COUNT_ESTIMATE,
+    COUNT_EXACT,
+    EXACT_COUNT_MAX_ROWS,
+    ListUsersUseCase,
+)
+
+
+class AsyncListUsersUseCase:
+    """Use case for listing users through an async repository."""
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryPort,
+        exact_count_max_rows: int = EXACT_COUNT_MAX_ROWS,
+    ) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+        self._exact_count_max_rows = exact_count_max_rows
+
+    async def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[UserFilterDto] = None,
+    ) -> List[UserRow]:
+        """
+        Execute the list users use case.
+
+        No fieldset is asked for, so the users are whole response DTOs.
+
+        Raises:
+            ValueError: If the filters are inconsistent.
+        """
+        page = await self.execute_offset_page(
+            skip=skip, limit=limit, filters=filters
+        )
+        return page.items
+
+    async def execute_offset_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[UserFilterDto] = None,
+        count: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPageDto:
+        """
+        Execute the list users use case with offset pagination.
+
+        See ``ListUsersUseCase.execute_offset_page``.
+
+        Raises:
+            ValueError: If the filters are inconsistent, the count mode
+                is unknown or a field does not exist.
+        """
+        fields = normalize_fields(fields)
+        rows, total_count, total_count_mode = await self._load(
+            {"skip": skip}, limit, filters, count, fields
+        )
+        return UserPageDto(
+            items=ListUsersUseCase.to_items(rows, fields),
+            total_count=total_count,
+            total_count_mode=total_count_mode,
+        )
+
+    async def execute_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[UserFilterDto] = None,
+        count: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPageDto:
+        """
+        Execute the list users use case with keyset pagination.
+
+        Cursors are interchangeable with ``ListUsersUseCase.execute_page``.
+
+        Raises:
+            ValueError: If the cursor is malformed, the filters are
+                inconsistent, the count mode is unknown or a field does not
+                exist.
+        """
+        after_id = ListUsersUseCase.decode_cursor(cursor) if cursor else None
+        fields = normalize_fields(fields)
+        rows, total_count, total_count_mode = await self._load(
+            {"after_id": after_id}, limit, filters, count, fields
+        )
+
+        next_cursor = None
+        if rows and len(rows) >= limit:
+            next_cursor = ListUsersUseCase.encode_cursor(
+                ListUsersUseCase.row_id(rows[-1])
+            )
+
+        return UserPageDto(
+            items=ListUsersUseCase.to_items(rows, fields),
+            next_cursor=next_cursor,
+            total_count=total_count,
+            total_count_mode=total_count_mode,
+        )
+
+    async def _load(
+        self,
+        position: Dict[str, Any],
+        limit: int,
+        filters: Optional[UserFilterDto],
+        count: Optional[str],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Tuple[List[UserRow], Optional[int], Optional[str]]:
+        """Load a page of users and, if asked for, their total count."""
+        filters = ListUsersUseCase.normalize_filters(filters)
+        ListUsersUseCase.check_count_mode(count)
+        estimate = None
+        if count in (COUNT_ESTIMATE, COUNT_AUTO):
+            estimate = await self._user_repository.estimate_count(filters)
+        exact = ListUsersUseCase.use_exact_count(
+            count, estimate, self._exact_count_max_rows
+        )
+        rows, total_count = await self._user_repository.get_all_page(
+            limit=limit,
+            filters=filters,
+            fields=(
+                None if fields is None else ListUsersUseCase.with_id(fields)
+            ),
+            with_count=exact,
+            **position,
+        )
+        if exact:
+            return rows, total_count, COUNT_EXACT
+        if estimate is None:
+            return rows, None, None
+        return rows, estimate, COUNT_ESTIMATE
@@ -0,0 +1,36 @@
+"""Async search users use case."""
+
+from typing import List
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.search_users_use_case import (
+    SEARCH_DEFAULT_LIMIT,
+    SearchUsersUseCase,
+)
+
+
+class AsyncSearchUsersUseCase:
+    """Use case for searching users through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(
+        self, query: str, limit: int = SEARCH_DEFAULT_LIMIT
+    ) -> List[UserResponseDto]:
+        """
+        Execute the search users use case.
+
+        Raises:
+            ValueError: If the query is too short once trimmed.
+        """
+        users = await self._user_repository.search(
+            SearchUsersUseCase.normalize_query(query), limit=limit
+        )
+        return [
+            SearchUsersUseCase._to_response_dto(user) for user in users
+        ]
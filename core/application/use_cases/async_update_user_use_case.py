@@ -0,0 +1,49 @@
+"""Async update user use case."""
+
+from datetime import UTC, datetime
+from typing import Optional
+
+from core.application.dto.user_dto import (
+    UpdateUserDto,
+    UserResponseDto,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.update_user_use_case import (
+    UpdateUserUseCase,
+)
+
+
+class AsyncUpdateUserUseCase:
+    """Use case for updating a user through an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    async def execute(
+        self, user_id: int, dto: UpdateUserDto
+    ) -> Optional[UserResponseDto]:
+        """
+        Execute the update user use case.
+
+        Same semantics as ``UpdateUserUseCase.execute``.
+        """
+        changes, expected = UpdateUserUseCase.build_changes(dto)
+
+        updated_user = None
+        if changes:
+            changes["updated_at"] = datetime.now(UTC)
+            updated_user = await self._user_repository.update_fields(
+                user_id, changes, expected
+            )
+
+        if updated_user is None:
+            current_user = await self._user_repository.get_by_id(user_id)
+            if not current_user:
+                return None
+            UpdateUserUseCase.check_unchanged(current_user, dto)
+            updated_user = current_user
+
+        return UpdateUserUseCase.to_response_dto(updated_user)
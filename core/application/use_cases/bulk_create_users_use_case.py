@@ -0,0 +1,131 @@
+"""Bulk create users use case."""
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from core.application.dto.user_dto import (
+    BulkCreateUserResultDto,
+    CreateUserDto,
+    UserResponseDto,
+)
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+
+
+class BulkCreateUsersUseCase:
+    """Use case for creating many users at once."""
+
+    def __init__(self, user_repository: UserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    def execute(
+        self, dtos: Sequence[CreateUserDto]
+    ) -> List[BulkCreateUserResultDto]:
+        """
+        Execute the bulk create users use case.
+
+        Every row is validated; rows that fail validation or whose email is
+        duplicated in the batch or already taken are reported with an error
+        while the remaining rows are created in a single transaction.
+
+        Returns:
+            One result per input row, in input order.
+        """
+        candidates, errors = self.build_users(dtos)
+
+        emails = [str(user.email) for _, user in candidates]
+        existing_emails = (
+            self._user_repository.get_existing_emails(emails)
+            if emails
+            else set()
+        )
+        candidates = self.reject_existing(candidates, existing_emails, errors)
+
+        created_users = (
+            self._user_repository.create_many(
+                [user for _, user in candidates]
+            )
+            if candidates
+            else []
+        )
+        return self.build_results(
+            len(dtos), candidates, created_users, errors
+        )
+
+    @staticmethod
+    def build_users(
+        dtos: Sequence[CreateUserDto],
+    ) -> Tuple[List[Tuple[int, User]], Dict[int, str]]:
+        """
+        Validate rows into domain entities.
+
+        Returns:
+            The valid ``(index, user)`` pairs and the errors by row index.
+        """
+        users, errors = User.validate_many(
+            (dto.name, dto.email, dto.active) for dto in dtos
+        )
+
+        candidates: List[Tuple[int, User]] = []
+        seen_emails = set()
+        for index, user in users:
+            email = str(user.email)
+            if email in seen_emails:
+                errors[index] = f"Duplicate email {email} in batch"
+                continue
+            seen_emails.add(email)
+            candidates.append((index, user))
+
+        return candidates, errors
+
+    @staticmethod
+    def reject_existing(
+        candidates: List[Tuple[int, User]],
+        existing_emails: Set[str],
+        errors: Dict[int, str],
+    ) -> List[Tuple[int, User]]:
+        """Record errors for taken emails and return the remaining rows."""
+        remaining = []
+        for index, user in candidates:
+            email = str(user.email)
+            if email in existing_emails:
+                errors[index] = f"User with email {email} already exists"
+            else:
+                remaining.append((index, user))
+        return remaining
+
+    @staticmethod
+    def build_results(
+        total: int,
+        candidates: List[Tuple[int, User]],
+        created_users: Sequence[Optional[User]],
+        errors: Dict[int, str],
+    ) -> List[BulkCreateUserResultDto]:
+        """Merge created users and errors into per-row results."""
+        users_by_index: Dict[int, UserResponseDto] = {}
+        for (index, user), created in zip(candidates, created_users):
+            if created is None:
+                # Lost a race with a concurrent insert of the same email
+                errors[index] = (
+                    f"User with email {user.email} already exists"
+                )
+                continue
+            users_by_index[index] = UserResponseDto(
+                id=created.id or 0,
+                name=created.name,
+                email=str(created.email),
+                active=created.active,
+                created_at=created.created_at,
+                updated_at=created.updated_at,
+            )
+
+        return [
+            BulkCreateUserResultDto(
+                index=index,
+                user=users_by_index.get(index),
+                error=errors.get(index),
+            )
+            for index in range(total)
+        ]
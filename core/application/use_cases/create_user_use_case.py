@@ -1,6 +1,7 @@
 """Create user use case."""
 
 from datetime import UTC, datetime
+from typing import Tuple
 
 from core.application.dto.user_dto import (
     CreateUserDto,
@@ -20,13 +21,27 @@ class CreateUserUseCase:
         """Initialize use case with repository port."""
         self._user_repository = user_repository
 
-    def execute(self, dto: CreateUserDto) -> UserResponseDto:
-        """Execute the create user use case."""
-        # Check if email already exists
-        existing_user = self._user_repository.get_by_email(dto.email)
-        if existing_user:
-            raise ValueError(f"User with email {dto.email} already exists")
+    def execute(
+        self, dto: CreateUserDto, upsert: bool = False
+    ) -> Tuple[UserResponseDto, bool]:
+        """
+        Execute the create user use case.
 
+        Email uniqueness is enforced by the repository in the same write, so
+        no lookup is made beforehand.
+
+        Args:
+            dto: User to create.
+            upsert: If True, update the user that already has this email
+                instead of failing (used by sync jobs).
+
+        Returns:
+            The user, and whether it was created rather than updated.
+
+        Raises:
+            DuplicateEmailError: If the email is taken and ``upsert`` is
+                False.
+        """
         # Create domain entity
         email = EmailAddress(dto.email)
         now = datetime.now(UTC)
@@ -40,10 +55,14 @@ class CreateUserUseCase:
         )
 
         # Save via repository
-        created_user = self._user_repository.create(user)
+        created = True
+        if upsert:
+            created_user, created = self._user_repository.upsert_by_email(user)
+        else:
+            created_user = self._user_repository.create(user)
 
         # Map to response DTO
-        return UserResponseDto(
+        result = UserResponseDto(
             id=created_user.id or 0,
             name=created_user.name,
             email=str(created_user.email),
@@ -51,3 +70,4 @@ class CreateUserUseCase:
             created_at=created_user.created_at,
             updated_at=created_user.updated_at,
         )
+        return result, created
@@ -0,0 +1,61 @@
+"""Export users use case."""
+
+from typing import Any, Dict, Iterator, Sequence
+
+from core.application.dto.user_dto import (
+    UserResponseDto,
+    normalize_fields,
+)
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+
+
+class ExportUsersUseCase:
+    """Use case for exporting every user."""
+
+    def __init__(self, user_repository: UserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    def execute(self, batch_size: int = 1000) -> Iterator[UserResponseDto]:
+        """
+        Execute the export users use case.
+
+        Users are yielded one at a time, ordered by id, while the
+        repository fetches them ``batch_size`` rows at a time, so callers
+        can stream the whole table with flat memory use.
+        """
+        for user in self._user_repository.iter_all(batch_size=batch_size):
+            yield self._to_response_dto(user)
+
+    def execute_fields(
+        self, fields: Sequence[str], batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the export users use case for a sparse fieldset.
+
+        Like ``execute``, but only ``fields`` (names of ``USER_FIELDS``) are
+        read and each user is a dict of them, in ``USER_FIELDS`` order. The
+        fields are checked before the iterator is returned.
+
+        Raises:
+            ValueError: If no field is given or a field does not exist.
+        """
+        normalized = normalize_fields(fields) or ()
+        return self._user_repository.iter_all_fields(
+            normalized, batch_size=batch_size
+        )
+
+    @staticmethod
+    def _to_response_dto(user: User) -> UserResponseDto:
+        """Map a domain entity to a response DTO."""
+        return UserResponseDto(
+            id=user.id or 0,
+            name=user.name,
+            email=str(user.email),
+            active=user.active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
@@ -0,0 +1,54 @@
+"""Get many users use case."""
+
+from typing import List, Sequence
+
+from core.application.dto.user_dto import UserBatchDto, UserResponseDto
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+
+
+class GetManyUsersUseCase:
+    """Use case for getting many users by id at once."""
+
+    def __init__(self, user_repository: UserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    def execute(self, user_ids: Sequence[int]) -> UserBatchDto:
+        """
+        Execute the get many users use case.
+
+        All users are read in a single query. Repeated ids are looked up
+        once; users keep the order of their first id in ``user_ids``, and
+        ids without a user are reported as missing.
+        """
+        unique_ids = self.unique_ids(user_ids)
+        users = (
+            self._user_repository.get_many_responses(unique_ids)
+            if unique_ids
+            else []
+        )
+        return self.build_batch(unique_ids, users)
+
+    @staticmethod
+    def unique_ids(user_ids: Sequence[int]) -> List[int]:
+        """Drop repeated ids, keeping the first occurrence of each."""
+        return list(dict.fromkeys(user_ids))
+
+    @staticmethod
+    def build_batch(
+        user_ids: Sequence[int], users: Sequence[UserResponseDto]
+    ) -> UserBatchDto:
+        """Order loaded users like ``user_ids`` and list the missing ids."""
+        users_by_id = {user.id: user for user in users}
+        return UserBatchDto(
+            users=[
+                users_by_id[user_id]
+                for user_id in user_ids
+                if user_id in users_by_id
+            ],
+            missing_ids=[
+                user_id for user_id in user_ids if user_id not in users_by_id
+            ],
+        )
@@ -1,8 +1,11 @@
 """Get user use case."""
 
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence
 
-from core.application.dto.user_dto import UserResponseDto
+from core.application.dto.user_dto import (
+    UserResponseDto,
+    normalize_fields,
+)
 from core.application.ports.user_repository_port import (
     UserRepositoryPort,
 )
@@ -16,16 +19,27 @@ class GetUserUseCase:
         self._user_repository = user_repository
 
     def execute(self, user_id: int) -> Optional[UserResponseDto]:
-        """Execute the get user use case."""
-        user = self._user_repository.get_by_id(user_id)
-        if not user:
-            return None
-
-        return UserResponseDto(
-            id=user.id or 0,
-            name=user.name,
-            email=str(user.email),
-            active=user.active,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
+        """
+        Execute the get user use case.
+
+        Read-only, so the stored user is mapped straight to the response
+        DTO without being validated again as an entity.
+        """
+        return self._user_repository.get_response_by_id(user_id)
+
+    def execute_fields(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute the get user use case for a sparse fieldset.
+
+        Only ``fields`` (names of ``USER_FIELDS``) are read and returned,
+        in ``USER_FIELDS`` order.
+
+        Raises:
+            ValueError: If no field is given or a field does not exist.
+        """
+        normalized = normalize_fields(fields) or ()
+        return self._user_repository.get_fields_by_id(
+            user_id, normalized
         )
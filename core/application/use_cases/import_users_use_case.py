@@ -0,0 +1,108 @@
+"""Import users use case."""
+
+from itertools import islice
+from typing import Iterable, Iterator, List, Sequence
+
+from core.application.dto.user_dto import (
+    ImportUserRejectionDto,
+    ImportUserRowDto,
+    ImportUsersResultDto,
+)
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+
+# Rows validated and handed to the repository at a time
+IMPORT_CHUNK_SIZE = 5000
+
+# Rejected rows are all counted but only this many are reported
+MAX_REPORTED_REJECTIONS = 1000
+
+
+class ImportUsersUseCase:
+    """Use case for importing users from a file, whatever its size."""
+
+    def __init__(self, user_repository: UserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    def execute(
+        self,
+        rows: Iterable[ImportUserRowDto],
+        upsert: bool = False,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> ImportUsersResultDto:
+        """
+        Execute the import users use case.
+
+        ``rows`` is consumed lazily, ``chunk_size`` rows at a time: each
+        chunk is validated and its valid users are passed on to the
+        repository before the next chunk is read, so only one chunk is held
+        in memory. Invalid rows are rejected while the rest are loaded in a
+        single transaction.
+        """
+        result = ImportUsersResultDto()
+        chunks = (
+            self.validate_rows(chunk, result)
+            for chunk in self.chunk_rows(rows, chunk_size)
+        )
+        created, updated = self._user_repository.import_users(
+            chunks, upsert=upsert
+        )
+        return self.finish(result, created, updated)
+
+    @staticmethod
+    def chunk_rows(
+        rows: Iterable[ImportUserRowDto], chunk_size: int
+    ) -> Iterator[List[ImportUserRowDto]]:
+        """Split rows into lists of at most ``chunk_size`` rows."""
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def validate_rows(
+        rows: Sequence[ImportUserRowDto], result: ImportUsersResultDto
+    ) -> List[User]:
+        """
+        Validate parsed rows into domain entities.
+
+        Rejected rows are recorded in ``result``.
+        """
+        result.received += len(rows)
+        parsed = [
+            (index, row.user)
+            for index, row in enumerate(rows)
+            if row.user is not None and row.error is None
+        ]
+        users, errors = User.validate_many(
+            (user.name, user.email, user.active) for _, user in parsed
+        )
+        row_errors = {parsed[i][0]: error for i, error in errors.items()}
+
+        for index, row in enumerate(rows):
+            error = row_errors.get(index, row.error)
+            if row.user is not None and error is None:
+                continue
+            result.rejected += 1
+            if len(result.rejections) < MAX_REPORTED_REJECTIONS:
+                result.rejections.append(
+                    ImportUserRejectionDto(
+                        line=row.line, error=error or "Empty row"
+                    )
+                )
+        return [user for _, user in users]
+
+    @staticmethod
+    def finish(
+        result: ImportUsersResultDto, created: int, updated: int
+    ) -> ImportUsersResultDto:
+        """Record the repository counts; other valid rows were skipped."""
+        result.created = created
+        result.updated = updated
+        result.skipped = result.received - result.rejected - created - updated
+        return result
@@ -1,34 +1,290 @@
 """List users use case."""
 
-from typing import List
+import base64
+import binascii
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
-from core.application.dto.user_dto import UserResponseDto
+from core.application.dto.user_dto import (
+    UserFilterDto,
+    UserPageDto,
+    UserRow,
+    normalize_fields,
+)
 from core.application.ports.user_repository_port import (
     UserRepositoryPort,
 )
 
+CURSOR_PREFIX = "id:"
+
+# How the total number of users of a listing is counted: exactly, from the
+# database's statistics, or exactly unless the estimate is large
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_AUTO = "auto"
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_AUTO)
+EXACT_COUNT_MAX_ROWS = 100_000
+
 
 class ListUsersUseCase:
     """Use case for listing users."""
 
-    def __init__(self, user_repository: UserRepositoryPort) -> None:
-        """Initialize use case with repository port."""
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        exact_count_max_rows: int = EXACT_COUNT_MAX_ROWS,
+    ) -> None:
+        """
+        Initialize use case with repository port.
+
+        Args:
+            user_repository: Repository port.
+            exact_count_max_rows: Largest estimated total still counted
+                exactly in ``COUNT_AUTO`` mode.
+        """
         self._user_repository = user_repository
+        self._exact_count_max_rows = exact_count_max_rows
 
     def execute(
-        self, skip: int = 0, limit: int = 100
-    ) -> List[UserResponseDto]:
-        """Execute the list users use case."""
-        users = self._user_repository.get_all(skip=skip, limit=limit)
-
-        return [
-            UserResponseDto(
-                id=user.id or 0,
-                name=user.name,
-                email=str(user.email),
-                active=user.active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[UserFilterDto] = None,
+    ) -> List[UserRow]:
+        """
+        Execute the list users use case.
+
+        No fieldset is asked for, so the users are whole response DTOs.
+
+        Raises:
+            ValueError: If the filters are inconsistent.
+        """
+        return self.execute_offset_page(
+            skip=skip, limit=limit, filters=filters
+        ).items
+
+    def execute_offset_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[UserFilterDto] = None,
+        count: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPageDto:
+        """
+        Execute the list users use case with offset pagination.
+
+        Like ``execute``, but the page also carries the total count when
+        ``count`` is one of ``COUNT_MODES``; it has no next cursor. With
+        ``fields`` the items are dicts of only those fields.
+
+        Raises:
+            ValueError: If the filters are inconsistent, the count mode
+                is unknown or a field does not exist.
+        """
+        fields = normalize_fields(fields)
+        rows, total_count, total_count_mode = self._load(
+            {"skip": skip}, limit, filters, count, fields
+        )
+        return UserPageDto(
+            items=self.to_items(rows, fields),
+            total_count=total_count,
+            total_count_mode=total_count_mode,
+        )
+
+    def execute_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[UserFilterDto] = None,
+        count: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPageDto:
+        """
+        Execute the list users use case with keyset pagination.
+
+        Args:
+            cursor: Opaque cursor returned as ``next_cursor`` by the previous
+                page, or None to start from the beginning.
+            limit: Maximum number of users in the page.
+            filters: Filters to apply; the cursor only records the last id,
+                so every page of a listing must use the same filters.
+            count: One of ``COUNT_MODES`` to also count the users matching
+                ``filters``, or None not to count them.
+            fields: Names of ``USER_FIELDS`` to only read and return
+                those, as dicts, or None for whole users.
+
+        Returns:
+            The page of users, the cursor of the next page, which is None
+            once the last page has been reached, and the total count if
+            asked for.
+
+        Raises:
+            ValueError: If the cursor is malformed, the filters are
+                inconsistent, the count mode is unknown or a field does not
+                exist.
+        """
+        after_id = self.decode_cursor(cursor) if cursor else None
+        fields = normalize_fields(fields)
+        rows, total_count, total_count_mode = self._load(
+            {"after_id": after_id}, limit, filters, count, fields
+        )
+
+        next_cursor = None
+        if rows and len(rows) >= limit:
+            next_cursor = self.encode_cursor(self.row_id(rows[-1]))
+
+        return UserPageDto(
+            items=self.to_items(rows, fields),
+            next_cursor=next_cursor,
+            total_count=total_count,
+            total_count_mode=total_count_mode,
+        )
+
+    def _load(
+        self,
+        position: Dict[str, Any],
+        limit: int,
+        filters: Optional[UserFilterDto],
+        count: Optional[str],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Tuple[List[UserRow], Optional[int], Optional[str]]:
+        """
+        Load a page of users and, if asked for, their total count.
+
+        ``position`` holds the ``skip`` or ``after_id`` of the page. An
+        exact count comes with the page from a single query; an estimate
+        never scans the table. Listing is read-only, so users are mapped
+        straight to response DTOs, without validating them again as
+        entities. With ``fields`` the rows are dicts of those fields and of
+        ``id``, needed for the next cursor.
+        """
+        filters = self.normalize_filters(filters)
+        self.check_count_mode(count)
+        estimate = None
+        if count in (COUNT_ESTIMATE, COUNT_AUTO):
+            estimate = self._user_repository.estimate_count(filters)
+        exact = self.use_exact_count(
+            count, estimate, self._exact_count_max_rows
+        )
+        rows, total_count = self._user_repository.get_all_page(
+            limit=limit,
+            filters=filters,
+            fields=None if fields is None else self.with_id(fields),
+            with_count=exact,
+            **position,
+        )
+        if exact:
+            return rows, total_count, COUNT_EXACT
+        if estimate is None:
+            return rows, None, None
+        return rows, estimate, COUNT_ESTIMATE
+
+    @staticmethod
+    def check_count_mode(count: Optional[str]) -> None:
+        """
+        Check a count mode is None or one of ``COUNT_MODES``.
+
+        Raises:
+            ValueError: If the count mode is unknown.
+        """
+        if count is not None and count not in COUNT_MODES:
+            raise ValueError(f"Invalid count mode: {count}")
+
+    @staticmethod
+    def use_exact_count(
+        count: Optional[str], estimate: Optional[int], max_rows: int
+    ) -> bool:
+        """Tell whether a count mode, given the estimate, counts exactly."""
+        if count == COUNT_EXACT:
+            return True
+        return (
+            count == COUNT_AUTO
+            and estimate is not None
+            and estimate <= max_rows
+        )
+
+    @staticmethod
+    def normalize_filters(
+        filters: Optional[UserFilterDto],
+    ) -> Optional[UserFilterDto]:
+        """
+        Check filters and express their datetimes in UTC.
+
+        Naive datetimes are taken as UTC, like the stored timestamps.
+
+        Raises:
+            ValueError: If ``created_after`` is not before
+                ``created_before``.
+        """
+        if filters is None:
+            return None
+        normalized = replace(
+            filters,
+            created_after=_to_utc(filters.created_after),
+            created_before=_to_utc(filters.created_before),
+            updated_since=_to_utc(filters.updated_since),
+        )
+        if (
+            normalized.created_after is not None
+            and normalized.created_before is not None
+            and normalized.created_after >= normalized.created_before
+        ):
+            raise ValueError(
+                "created_after must be earlier than created_before"
             )
-            for user in users
-        ]
+        return normalized
+
+    @staticmethod
+    def with_id(fields: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Add ``id`` to normalized fields that lack it."""
+        return fields if "id" in fields else ("id",) + fields
+
+    @staticmethod
+    def row_id(row: UserRow) -> int:
+        """Get the user id of a loaded row, a DTO or a dict of fields."""
+        if isinstance(row, dict):
+            return row["id"]
+        return row.id
+
+    @staticmethod
+    def to_items(
+        rows: List[UserRow], fields: Optional[Tuple[str, ...]]
+    ) -> List[UserRow]:
+        """Map loaded rows to page items, dropping fields not asked for."""
+        if fields is None or "id" in fields:
+            return list(rows)
+        # Rows loaded with a fieldset are dicts
+        dicts = cast(List[Dict[str, Any]], rows)
+        return [{field: row[field] for field in fields} for row in dicts]
+
+    @staticmethod
+    def encode_cursor(last_id: int) -> str:
+        """Encode the last seen user id as an opaque cursor."""
+        raw = f"{CURSOR_PREFIX}{last_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> int:
+        """Decode an opaque cursor into the last seen user id."""
+        padded = cursor + "=" * (-len(cursor) % 4)
+        try:
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+        if not raw.startswith(CURSOR_PREFIX):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        last_id = raw[len(CURSOR_PREFIX):]
+        if not last_id.isdigit():
+            raise ValueError(f"Invalid cursor: {cursor}")
+        return int(last_id)
+
+
+def _to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert a datetime to UTC, taking naive ones as UTC already."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
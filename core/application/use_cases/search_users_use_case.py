@@ -0,0 +1,64 @@
+"""Search users use case."""
+
+from typing import List
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+
+# Shorter queries have no full trigram, so no index could answer them
+SEARCH_MIN_LENGTH = 3
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+
+
+class SearchUsersUseCase:
+    """Use case for searching users by partial name or email."""
+
+    def __init__(self, user_repository: UserRepositoryPort) -> None:
+        """Initialize use case with repository port."""
+        self._user_repository = user_repository
+
+    def execute(
+        self, query: str, limit: int = SEARCH_DEFAULT_LIMIT
+    ) -> List[UserResponseDto]:
+        """
+        Execute the search users use case.
+
+        Raises:
+            ValueError: If the query is too short once trimmed.
+        """
+        users = self._user_repository.search(
+            self.normalize_query(query), limit=limit
+        )
+        return [self._to_response_dto(user) for user in users]
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Trim a search query and check it is long enough.
+
+        Raises:
+            ValueError: If the query is too short once trimmed.
+        """
+        normalized = " ".join(query.split())
+        if len(normalized) < SEARCH_MIN_LENGTH:
+            raise ValueError(
+                "Search query must be at least "
+                f"{SEARCH_MIN_LENGTH} characters"
+            )
+        return normalized
+
+    @staticmethod
+    def _to_response_dto(user: User) -> UserResponseDto:
+        """Map a domain entity to a response DTO."""
+        return UserResponseDto(
+            id=user.id or 0,
+            name=user.name,
+            email=str(user.email),
+            active=user.active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
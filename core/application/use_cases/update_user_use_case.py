@@ -1,6 +1,7 @@
 """Update user use case."""
 
-from typing import Optional
+from datetime import UTC, datetime
+from typing import Any, Dict, Optional, Tuple
 
 from core.application.dto.user_dto import (
     UpdateUserDto,
@@ -9,6 +10,7 @@ from core.application.dto.user_dto import (
 from core.application.ports.user_repository_port import (
     UserRepositoryPort,
 )
+from core.domain.entities.user import User
 from core.domain.value_objects.email_address import EmailAddress
 
 
@@ -22,39 +24,93 @@ class UpdateUserUseCase:
     def execute(
         self, user_id: int, dto: UpdateUserDto
     ) -> Optional[UserResponseDto]:
-        """Execute the update user use case."""
-        user = self._user_repository.get_by_id(user_id)
-        if not user:
-            return None
+        """
+        Execute the update user use case.
+
+        The patch is validated up front and applied with a single
+        conditional update; the user is only read back when that update
+        did not apply, to tell "not found" from "nothing to change" and to
+        report activation rule violations.
+
+        Raises:
+            ValueError: If the patch breaks a domain rule.
+            DuplicateEmailError: If the new email belongs to another user.
+        """
+        changes, expected = self.build_changes(dto)
+
+        updated_user = None
+        if changes:
+            changes["updated_at"] = datetime.now(UTC)
+            updated_user = self._user_repository.update_fields(
+                user_id, changes, expected
+            )
+
+        if updated_user is None:
+            current_user = self._user_repository.get_by_id(user_id)
+            if not current_user:
+                return None
+            self.check_unchanged(current_user, dto)
+            updated_user = current_user
+
+        return self.to_response_dto(updated_user)
+
+    @staticmethod
+    def build_changes(
+        dto: UpdateUserDto,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Validate a patch and turn it into repository changes.
+
+        Returns:
+            The new values by field and the values the user must currently
+            have for the update to be allowed.
+
+        Raises:
+            ValueError: If a new value breaks a domain rule.
+        """
+        changes: Dict[str, Any] = {}
+        expected: Dict[str, Any] = {}
 
-        # Update fields if provided
         if dto.name is not None:
-            user.update_name(dto.name)
+            User.validate_name(dto.name)
+            changes["name"] = dto.name.strip()
 
         if dto.email is not None:
-            # Check if new email already exists
-            existing_user = self._user_repository.get_by_email(dto.email)
-            if existing_user and existing_user.id != user_id:
-                raise ValueError(
-                    f"User with email {dto.email} already exists"
-                )
-            user.email = EmailAddress(dto.email)
+            changes["email"] = str(EmailAddress(dto.email))
 
         if dto.active is not None:
-            if dto.active:
-                user.activate()
-            else:
-                user.deactivate()
+            # A user can only be activated when inactive and deactivated
+            # when active (see UserDomainService)
+            changes["active"] = dto.active
+            expected["active"] = not dto.active
+
+        return changes, expected
+
+    @staticmethod
+    def check_unchanged(user: User, dto: UpdateUserDto) -> None:
+        """
+        Explain why a patch was not applied to an existing user.
 
-        # Save via repository
-        updated_user = self._user_repository.update(user)
+        Raises:
+            ValueError: If the patch asked for an activation state change
+                the domain does not allow.
+        """
+        if dto.active is None or user.active != dto.active:
+            return
+        # Raises the domain error for a user already in that state
+        if dto.active:
+            user.activate()
+        else:
+            user.deactivate()
 
-        # Map to response DTO
+    @staticmethod
+    def to_response_dto(user: User) -> UserResponseDto:
+        """Map a domain entity to a response DTO."""
         return UserResponseDto(
-            id=updated_user.id or 0,
-            name=updated_user.name,
-            email=str(updated_user.email),
-            active=updated_user.active,
-            created_at=updated_user.created_at,
-            updated_at=updated_user.updated_at,
+            id=user.id or 0,
+            name=user.name,
+            email=str(user.email),
+            active=user.active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
         )
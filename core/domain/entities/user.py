@@ -2,14 +2,19 @@
 
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from core.domain.value_objects.email_address import EmailAddress
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
-    """User domain entity."""
+    """
+    User domain entity.
+
+    Slotted (no per-instance ``__dict__``), as large batches of users are
+    held in memory by imports, exports and the user cache.
+    """
 
     id: Optional[int]
     name: str
@@ -20,11 +25,50 @@ class User:
 
     def __post_init__(self) -> None:
         """Validate entity invariants."""
-        if not self.name or not self.name.strip():
+        self.validate_name(self.name)
+
+    @staticmethod
+    def validate_name(name: str) -> None:
+        """Validate a user name, raising ValueError if it is invalid."""
+        if not name or not name.strip():
             raise ValueError("Name cannot be empty")
-        if len(self.name) > 255:
+        if len(name) > 255:
             raise ValueError("Name cannot exceed 255 characters")
 
+    @classmethod
+    def validate_many(
+        cls,
+        rows: Iterable[Tuple[str, str, bool]],
+        now: Optional[datetime] = None,
+        memoize: bool = False,
+    ) -> Tuple[List[Tuple[int, "User"]], Dict[int, str]]:
+        """
+        Validate rows of ``(name, email, active)`` into new users.
+
+        Every row is validated, so an invalid row does not stop the rest;
+        its error is the one building that user alone would raise. New
+        users are stamped with ``now`` (the current time by default). With
+        ``memoize``, repeated emails are validated once
+        (``EmailAddress.memoized_parser``).
+
+        Returns:
+            The valid ``(index, user)`` pairs and the errors by row index.
+        """
+        now = now or datetime.now(UTC)
+        parse_email = (
+            EmailAddress.memoized_parser() if memoize else EmailAddress
+        )
+        users: List[Tuple[int, User]] = []
+        errors: Dict[int, str] = {}
+        for index, (name, email, active) in enumerate(rows):
+            try:
+                user = cls(None, name, parse_email(email), active, now, now)
+            except ValueError as e:
+                errors[index] = str(e)
+                continue
+            users.append((index, user))
+        return users, errors
+
     def activate(self) -> None:
         """Activate the user."""
         from core.domain.services.user_domain_service import (
@@ -49,9 +93,6 @@ class User:
 
     def update_name(self, new_name: str) -> None:
         """Update user name."""
-        if not new_name or not new_name.strip():
-            raise ValueError("Name cannot be empty")
-        if len(new_name) > 255:
-            raise ValueError("Name cannot exceed 255 characters")
+        self.validate_name(new_name)
         self.name = new_name.strip()
         self.updated_at = datetime.now(UTC)
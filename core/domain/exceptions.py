@@ -0,0 +1,10 @@
+"""Domain exceptions."""
+
+
+class DuplicateEmailError(ValueError):
+    """Raised when an email is already used by another user."""
+
+    def __init__(self, email: str) -> None:
+        """Initialize error for the duplicated email."""
+        super().__init__(f"User with email {email} already exists")
+        self.email = email
@@ -2,9 +2,12 @@
 
 from dataclasses import dataclass
 import re
+from typing import Callable, Dict, Iterable, List, Tuple, Union
 
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EmailAddress:
     """Value object representing an email address."""
 
@@ -19,9 +22,58 @@ class EmailAddress:
 
     @staticmethod
     def _is_valid_email(email: str) -> bool:
-        """Validate email format using regex."""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, email))
+        """Validate email format using the precompiled pattern."""
+        return EMAIL_PATTERN.match(email) is not None
+
+    @classmethod
+    def parse_many(
+        cls, values: Iterable[str], memoize: bool = False
+    ) -> Tuple[List[Tuple[int, "EmailAddress"]], Dict[int, str]]:
+        """
+        Validate many email addresses, collecting errors instead of raising.
+
+        With ``memoize``, a value seen before is not validated again (see
+        ``memoized_parser``).
+
+        Returns:
+            The valid ``(index, email)`` pairs and the errors by index.
+        """
+        parse: Callable[[str], EmailAddress] = cls
+        if memoize:
+            parse = cls.memoized_parser()
+        emails: List[Tuple[int, EmailAddress]] = []
+        errors: Dict[int, str] = {}
+        for index, value in enumerate(values):
+            try:
+                emails.append((index, parse(value)))
+            except ValueError as e:
+                errors[index] = str(e)
+        return emails, errors
+
+    @classmethod
+    def memoized_parser(cls) -> Callable[[str], "EmailAddress"]:
+        """
+        Get a parser remembering the outcome of every value it parsed.
+
+        Repeated values return the same (immutable) instance, or raise the
+        same error, without running the pattern again. The memo lives as
+        long as the parser, so use one per batch.
+        """
+        outcomes: Dict[str, Union[EmailAddress, str]] = {}
+
+        def parse(value: str) -> EmailAddress:
+            outcome = outcomes.get(value)
+            if outcome is None:
+                try:
+                    outcome = cls(value)
+                except ValueError as e:
+                    outcome = str(e)
+                outcomes[value] = outcome
+            if isinstance(outcome, str):
+                raise ValueError(outcome)
+            return outcome
+
+        return parse
 
     def __str__(self) -> str:
         """Return email as string."""
@@ -0,0 +1,58 @@
+"""Script to import users from an NDJSON or CSV file."""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from typing import List, Optional
+
+from core.application.use_cases.import_users_use_case import (
+    ImportUsersUseCase,
+)
+from infrastructure.adapters.files.user_file_reader import (
+    CSV,
+    FILE_FORMATS,
+    NDJSON,
+    read_user_rows,
+)
+from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
+    UserRepositoryPostgresAdapter,
+)
+from infrastructure.database.session import get_session_factory
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Import a users file and print the result as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="NDJSON or CSV file to import")
+    parser.add_argument(
+        "--format",
+        choices=FILE_FORMATS,
+        help="file format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--upsert",
+        action="store_true",
+        help="update users whose email already exists instead of skipping",
+    )
+    args = parser.parse_args(argv)
+
+    file_format = args.format or (
+        CSV if os.path.splitext(args.path)[1].lower() == ".csv" else NDJSON
+    )
+    with open(args.path, "rb") as stream, get_session_factory()() as db:
+        use_case = ImportUsersUseCase(UserRepositoryPostgresAdapter(db))
+        try:
+            result = use_case.execute(
+                read_user_rows(stream, file_format), upsert=args.upsert
+            )
+        except ValueError as e:
+            parser.exit(1, f"error: {e}\n")
+
+    print(json.dumps(asdict(result), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
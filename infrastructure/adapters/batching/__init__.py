@@ -0,0 +1 @@
+"""Batching adapters."""
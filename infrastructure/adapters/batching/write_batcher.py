@@ -0,0 +1,212 @@
+"""Micro-batching of concurrent writes (group commit)."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from infrastructure.errors import error_copy
+from infrastructure.prometheus import render_counters
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Outcome of one item of a batch: its result, or the error to raise for it
+Outcome = Union[R, Exception]
+
+
+@dataclass
+class WriteBatcherStats:
+    """Counters of write batcher activity."""
+
+    # Batches flushed, and items written through them
+    batches: int = 0
+    items: int = 0
+
+
+class _Batch:
+    """Items gathered for one flush and, once flushed, their outcomes."""
+
+    def __init__(self) -> None:
+        """Initialize an open, empty batch."""
+        self.items: List[Any] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.outcomes: List[Any] = []
+
+
+def _result(outcome: Any) -> Any:
+    """Return an item's result, or raise its error."""
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+class WriteBatcher(Generic[T, R]):
+    """
+    Thread-safe group gathering concurrent writes into batches.
+
+    The first caller to submit an item opens a batch, waits up to
+    ``max_wait_seconds`` (less once ``max_size`` items joined) and flushes
+    every item with its own ``flush`` function, which returns one outcome
+    per item. Callers that joined wait for the flush and get the outcome of
+    their item: its result, or its error raised. If ``flush`` raises, every
+    item of the batch gets its own copy of that error.
+    """
+
+    def __init__(self, max_size: int, max_wait_seconds: float) -> None:
+        """Initialize a batcher with no open batch."""
+        self._max_size = max_size
+        self._max_wait_seconds = max_wait_seconds
+        self._pending: Optional[_Batch] = None
+        self._lock = threading.Lock()
+        self.stats = WriteBatcherStats()
+
+    def submit(
+        self, item: T, flush: Callable[[List[T]], Sequence[Outcome]]
+    ) -> R:
+        """Write ``item`` in the open batch, or in a new one flushed here."""
+        with self._lock:
+            batch = self._pending
+            leader = batch is None
+            if batch is None:
+                batch = self._pending = _Batch()
+            index = len(batch.items)
+            batch.items.append(item)
+            if len(batch.items) >= self._max_size:
+                self._pending = None
+                batch.full.set()
+
+        if not leader:
+            batch.done.wait()
+            return _result(batch.outcomes[index])
+
+        batch.full.wait(self._max_wait_seconds)
+        with self._lock:
+            if self._pending is batch:
+                self._pending = None
+            self.stats.batches += 1
+            self.stats.items += len(batch.items)
+        try:
+            batch.outcomes = list(flush(batch.items))
+        except Exception as e:
+            batch.outcomes = [error_copy(e) for _ in batch.items]
+        finally:
+            batch.done.set()
+        return _result(batch.outcomes[index])
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return counters."""
+        with self._lock:
+            return {"batches": self.stats.batches, "items": self.stats.items}
+
+
+class _AsyncBatch:
+    """Items gathered for one flush, and the task flushing them."""
+
+    def __init__(
+        self, flush: Callable[["_AsyncBatch"], Awaitable[List[Any]]]
+    ) -> None:
+        """Initialize an open, empty batch flushed by ``flush``."""
+        self.items: List[Any] = []
+        self.full = asyncio.Event()
+        self.flushed = asyncio.ensure_future(flush(self))
+
+
+class AsyncWriteBatcher(Generic[T, R]):
+    """
+    Group gathering concurrent writes of the event loop into batches.
+
+    Like ``WriteBatcher``; the batch is flushed by a task, with the
+    ``flush`` coroutine function of the first caller, that every caller
+    awaits. A caller that is cancelled stops waiting without cancelling the
+    flush for the others, so ``flush`` must not use resources of the first
+    caller's request (e.g. its database session).
+    """
+
+    def __init__(self, max_size: int, max_wait_seconds: float) -> None:
+        """Initialize a batcher with no open batch."""
+        self._max_size = max_size
+        self._max_wait_seconds = max_wait_seconds
+        self._pending: Optional[_AsyncBatch] = None
+        self.stats = WriteBatcherStats()
+
+    async def submit(
+        self,
+        item: T,
+        flush: Callable[[List[T]], Awaitable[Sequence[Outcome]]],
+    ) -> R:
+        """Write ``item`` in the open batch, or in a new one."""
+        batch = self._pending
+        if batch is None:
+            batch = self._pending = _AsyncBatch(
+                partial(self._flush, flush=flush)
+            )
+        index = len(batch.items)
+        batch.items.append(item)
+        if len(batch.items) >= self._max_size:
+            self._pending = None
+            batch.full.set()
+        outcomes = await asyncio.shield(batch.flushed)
+        return _result(outcomes[index])
+
+    async def _flush(
+        self,
+        batch: _AsyncBatch,
+        flush: Callable[[List[T]], Awaitable[Sequence[Outcome]]],
+    ) -> List[Any]:
+        """Wait for the batch to fill or time out, then flush it."""
+        try:
+            await asyncio.wait_for(
+                batch.full.wait(), timeout=self._max_wait_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
+        if self._pending is batch:
+            self._pending = None
+        self.stats.batches += 1
+        self.stats.items += len(batch.items)
+        try:
+            return list(await flush(batch.items))
+        except Exception as e:
+            return [error_copy(e) for _ in batch.items]
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return counters."""
+        return {"batches": self.stats.batches, "items": self.stats.items}
+
+
+METRICS = {
+    "write_batcher_batches_total": (
+        "batches",
+        "Batches of concurrent writes flushed in one transaction.",
+    ),
+    "write_batcher_items_total": (
+        "items",
+        "Writes flushed through a write batcher.",
+    ),
+}
+
+
+def render_metrics(
+    groups: Mapping[str, Union[WriteBatcher, AsyncWriteBatcher]],
+) -> str:
+    """Render the counters of named batchers in Prometheus text format."""
+    return render_counters(
+        METRICS,
+        "group",
+        {name: group.snapshot() for name, group in groups.items()},
+    )
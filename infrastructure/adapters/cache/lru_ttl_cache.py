@@ -0,0 +1,129 @@
+"""Bounded in-process LRU cache with per-entry TTL."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from infrastructure.prometheus import render_counters
+
+MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters of cache activity."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class LruTtlCache:
+    """
+    Thread-safe LRU cache whose entries also expire after a TTL.
+
+    Values may be None (e.g. to remember that a lookup found nothing); a
+    lookup that finds no live entry returns ``MISSING``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize cache with its capacity, default TTL and clock."""
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def get(self, key: Hashable) -> Any:
+        """Get a live value, or ``MISSING``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Store a value, evicting the least recently used when full."""
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, *keys: Hashable) -> None:
+        """Drop entries if present."""
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored (possibly expired) entries."""
+        return len(self._entries)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return current size and counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "evictions": self.stats.evictions,
+                "expirations": self.stats.expirations,
+                "invalidations": self.stats.invalidations,
+            }
+
+
+METRICS = {
+    "cache_hits_total": ("hits", "Lookups served from the cache."),
+    "cache_misses_total": (
+        "misses",
+        "Lookups that found no live entry, expired ones included.",
+    ),
+    "cache_evictions_total": (
+        "evictions",
+        "Entries dropped to make room for newer ones.",
+    ),
+}
+
+
+def render_metrics(caches: Mapping[str, LruTtlCache]) -> str:
+    """Render the counters of named caches in Prometheus text format."""
+    return render_counters(
+        METRICS,
+        "cache",
+        {name: cache.snapshot() for name, cache in caches.items()},
+    )
@@ -0,0 +1,184 @@
+"""Coalescing of concurrent identical calls (single-flight)."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from infrastructure.errors import error_copy
+from infrastructure.prometheus import render_counters
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters of single-flight activity."""
+
+    # Calls made through the group, and those among them that shared the
+    # result of an identical call already in flight instead of running
+    calls: int = 0
+    collapsed: int = 0
+
+
+class _Flight:
+    """A call in flight and, once done, its outcome."""
+
+    def __init__(self) -> None:
+        """Initialize a flight that has not finished."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncFlight:
+    """A coroutine in flight and, once done, its outcome."""
+
+    def __init__(self) -> None:
+        """Initialize a flight that has not finished."""
+        self.done = asyncio.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # Set when the caller running it was cancelled before it finished
+        self.abandoned = False
+
+
+class SingleFlight:
+    """
+    Thread-safe group running concurrent calls with the same key once.
+
+    The first caller of a key runs the function; callers arriving while it
+    runs wait for it and get the same result, or a copy of its exception.
+    Once the call returns the key is forgotten, so nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats = SingleFlightStats()
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """Run ``function``, or wait for the call of ``key`` in flight."""
+        with self._lock:
+            self.stats.calls += 1
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                leader = True
+            else:
+                self.stats.collapsed += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise error_copy(flight.error)
+            return flight.result
+
+        try:
+            flight.result = function()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return calls in flight and counters."""
+        with self._lock:
+            return {
+                "in_flight": len(self._flights),
+                "calls": self.stats.calls,
+                "collapsed": self.stats.collapsed,
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Group running concurrent coroutines with the same key once.
+
+    Like ``SingleFlight`` for the event loop. The first caller's coroutine
+    runs in that caller's task, on its resources (e.g. its database
+    session), so the call never outlives them: if that caller is cancelled,
+    its waiters do not share the cancellation, and one of them runs its own
+    coroutine instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self._flights: Dict[Hashable, _AsyncFlight] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(
+        self, key: Hashable, function: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Await ``function()``, or the call of ``key`` in flight."""
+        self.stats.calls += 1
+        while key in self._flights:
+            flight = self._flights[key]
+            await flight.done.wait()
+            if flight.abandoned:
+                continue
+            self.stats.collapsed += 1
+            if flight.error is not None:
+                raise error_copy(flight.error)
+            return flight.result
+
+        flight = self._flights[key] = _AsyncFlight()
+        try:
+            flight.result = await function()
+        except asyncio.CancelledError:
+            flight.abandoned = True
+            raise
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return calls in flight and counters."""
+        return {
+            "in_flight": len(self._flights),
+            "calls": self.stats.calls,
+            "collapsed": self.stats.collapsed,
+        }
+
+
+METRICS = {
+    "single_flight_calls_total": (
+        "calls",
+        "Calls made through a single-flight group.",
+    ),
+    "single_flight_collapsed_total": (
+        "collapsed",
+        "Calls that shared the result of an identical call in flight.",
+    ),
+}
+
+
+def render_metrics(
+    groups: Mapping[str, Union[SingleFlight, AsyncSingleFlight]],
+) -> str:
+    """Render the counters of named groups in Prometheus text format."""
+    return render_counters(
+        METRICS,
+        "group",
+        {name: group.snapshot() for name, group in groups.items()},
+    )
@@ -0,0 +1 @@
+"""File adapters."""
@@ -0,0 +1,94 @@
+"""Incremental reader for users import files."""
+
+import csv
+import io
+import json
+from typing import IO, Any, Iterable, Iterator, Mapping
+
+from core.application.dto.user_dto import CreateUserDto, ImportUserRowDto
+
+NDJSON = "ndjson"
+CSV = "csv"
+FILE_FORMATS = (NDJSON, CSV)
+
+CSV_REQUIRED_COLUMNS = ("name", "email")
+CSV_TRUE_VALUES = frozenset({"", "true", "t", "1", "yes", "y"})
+CSV_FALSE_VALUES = frozenset({"false", "f", "0", "no", "n"})
+
+
+def read_user_rows(
+    stream: IO[bytes], file_format: str
+) -> Iterator[ImportUserRowDto]:
+    """
+    Parse a UTF-8 NDJSON or CSV users file one row at a time.
+
+    Only a read buffer of ``stream`` is held in memory. Rows that cannot be
+    parsed are yielded with an error instead of stopping the import.
+
+    Raises:
+        ValueError: If the format is unknown, the CSV header lacks a
+            required column or the file is not valid UTF-8.
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    if file_format == CSV:
+        return _read_csv_rows(text)
+    return _read_ndjson_rows(text)
+
+
+def _read_ndjson_rows(lines: Iterable[str]) -> Iterator[ImportUserRowDto]:
+    """Parse one JSON object per line, skipping blank lines."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield ImportUserRowDto(line=line_number, error="Invalid JSON")
+            continue
+        if not isinstance(record, dict):
+            yield ImportUserRowDto(
+                line=line_number, error="Expected a JSON object"
+            )
+            continue
+        yield _to_row(line_number, record, record.get("active", True))
+
+
+def _read_csv_rows(lines: Iterable[str]) -> Iterator[ImportUserRowDto]:
+    """Parse CSV records with a ``name,email[,active]`` header."""
+    reader = csv.DictReader(lines)
+    columns = reader.fieldnames or []
+    missing = [name for name in CSV_REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(
+            f"CSV header is missing columns: {', '.join(missing)}"
+        )
+
+    for record in reader:
+        active: Any = (record.get("active") or "").strip().lower()
+        if active in CSV_TRUE_VALUES:
+            active = True
+        elif active in CSV_FALSE_VALUES:
+            active = False
+        yield _to_row(reader.line_num, record, active)
+
+
+def _to_row(line: int, record: Mapping, active: Any) -> ImportUserRowDto:
+    """Type-check a parsed record; domain rules are applied later."""
+    for field_name in CSV_REQUIRED_COLUMNS:
+        if not isinstance(record.get(field_name), str):
+            return ImportUserRowDto(
+                line=line, error=f"Field {field_name} must be a string"
+            )
+    if not isinstance(active, bool):
+        return ImportUserRowDto(
+            line=line, error="Field active must be a boolean"
+        )
+    return ImportUserRowDto(
+        line=line,
+        user=CreateUserDto(
+            name=record["name"], email=record["email"], active=active
+        ),
+    )
@@ -0,0 +1,57 @@
+"""Write batching decorator for async User repository."""
+
+from typing import AsyncContextManager, Callable, List, Union
+
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
+from infrastructure.adapters.batching.write_batcher import AsyncWriteBatcher
+from infrastructure.adapters.repositories.async_user_repository_decorator import (  # noqa: E501
+    AsyncUserRepositoryDecorator,
+)
+from infrastructure.adapters.repositories.batching_user_repository_adapter import (  # noqa: E501
+    to_create_outcomes,
+)
+from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
+    unique_by_email,
+)
+
+
+class AsyncBatchingUserRepositoryAdapter(AsyncUserRepositoryDecorator):
+    """
+    AsyncUserRepositoryPort decorator batching concurrent creates.
+
+    See ``BatchingUserRepositoryAdapter``; creates are batched between the
+    coroutines of the event loop. A batch outlives the request that opened
+    it when that request is cancelled, so it is written by a repository
+    that ``open_repository`` opens on a session of its own.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncUserRepositoryPort,
+        batcher: AsyncWriteBatcher,
+        open_repository: Callable[
+            [], AsyncContextManager[AsyncUserRepositoryPort]
+        ],
+    ) -> None:
+        """Initialize decorator with the wrapped repository and batcher."""
+        super().__init__(repository)
+        self._batcher = batcher
+        self._open_repository = open_repository
+
+    async def create(self, user: User) -> User:
+        """Create a new user in the open batch of creates."""
+        return await self._batcher.submit(user, self._create_batch)
+
+    async def _create_batch(
+        self, users: List[User]
+    ) -> List[Union[User, DuplicateEmailError]]:
+        """Create a batch of users in one transaction."""
+        async with self._open_repository() as repository:
+            created_users = await repository.create_many(
+                unique_by_email(users)
+            )
+        return to_create_outcomes(users, created_users)
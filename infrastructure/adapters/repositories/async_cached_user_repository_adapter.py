@@ -0,0 +1,181 @@
+"""Read-through caching decorator for async User repository."""
+
+from typing import (
+    Any,
+    AsyncIterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.domain.entities.user import User
+from infrastructure.adapters.cache.lru_ttl_cache import MISSING, LruTtlCache
+from infrastructure.adapters.repositories.async_user_repository_decorator import (  # noqa: E501
+    AsyncUserRepositoryDecorator,
+)
+from infrastructure.adapters.repositories.cached_user_repository_adapter import (  # noqa: E501
+    cached_user,
+    email_key,
+    id_key,
+    store_user,
+    user_to_response_dto,
+)
+
+
+class AsyncCachedUserRepositoryAdapter(AsyncUserRepositoryDecorator):
+    """
+    AsyncUserRepositoryPort decorator caching lookups by id and by email.
+
+    See ``CachedUserRepositoryAdapter``; the cache is only touched between
+    awaits, so it never blocks the event loop for long.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncUserRepositoryPort,
+        cache: LruTtlCache,
+        negative_ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize decorator with the wrapped repository and cache."""
+        super().__init__(repository)
+        self._cache = cache
+        self._negative_ttl_seconds = negative_ttl_seconds
+
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        created_user = await self._repository.create(user)
+        store_user(self._cache, created_user)
+        return created_user
+
+    async def create_many(self, users: Sequence[User]) -> List[Optional[User]]:
+        """Create many users in a single transaction."""
+        created_users = await self._repository.create_many(users)
+        for created_user in created_users:
+            if created_user is not None:
+                store_user(self._cache, created_user)
+        return created_users
+
+    async def upsert_by_email(self, user: User) -> Tuple[User, bool]:
+        """Create or update a user by email."""
+        upserted_user, created = await self._repository.upsert_by_email(user)
+        store_user(self._cache, upserted_user)
+        return upserted_user, created
+
+    async def import_users(
+        self, chunks: AsyncIterable[Sequence[User]], upsert: bool = False
+    ) -> Tuple[int, int]:
+        """Import users; any cached entry may be stale afterwards."""
+        try:
+            return await self._repository.import_users(chunks, upsert=upsert)
+        finally:
+            self._cache.clear()
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by id, from cache when possible."""
+        cached = cached_user(self._cache, id_key(user_id))
+        if cached is not MISSING:
+            return cached
+
+        user = await self._repository.get_by_id(user_id)
+        if user is None:
+            self._cache.set(id_key(user_id), None, self._negative_ttl_seconds)
+            return None
+        store_user(self._cache, user)
+        return user
+
+    async def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """Get user by id as a response DTO, through ``get_by_id``."""
+        user = await self.get_by_id(user_id)
+        if user is None:
+            return None
+        return user_to_response_dto(user)
+
+    async def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """Get users by id, querying only those that are not cached."""
+        users: List[User] = []
+        missing_ids = []
+        for user_id in user_ids:
+            cached = cached_user(self._cache, id_key(user_id))
+            if cached is MISSING:
+                missing_ids.append(user_id)
+            elif cached is not None:
+                users.append(cached)
+        if not missing_ids:
+            return users
+
+        loaded = await self._repository.get_many(missing_ids)
+        for user in loaded:
+            store_user(self._cache, user)
+        loaded_ids = {user.id for user in loaded}
+        for user_id in missing_ids:
+            if user_id not in loaded_ids:
+                self._cache.set(
+                    id_key(user_id), None, self._negative_ttl_seconds
+                )
+        return users + loaded
+
+    async def get_many_responses(
+        self, user_ids: Sequence[int]
+    ) -> List[UserResponseDto]:
+        """Get users by id as response DTOs, through ``get_many``."""
+        users = await self.get_many(user_ids)
+        return [user_to_response_dto(user) for user in users]
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email, from cache when possible."""
+        cached = cached_user(self._cache, email_key(email))
+        if cached is not MISSING:
+            return cached
+
+        user = await self._repository.get_by_email(email)
+        if user is None:
+            self._cache.set(
+                email_key(email), None, self._negative_ttl_seconds
+            )
+            return None
+        store_user(self._cache, user)
+        return user
+
+    async def update(self, user: User) -> User:
+        """Update an existing user."""
+        if user.id is not None:
+            self._cache.delete(id_key(user.id))
+        updated_user = await self._repository.update(user)
+        store_user(self._cache, updated_user)
+        return updated_user
+
+    async def update_fields(
+        self,
+        user_id: int,
+        changes: Mapping[str, Any],
+        expected: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[User]:
+        """Apply a partial update to a user."""
+        self._cache.delete(id_key(user_id))
+        if "email" in changes:
+            self._cache.delete(email_key(changes["email"]))
+        updated_user = await self._repository.update_fields(
+            user_id, changes, expected
+        )
+        if updated_user is not None:
+            store_user(self._cache, updated_user)
+        else:
+            # A concurrent read may have cached the row during the write
+            self._cache.delete(id_key(user_id))
+        return updated_user
+
+    async def delete(self, user_id: int) -> bool:
+        """Delete a user by id."""
+        self._cache.delete(id_key(user_id))
+        deleted = await self._repository.delete(user_id)
+        # A concurrent read may have cached the row during the write
+        self._cache.delete(id_key(user_id))
+        return deleted
@@ -0,0 +1,77 @@
+"""Single-flight decorator for async User repository."""
+
+import copy
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.domain.entities.user import User
+from infrastructure.adapters.cache.single_flight import AsyncSingleFlight
+from infrastructure.adapters.repositories.async_user_repository_decorator import (  # noqa: E501
+    AsyncUserRepositoryDecorator,
+)
+
+T = TypeVar("T")
+
+
+class AsyncSingleFlightUserRepositoryAdapter(AsyncUserRepositoryDecorator):
+    """
+    AsyncUserRepositoryPort decorator coalescing concurrent lookups by key.
+
+    See ``SingleFlightUserRepositoryAdapter``; lookups in flight are shared
+    between the coroutines of the event loop.
+    """
+
+    def __init__(
+        self, repository: AsyncUserRepositoryPort, group: AsyncSingleFlight
+    ) -> None:
+        """Initialize decorator with the wrapped repository and group."""
+        super().__init__(repository)
+        self._group = group
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by id, sharing a lookup already in flight."""
+        return await self._coalesce(
+            ("id", user_id), lambda: self._repository.get_by_id(user_id)
+        )
+
+    async def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """Get user by id as a DTO, sharing a lookup already in flight."""
+        return await self._coalesce(
+            ("response", user_id),
+            lambda: self._repository.get_response_by_id(user_id),
+        )
+
+    async def get_fields_by_id(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get some fields of a user, sharing a lookup already in flight."""
+        return await self._coalesce(
+            ("fields", user_id, tuple(fields)),
+            lambda: self._repository.get_fields_by_id(user_id, fields),
+        )
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email, sharing a lookup already in flight."""
+        return await self._coalesce(
+            ("email", email), lambda: self._repository.get_by_email(email)
+        )
+
+    async def _coalesce(
+        self, key: Hashable, lookup: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run ``lookup`` through the group; return a copy of its result."""
+        return copy.copy(await self._group.do(key, lookup))
@@ -0,0 +1,156 @@
+"""Delegating base of async User repository decorators."""
+
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from core.application.dto.user_dto import (
+    UserFilterDto,
+    UserResponseDto,
+    UserRow,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.domain.entities.user import User
+
+
+class AsyncUserRepositoryDecorator(AsyncUserRepositoryPort):
+    """
+    AsyncUserRepositoryPort decorator passing every call through.
+
+    See ``UserRepositoryDecorator``.
+    """
+
+    def __init__(self, repository: AsyncUserRepositoryPort) -> None:
+        """Initialize decorator with the wrapped repository."""
+        self._repository = repository
+
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        return await self._repository.create(user)
+
+    async def create_many(self, users: Sequence[User]) -> List[Optional[User]]:
+        """Create many users in a single transaction."""
+        return await self._repository.create_many(users)
+
+    async def upsert_by_email(self, user: User) -> Tuple[User, bool]:
+        """Create or update a user by email."""
+        return await self._repository.upsert_by_email(user)
+
+    async def import_users(
+        self, chunks: AsyncIterable[Sequence[User]], upsert: bool = False
+    ) -> Tuple[int, int]:
+        """Import users."""
+        return await self._repository.import_users(chunks, upsert=upsert)
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by id."""
+        return await self._repository.get_by_id(user_id)
+
+    async def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """Get user by id as a response DTO."""
+        return await self._repository.get_response_by_id(user_id)
+
+    async def get_fields_by_id(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get some fields of a user by id."""
+        return await self._repository.get_fields_by_id(user_id, fields)
+
+    async def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """Get users by id in a single query."""
+        return await self._repository.get_many(user_ids)
+
+    async def get_many_responses(
+        self, user_ids: Sequence[int]
+    ) -> List[UserResponseDto]:
+        """Get users by id as response DTOs in a single query."""
+        return await self._repository.get_many_responses(user_ids)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        return await self._repository.get_by_email(email)
+
+    async def get_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """Get which of the given emails already belong to a user."""
+        return await self._repository.get_existing_emails(emails)
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+    ) -> List[User]:
+        """Get all users ordered by id with pagination."""
+        return await self._repository.get_all(
+            skip=skip, limit=limit, after_id=after_id, filters=filters
+        )
+
+    async def get_all_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_count: bool = False,
+    ) -> Tuple[List[UserRow], Optional[int]]:
+        """Get a page of users for read-only callers."""
+        return await self._repository.get_all_page(
+            skip=skip,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            with_count=with_count,
+        )
+
+    async def estimate_count(
+        self, filters: Optional[UserFilterDto] = None
+    ) -> int:
+        """Estimate how many users match ``filters``."""
+        return await self._repository.estimate_count(filters)
+
+    async def search(self, query: str, limit: int = 20) -> List[User]:
+        """Search users by partial name or email."""
+        return await self._repository.search(query, limit=limit)
+
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Iterate over all users ordered by id."""
+        return self._repository.iter_all(batch_size=batch_size)
+
+    def iter_all_fields(
+        self, fields: Sequence[str], batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over some fields of all users."""
+        return self._repository.iter_all_fields(fields, batch_size=batch_size)
+
+    async def update(self, user: User) -> User:
+        """Update an existing user."""
+        return await self._repository.update(user)
+
+    async def update_fields(
+        self,
+        user_id: int,
+        changes: Mapping[str, Any],
+        expected: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[User]:
+        """Apply a partial update to a user."""
+        return await self._repository.update_fields(user_id, changes, expected)
+
+    async def delete(self, user_id: int) -> bool:
+        """Delete a user by id."""
+        return await self._repository.delete(user_id)
@@ -0,0 +1,463 @@
+"""Async PostgreSQL adapter for User repository."""
+
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.application.dto.user_dto import (
+    UserFilterDto,
+    UserResponseDto,
+    UserRow,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
+from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
+    COPY_IMPORT_STAGING,
+    CREATE_IMPORT_STAGING_TABLE,
+    ESTIMATE_USERS_COUNT,
+    INSERT_BATCH_SIZE,
+    build_count_statement,
+    build_get_all_statement,
+    build_get_all_with_count_statement,
+    build_get_by_email_statement,
+    build_get_by_id_statement,
+    build_get_many_statement,
+    build_import_merge_statement,
+    build_iter_all_statement,
+    build_search_statement,
+    build_update_fields_statement,
+    build_upsert_by_email_statement,
+    email_in,
+    filter_conditions,
+    insert_ignoring_duplicate_emails,
+    insert_updating_duplicate_emails,
+    model_to_domain_entity,
+    rank_by_similarity,
+    row_to_domain_entity,
+    row_to_fields,
+    row_to_response_dto,
+    rows_to_page,
+    to_insert_row,
+    to_staging_row,
+    unique_by_email,
+)
+from infrastructure.database.models.user_model import UserModel
+
+
+class AsyncUserRepositoryPostgresAdapter(AsyncUserRepositoryPort):
+    """PostgreSQL implementation of AsyncUserRepositoryPort."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize adapter with async database session."""
+        self._db = db
+
+    async def create(self, user: User) -> User:
+        """
+        Create a new user.
+
+        Relies on the unique email index instead of a read-before-write:
+        one ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING`` both
+        creates the user and detects a taken email, race free.
+        """
+        statement = (
+            insert_ignoring_duplicate_emails(self._dialect_name)
+            .values(to_insert_row(user))
+            .returning(*UserModel.__table__.c)
+        )
+        result = await self._db.execute(statement)
+        row = result.first()
+        await self._db.commit()
+        if not row:
+            raise DuplicateEmailError(str(user.email))
+
+        return row_to_domain_entity(row)
+
+    async def upsert_by_email(self, user: User) -> Tuple[User, bool]:
+        """Create or update a user by email in one statement."""
+        result = await self._db.execute(
+            build_upsert_by_email_statement(self._dialect_name, user)
+        )
+        row = result.one()
+        await self._db.commit()
+        return (
+            row_to_domain_entity(row),
+            bool(row.inserted),
+        )
+
+    async def create_many(
+        self, users: Sequence[User]
+    ) -> List[Optional[User]]:
+        """Create many users with multi-row inserts in one transaction."""
+        statement = insert_ignoring_duplicate_emails(
+            self._dialect_name
+        ).returning(*UserModel.__table__.c)
+
+        created_by_email = {}
+        try:
+            for start in range(0, len(users), INSERT_BATCH_SIZE):
+                batch = users[start:start + INSERT_BATCH_SIZE]
+                rows = await self._db.execute(
+                    statement.values([to_insert_row(user) for user in batch])
+                )
+                for row in rows:
+                    created_by_email[row.email] = (
+                        row_to_domain_entity(
+                            row
+                        )
+                    )
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        return [created_by_email.get(str(user.email)) for user in users]
+
+    async def import_users(
+        self, chunks: AsyncIterable[Sequence[User]], upsert: bool = False
+    ) -> Tuple[int, int]:
+        """Load users in one transaction, consuming ``chunks`` lazily."""
+        try:
+            if self._dialect_name == "postgresql":
+                counts = await self._copy_import(chunks, upsert)
+            else:
+                counts = await self._insert_import(chunks, upsert)
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+        return counts
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by id."""
+        result = await self._db.execute(build_get_by_id_statement(user_id))
+        row = result.first()
+        if not row:
+            return None
+        return row_to_domain_entity(row)
+
+    async def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """Get a user by id mapped straight from its row to a DTO."""
+        result = await self._db.execute(build_get_by_id_statement(user_id))
+        row = result.first()
+        if not row:
+            return None
+        return row_to_response_dto(row)
+
+    async def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """
+        Get the users with the given ids in a single query.
+
+        Users come in no particular order; ids without a user are left out.
+        """
+        if not user_ids:
+            return []
+        result = await self._db.execute(
+            build_get_many_statement(user_ids, self._dialect_name)
+        )
+        return [
+            row_to_domain_entity(row)
+            for row in result
+        ]
+
+    async def get_many_responses(
+        self, user_ids: Sequence[int]
+    ) -> List[UserResponseDto]:
+        """Get the users with the given ids as DTOs in a single query."""
+        if not user_ids:
+            return []
+        result = await self._db.execute(
+            build_get_many_statement(user_ids, self._dialect_name)
+        )
+        return [
+            row_to_response_dto(row)
+            for row in result
+        ]
+
+    async def get_fields_by_id(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get only some columns of a user by id."""
+        result = await self._db.execute(
+            build_get_by_id_statement(user_id, fields)
+        )
+        row = result.first()
+        if not row:
+            return None
+        return row_to_fields(row, fields)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        result = await self._db.execute(build_get_by_email_statement(email))
+        row = result.first()
+        if not row:
+            return None
+        return row_to_domain_entity(row)
+
+    async def get_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """Get which of the given emails already belong to a user."""
+        rows: Iterable[str] = await self._db.scalars(
+            select(UserModel.email).where(
+                email_in(emails, self._dialect_name)
+            )
+        )
+        return set(rows)
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+    ) -> List[User]:
+        """Get all users ordered by id with offset or keyset pagination."""
+        rows = await self._db.execute(
+            build_get_all_statement(skip, limit, after_id, filters)
+        )
+        return [
+            row_to_domain_entity(row)
+            for row in rows
+        ]
+
+    async def get_all_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_count: bool = False,
+    ) -> Tuple[List[UserRow], Optional[int]]:
+        """
+        Get a page of users as DTOs or dicts of ``fields``.
+
+        With ``with_count`` the exact count comes with the page, in one
+        query.
+        """
+        if not with_count:
+            result = await self._db.execute(
+                build_get_all_statement(skip, limit, after_id, filters, fields)
+            )
+            return (
+                rows_to_page(result, fields),
+                None,
+            )
+        result = await self._db.execute(
+            build_get_all_with_count_statement(
+                skip, limit, after_id, filters, fields
+            )
+        )
+        rows = result.all()
+        if not rows:
+            # Past the last page no row carries the count
+            total_count = await self._db.scalar(
+                build_count_statement(filters)
+            )
+            return [], total_count
+        return (
+            rows_to_page(rows, fields),
+            rows[0].total_count,
+        )
+
+    async def estimate_count(
+        self, filters: Optional[UserFilterDto] = None
+    ) -> int:
+        """
+        Estimate how many users match ``filters`` from planner statistics.
+
+        See ``UserRepositoryPostgresAdapter.estimate_count``.
+        """
+        if self._dialect_name != "postgresql":
+            return await self._db.scalar(build_count_statement(filters))
+        if not filter_conditions(filters):
+            estimate = await self._db.scalar(ESTIMATE_USERS_COUNT)
+            if estimate is not None:
+                return estimate
+        return await self._explain_row_estimate(
+            select(UserModel.id).where(*filter_conditions(filters))
+        )
+
+    async def search(self, query: str, limit: int = 20) -> List[User]:
+        """
+        Search users by partial name or email, best matches first.
+
+        Ranked by the pg_trgm indexes on PostgreSQL; elsewhere every match
+        is ranked in memory.
+        """
+        rows = await self._db.execute(
+            build_search_statement(query, limit, self._dialect_name)
+        )
+        users = (
+            row_to_domain_entity(row)
+            for row in rows
+        )
+        if self._dialect_name == "postgresql":
+            return list(users)
+        return rank_by_similarity(users, query, limit)
+
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Iterate over all users ordered by id from a server-side cursor."""
+        result = await self._db.stream(build_iter_all_statement(batch_size))
+        try:
+            async for row in result:
+                yield row_to_domain_entity(row)
+        finally:
+            await result.close()
+
+    async def iter_all_fields(
+        self, fields: Sequence[str], batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over some columns of all users ordered by id."""
+        result = await self._db.stream(
+            build_iter_all_statement(batch_size, fields)
+        )
+        try:
+            async for row in result:
+                yield row_to_fields(
+                    row, fields
+                )
+        finally:
+            await result.close()
+
+    async def update(self, user: User) -> User:
+        """Update an existing user."""
+        if not user.id:
+            raise ValueError("User id is required for update")
+
+        db_user = await self._db.get(UserModel, user.id)
+        if not db_user:
+            raise ValueError(f"User with id {user.id} not found")
+
+        db_user.name = user.name
+        db_user.email = str(user.email)
+        db_user.active = user.active
+        db_user.updated_at = user.updated_at
+
+        await self._db.commit()
+        await self._db.refresh(db_user)
+
+        return self._to_domain_entity(db_user)
+
+    async def update_fields(
+        self,
+        user_id: int,
+        changes: Mapping[str, Any],
+        expected: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[User]:
+        """Apply a partial update with one UPDATE ... RETURNING."""
+        try:
+            result = await self._db.execute(
+                build_update_fields_statement(user_id, changes, expected)
+            )
+            row = result.first()
+            await self._db.commit()
+        except IntegrityError as e:
+            await self._db.rollback()
+            if "email" in changes:
+                raise DuplicateEmailError(changes["email"]) from e
+            raise
+        if not row:
+            return None
+        return row_to_domain_entity(row)
+
+    async def delete(self, user_id: int) -> bool:
+        """Delete a user by id with one DELETE ... RETURNING id."""
+        deleted_id = await self._db.scalar(
+            delete(UserModel.__table__)
+            .where(UserModel.id == user_id)
+            .returning(UserModel.id)
+        )
+        await self._db.commit()
+        return deleted_id is not None
+
+    async def _copy_import(
+        self, chunks: AsyncIterable[Sequence[User]], upsert: bool
+    ) -> Tuple[int, int]:
+        """Import through COPY into a staging table and one merge."""
+        connection = await self._db.connection()
+        await connection.exec_driver_sql(CREATE_IMPORT_STAGING_TABLE)
+        raw_connection = await connection.get_raw_connection()
+        # psycopg async connection, for its COPY support
+        driver_connection: Any = raw_connection.driver_connection
+        cursor = driver_connection.cursor()
+        ordinal = 0
+        async with cursor.copy(COPY_IMPORT_STAGING) as copy:
+            async for chunk in chunks:
+                for user in chunk:
+                    ordinal += 1
+                    await copy.write_row(to_staging_row(ordinal, user))
+        counts = await connection.execute(
+            build_import_merge_statement(upsert)
+        )
+        row = counts.one()
+        return row.created, row.updated
+
+    async def _insert_import(
+        self, chunks: AsyncIterable[Sequence[User]], upsert: bool
+    ) -> Tuple[int, int]:
+        """Import through multi-row INSERT ... ON CONFLICT statements."""
+        statement = (
+            insert_updating_duplicate_emails(self._dialect_name)
+            if upsert
+            else insert_ignoring_duplicate_emails(self._dialect_name)
+        ).returning(UserModel.id)
+
+        created = updated = 0
+        async for chunk in chunks:
+            users = unique_by_email(chunk, keep_last=upsert)
+            for start in range(0, len(users), INSERT_BATCH_SIZE):
+                batch = users[start:start + INSERT_BATCH_SIZE]
+                existing = (
+                    len(
+                        await self.get_existing_emails(
+                            [str(user.email) for user in batch]
+                        )
+                    )
+                    if upsert
+                    else 0
+                )
+                merged = await self._db.execute(
+                    statement, [to_insert_row(user) for user in batch]
+                )
+                merged_count = len(merged.all())
+                created += merged_count - existing
+                updated += existing
+        return created, updated
+
+    async def _explain_row_estimate(self, statement: Any) -> int:
+        """Get the planner's estimated row count of ``statement``."""
+        compiled = statement.compile(dialect=self._db.get_bind().dialect)
+        connection = await self._db.connection()
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        )
+        plan = result.scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @property
+    def _dialect_name(self) -> str:
+        """Name of the SQL dialect the session is bound to."""
+        return self._db.get_bind().dialect.name
+
+    @staticmethod
+    def _to_domain_entity(db_user: UserModel) -> User:
+        """Convert database model to domain entity."""
+        return model_to_domain_entity(db_user)
@@ -0,0 +1,69 @@
+"""Write batching decorator for User repository."""
+
+from typing import List, Optional, Sequence, Union
+
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
+from infrastructure.adapters.batching.write_batcher import WriteBatcher
+from infrastructure.adapters.repositories.user_repository_decorator import (
+    UserRepositoryDecorator,
+)
+from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
+    unique_by_email,
+)
+
+
+def to_create_outcomes(
+    users: Sequence[User], created_users: Sequence[Optional[User]]
+) -> List[Union[User, DuplicateEmailError]]:
+    """
+    Get the outcome of creating each of ``users``.
+
+    ``created_users`` is what ``create_many`` returned for
+    ``unique_by_email(users)``. The first user of an email gets the created
+    user; the others, like users whose email was taken, a
+    ``DuplicateEmailError``.
+    """
+    created_by_email = {
+        str(created_user.email): created_user
+        for created_user in created_users
+        if created_user is not None
+    }
+    outcomes: List[Union[User, DuplicateEmailError]] = []
+    for user in users:
+        created_user = created_by_email.pop(str(user.email), None)
+        outcomes.append(created_user or DuplicateEmailError(str(user.email)))
+    return outcomes
+
+
+class BatchingUserRepositoryAdapter(UserRepositoryDecorator):
+    """
+    UserRepositoryPort decorator batching concurrent creates.
+
+    Creates submitted while a batch is open, from any thread, are inserted
+    together by one multi-row ``create_many`` in one transaction, on the
+    repository of the request that opened the batch; each caller still
+    gets its own created user or ``DuplicateEmailError``. Other reads and
+    writes pass through.
+    """
+
+    def __init__(
+        self, repository: UserRepositoryPort, batcher: WriteBatcher
+    ) -> None:
+        """Initialize decorator with the wrapped repository and batcher."""
+        super().__init__(repository)
+        self._batcher = batcher
+
+    def create(self, user: User) -> User:
+        """Create a new user in the open batch of creates."""
+        return self._batcher.submit(user, self._create_batch)
+
+    def _create_batch(
+        self, users: List[User]
+    ) -> List[Union[User, DuplicateEmailError]]:
+        """Create a batch of users in one transaction."""
+        created_users = self._repository.create_many(unique_by_email(users))
+        return to_create_outcomes(users, created_users)
@@ -0,0 +1,238 @@
+"""Read-through caching decorator for User repository."""
+
+import copy
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+from infrastructure.adapters.cache.lru_ttl_cache import MISSING, LruTtlCache
+from infrastructure.adapters.repositories.user_repository_decorator import (
+    UserRepositoryDecorator,
+)
+
+
+def id_key(user_id: int) -> tuple:
+    """Cache key of a user id."""
+    return ("id", user_id)
+
+
+def email_key(email: str) -> tuple:
+    """Cache key of an email."""
+    return ("email", email)
+
+
+def cached_user(cache: LruTtlCache, key: tuple) -> Any:
+    """
+    Get a copy of the user cached under ``key``.
+
+    Returns None for a cached miss and ``MISSING`` when nothing is cached.
+    An email entry whose user is gone or no longer has that email is
+    ``MISSING`` too.
+    """
+    cached = cache.get(key)
+    if cached is MISSING or cached is None:
+        return cached
+    if key[0] == "email":
+        email = key[1]
+        cached = cache.get(id_key(cached))
+        if cached is MISSING or cached is None or str(cached.email) != email:
+            return MISSING
+    return copy.copy(cached)
+
+
+def store_user(cache: LruTtlCache, user: User) -> None:
+    """Cache a user under its id and point its email at it."""
+    if user.id is None:
+        return
+    cache.set(id_key(user.id), copy.copy(user))
+    cache.set(email_key(str(user.email)), user.id)
+
+
+def user_to_response_dto(user: User) -> UserResponseDto:
+    """Map a cached domain entity to a response DTO."""
+    return UserResponseDto(
+        id=user.id or 0,
+        name=user.name,
+        email=str(user.email),
+        active=user.active,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
+class CachedUserRepositoryAdapter(UserRepositoryDecorator):
+    """
+    UserRepositoryPort decorator caching lookups by id and by email.
+
+    Users are cached under their id; emails map to the id that owned them,
+    so a user is stored once and an email entry that no longer matches its
+    user is simply treated as a miss. Misses are cached too (with a shorter
+    TTL). Writes made through this adapter invalidate the affected entries;
+    writes made elsewhere (e.g. by another process) become visible when the
+    entries expire. Other reads (listings, search, sparse fieldsets) are
+    not cached and pass through.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepositoryPort,
+        cache: LruTtlCache,
+        negative_ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize decorator with the wrapped repository and cache."""
+        super().__init__(repository)
+        self._cache = cache
+        self._negative_ttl_seconds = negative_ttl_seconds
+
+    def create(self, user: User) -> User:
+        """Create a new user."""
+        created_user = self._repository.create(user)
+        store_user(self._cache, created_user)
+        return created_user
+
+    def create_many(self, users: Sequence[User]) -> List[Optional[User]]:
+        """Create many users in a single transaction."""
+        created_users = self._repository.create_many(users)
+        for created_user in created_users:
+            if created_user is not None:
+                store_user(self._cache, created_user)
+        return created_users
+
+    def upsert_by_email(self, user: User) -> Tuple[User, bool]:
+        """Create or update a user by email."""
+        upserted_user, created = self._repository.upsert_by_email(user)
+        store_user(self._cache, upserted_user)
+        return upserted_user, created
+
+    def import_users(
+        self, chunks: Iterable[Sequence[User]], upsert: bool = False
+    ) -> Tuple[int, int]:
+        """Import users; any cached entry may be stale afterwards."""
+        try:
+            return self._repository.import_users(chunks, upsert=upsert)
+        finally:
+            self._cache.clear()
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by id, from cache when possible."""
+        cached = cached_user(self._cache, id_key(user_id))
+        if cached is not MISSING:
+            return cached
+
+        user = self._repository.get_by_id(user_id)
+        if user is None:
+            self._cache.set(id_key(user_id), None, self._negative_ttl_seconds)
+            return None
+        store_user(self._cache, user)
+        return user
+
+    def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """
+        Get user by id as a response DTO, from cache when possible.
+
+        Goes through ``get_by_id``, so a miss loads and caches the user.
+        """
+        user = self.get_by_id(user_id)
+        if user is None:
+            return None
+        return user_to_response_dto(user)
+
+    def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """
+        Get users by id, querying only those that are not cached.
+
+        The ids missing from the cache are loaded in a single query, and
+        those without a user are cached as misses.
+        """
+        users: List[User] = []
+        missing_ids = []
+        for user_id in user_ids:
+            cached = cached_user(self._cache, id_key(user_id))
+            if cached is MISSING:
+                missing_ids.append(user_id)
+            elif cached is not None:
+                users.append(cached)
+        if not missing_ids:
+            return users
+
+        loaded = self._repository.get_many(missing_ids)
+        for user in loaded:
+            store_user(self._cache, user)
+        loaded_ids = {user.id for user in loaded}
+        for user_id in missing_ids:
+            if user_id not in loaded_ids:
+                self._cache.set(
+                    id_key(user_id), None, self._negative_ttl_seconds
+                )
+        return users + loaded
+
+    def get_many_responses(
+        self, user_ids: Sequence[int]
+    ) -> List[UserResponseDto]:
+        """Get users by id as response DTOs, through ``get_many``."""
+        users = self.get_many(user_ids)
+        return [user_to_response_dto(user) for user in users]
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email, from cache when possible."""
+        cached = cached_user(self._cache, email_key(email))
+        if cached is not MISSING:
+            return cached
+
+        user = self._repository.get_by_email(email)
+        if user is None:
+            self._cache.set(
+                email_key(email), None, self._negative_ttl_seconds
+            )
+            return None
+        store_user(self._cache, user)
+        return user
+
+    def update(self, user: User) -> User:
+        """Update an existing user."""
+        if user.id is not None:
+            self._cache.delete(id_key(user.id))
+        updated_user = self._repository.update(user)
+        store_user(self._cache, updated_user)
+        return updated_user
+
+    def update_fields(
+        self,
+        user_id: int,
+        changes: Mapping[str, Any],
+        expected: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[User]:
+        """Apply a partial update to a user."""
+        self._cache.delete(id_key(user_id))
+        if "email" in changes:
+            self._cache.delete(email_key(changes["email"]))
+        updated_user = self._repository.update_fields(
+            user_id, changes, expected
+        )
+        if updated_user is not None:
+            store_user(self._cache, updated_user)
+        else:
+            # A concurrent read may have cached the row during the write
+            self._cache.delete(id_key(user_id))
+        return updated_user
+
+    def delete(self, user_id: int) -> bool:
+        """Delete a user by id."""
+        self._cache.delete(id_key(user_id))
+        deleted = self._repository.delete(user_id)
+        # A concurrent read may have cached the row during the write
+        self._cache.delete(id_key(user_id))
+        return deleted
@@ -0,0 +1,77 @@
+"""Single-flight decorator for User repository."""
+
+import copy
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+from infrastructure.adapters.cache.single_flight import SingleFlight
+from infrastructure.adapters.repositories.user_repository_decorator import (
+    UserRepositoryDecorator,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlightUserRepositoryAdapter(UserRepositoryDecorator):
+    """
+    UserRepositoryPort decorator coalescing concurrent lookups by key.
+
+    Lookups by id (also as a DTO or a sparse fieldset) and by email that
+    arrive while an identical one is running, from any thread, wait for it
+    and share its result instead of running their own query. The group is
+    shared by the repositories of all requests; every caller gets its own
+    copy of the result. Other reads and writes pass through.
+    """
+
+    def __init__(
+        self, repository: UserRepositoryPort, group: SingleFlight
+    ) -> None:
+        """Initialize decorator with the wrapped repository and group."""
+        super().__init__(repository)
+        self._group = group
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by id, sharing a lookup already in flight."""
+        return self._coalesce(
+            ("id", user_id), lambda: self._repository.get_by_id(user_id)
+        )
+
+    def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """Get user by id as a DTO, sharing a lookup already in flight."""
+        return self._coalesce(
+            ("response", user_id),
+            lambda: self._repository.get_response_by_id(user_id),
+        )
+
+    def get_fields_by_id(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get some fields of a user, sharing a lookup already in flight."""
+        return self._coalesce(
+            ("fields", user_id, tuple(fields)),
+            lambda: self._repository.get_fields_by_id(user_id, fields),
+        )
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email, sharing a lookup already in flight."""
+        return self._coalesce(
+            ("email", email), lambda: self._repository.get_by_email(email)
+        )
+
+    def _coalesce(self, key: Hashable, lookup: Callable[[], T]) -> T:
+        """Run ``lookup`` through the group; return a copy of its result."""
+        return copy.copy(self._group.do(key, lookup))
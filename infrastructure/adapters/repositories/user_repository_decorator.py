@@ -0,0 +1,156 @@
+"""Delegating base of User repository decorators."""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from core.application.dto.user_dto import (
+    UserFilterDto,
+    UserResponseDto,
+    UserRow,
+)
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.domain.entities.user import User
+
+
+class UserRepositoryDecorator(UserRepositoryPort):
+    """
+    UserRepositoryPort decorator passing every call through.
+
+    Base of the decorators of a repository: each overrides only the calls
+    it changes and inherits the others, which go straight to the wrapped
+    repository.
+    """
+
+    def __init__(self, repository: UserRepositoryPort) -> None:
+        """Initialize decorator with the wrapped repository."""
+        self._repository = repository
+
+    def create(self, user: User) -> User:
+        """Create a new user."""
+        return self._repository.create(user)
+
+    def create_many(self, users: Sequence[User]) -> List[Optional[User]]:
+        """Create many users in a single transaction."""
+        return self._repository.create_many(users)
+
+    def upsert_by_email(self, user: User) -> Tuple[User, bool]:
+        """Create or update a user by email."""
+        return self._repository.upsert_by_email(user)
+
+    def import_users(
+        self, chunks: Iterable[Sequence[User]], upsert: bool = False
+    ) -> Tuple[int, int]:
+        """Import users."""
+        return self._repository.import_users(chunks, upsert=upsert)
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by id."""
+        return self._repository.get_by_id(user_id)
+
+    def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """Get user by id as a response DTO."""
+        return self._repository.get_response_by_id(user_id)
+
+    def get_fields_by_id(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get some fields of a user by id."""
+        return self._repository.get_fields_by_id(user_id, fields)
+
+    def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """Get users by id in a single query."""
+        return self._repository.get_many(user_ids)
+
+    def get_many_responses(
+        self, user_ids: Sequence[int]
+    ) -> List[UserResponseDto]:
+        """Get users by id as response DTOs in a single query."""
+        return self._repository.get_many_responses(user_ids)
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        return self._repository.get_by_email(email)
+
+    def get_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """Get which of the given emails already belong to a user."""
+        return self._repository.get_existing_emails(emails)
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+    ) -> List[User]:
+        """Get all users ordered by id with pagination."""
+        return self._repository.get_all(
+            skip=skip, limit=limit, after_id=after_id, filters=filters
+        )
+
+    def get_all_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_count: bool = False,
+    ) -> Tuple[List[UserRow], Optional[int]]:
+        """Get a page of users for read-only callers."""
+        return self._repository.get_all_page(
+            skip=skip,
+            limit=limit,
+            after_id=after_id,
+            filters=filters,
+            fields=fields,
+            with_count=with_count,
+        )
+
+    def estimate_count(self, filters: Optional[UserFilterDto] = None) -> int:
+        """Estimate how many users match ``filters``."""
+        return self._repository.estimate_count(filters)
+
+    def search(self, query: str, limit: int = 20) -> List[User]:
+        """Search users by partial name or email."""
+        return self._repository.search(query, limit=limit)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[User]:
+        """Iterate over all users ordered by id."""
+        return self._repository.iter_all(batch_size=batch_size)
+
+    def iter_all_fields(
+        self, fields: Sequence[str], batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over some fields of all users."""
+        return self._repository.iter_all_fields(fields, batch_size=batch_size)
+
+    def update(self, user: User) -> User:
+        """Update an existing user."""
+        return self._repository.update(user)
+
+    def update_fields(
+        self,
+        user_id: int,
+        changes: Mapping[str, Any],
+        expected: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[User]:
+        """Apply a partial update to a user."""
+        return self._repository.update_fields(user_id, changes, expected)
+
+    def delete(self, user_id: int) -> bool:
+        """Delete a user by id."""
+        return self._repository.delete(user_id)
@@ -1,16 +1,603 @@
 """PostgreSQL adapter for User repository."""
 
-from typing import List, Optional
+import heapq
+import re
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+from sqlalchemy import (
+    ARRAY,
+    Boolean,
+    Column,
+    Float,
+    Integer,
+    String,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    func,
+    lambda_stmt,
+    literal_column,
+    not_,
+    or_,
+    select,
+    text,
+    union,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, TextClause
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from core.application.dto.user_dto import (
+    USER_FIELDS,
+    UserFilterDto,
+    UserResponseDto,
+    UserRow,
+)
 from core.application.ports.user_repository_port import (
     UserRepositoryPort,
 )
 from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
 from core.domain.value_objects.email_address import EmailAddress
 from infrastructure.database.models.user_model import UserModel
 
+# Rows per multi-row INSERT; 5 bound columns keeps each statement far below
+# the bind parameter limits of PostgreSQL (65535) and SQLite (32766)
+INSERT_BATCH_SIZE = 1000
+
+LIKE_ESCAPE = "\\"
+
+# Columns of a whole user row, as mapped to a response DTO
+USER_FIELD_COUNT = len(USER_FIELDS)
+
+# Imports are COPYed into this temporary table, then merged into users
+IMPORT_STAGING_TABLE = "users_import"
+
+CREATE_IMPORT_STAGING_TABLE = f"""
+CREATE TEMPORARY TABLE {IMPORT_STAGING_TABLE} (
+    ordinal bigint NOT NULL,
+    name varchar(255) NOT NULL,
+    email varchar(255) NOT NULL,
+    active boolean NOT NULL,
+    created_at timestamp NOT NULL,
+    updated_at timestamp NOT NULL
+) ON COMMIT DROP
+"""
+
+COPY_IMPORT_STAGING = (
+    f"COPY {IMPORT_STAGING_TABLE} "
+    "(ordinal, name, email, active, created_at, updated_at) FROM STDIN"
+)
+
+
+def user_columns(fields: Optional[Sequence[str]] = None) -> List[Any]:
+    """
+    Get the ``users`` columns named by ``fields``, all by default.
+
+    All columns come in ``USER_FIELDS`` order, whatever the order of the
+    table's columns, so rows selected with them map to response DTOs by
+    position.
+    """
+    users = UserModel.__table__
+    if fields is None:
+        fields = USER_FIELDS
+    return [users.c[field] for field in fields]
+
+
+def build_get_by_id_statement(
+    user_id: int, fields: Optional[Sequence[str]] = None
+) -> StatementLambdaElement:
+    """
+    Build ``SELECT * FROM users WHERE id = :user_id``.
+
+    Lambda statements are constructed once per call site; later calls only
+    extract the new parameter values, and the compiled SQL comes from the
+    engine's compiled cache. With ``fields`` only those columns are
+    selected; each fieldset is cached as its own statement.
+    """
+    users = UserModel.__table__
+    columns = user_columns(fields)
+    return lambda_stmt(
+        lambda: select(*columns).where(users.c.id == user_id)
+    )
+
+
+def build_get_by_email_statement(email: str) -> StatementLambdaElement:
+    """Build ``SELECT * FROM users WHERE email = :email``."""
+    users = UserModel.__table__
+    return lambda_stmt(lambda: select(users).where(users.c.email == email))
+
+
+def build_get_all_statement(
+    skip: int,
+    limit: int,
+    after_id: Optional[int],
+    filters: Optional[UserFilterDto] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> StatementLambdaElement:
+    """
+    Build ``SELECT * FROM users [WHERE filters] ORDER BY id`` for one page.
+
+    With ``after_id`` the page starts with an index seek on the primary key
+    (keyset pagination) instead of skipping ``skip`` rows. Each filter is a
+    plain column predicate the indexes of ``users`` can serve: ``active``
+    matches the partial index on active users, time ranges the
+    ``created_at``/``updated_at`` indexes. With ``fields`` only those
+    columns are selected.
+    """
+    users = UserModel.__table__
+    columns = user_columns(fields)
+    statement = lambda_stmt(
+        lambda: select(*columns).order_by(users.c.id)
+    )
+    for condition in filter_conditions(filters):
+        # SQL expressions in a closure are part of the cache key; their
+        # bound values are extracted on each call
+        statement += lambda s: s.where(condition)
+    if after_id is not None:
+        statement += lambda s: s.where(users.c.id > after_id)
+    else:
+        statement += lambda s: s.offset(skip)
+    statement += lambda s: s.limit(limit)
+    return statement
+
+
+def filter_conditions(
+    filters: Optional[UserFilterDto],
+) -> List[ColumnElement]:
+    """Build the WHERE clauses of listing ``filters``."""
+    if filters is None:
+        return []
+    users = UserModel.__table__
+    conditions: List[ColumnElement] = []
+    # Bare boolean predicates, so that they match the partial index
+    # predicate instead of comparing against a bound parameter
+    if filters.active is True:
+        conditions.append(users.c.active)
+    elif filters.active is False:
+        conditions.append(not_(users.c.active))
+    if filters.created_after is not None:
+        conditions.append(users.c.created_at >= filters.created_after)
+    if filters.created_before is not None:
+        conditions.append(users.c.created_at < filters.created_before)
+    if filters.updated_since is not None:
+        conditions.append(users.c.updated_at >= filters.updated_since)
+    return conditions
+
+
+def build_get_all_with_count_statement(
+    skip: int,
+    limit: int,
+    after_id: Optional[int],
+    filters: Optional[UserFilterDto] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Any:
+    """
+    Build a page of users carrying the count of all matching users.
+
+    ``count(*) OVER ()`` is computed over every user matching ``filters``
+    before the page is cut, so one query returns both; each row has a
+    ``total_count`` column. With ``fields`` only those columns (and ``id``,
+    the page order) are selected.
+    """
+    users = UserModel.__table__
+    columns = user_columns(fields)
+    if fields is not None and "id" not in fields:
+        columns.append(users.c.id)
+    counted = (
+        select(*columns, func.count().over().label("total_count"))
+        .where(*filter_conditions(filters))
+        .subquery("counted")
+    )
+    statement = select(counted).order_by(counted.c.id)
+    if after_id is not None:
+        statement = statement.where(counted.c.id > after_id)
+    else:
+        statement = statement.offset(skip)
+    return statement.limit(limit)
+
+
+def build_count_statement(filters: Optional[UserFilterDto] = None) -> Any:
+    """Build ``SELECT count(*) FROM users [WHERE filters]``."""
+    return (
+        select(func.count())
+        .select_from(UserModel.__table__)
+        .where(*filter_conditions(filters))
+    )
+
+
+# Planner's row estimate for the whole table: reltuples scaled to the
+# table's current size, as the planner itself does, so that growth since
+# the last ANALYZE is accounted for. NULL when never analyzed.
+ESTIMATE_USERS_COUNT = text(
+    """
+    SELECT (reltuples / relpages
+            * (pg_relation_size(oid) / current_setting('block_size')::int)
+           )::bigint
+    FROM pg_class
+    WHERE oid = 'users'::regclass AND reltuples >= 0 AND relpages > 0
+    """
+)
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so that ``value`` only matches literally."""
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def build_search_statement(query: str, limit: int, dialect_name: str) -> Any:
+    """
+    Build the search of users whose name or email contains ``query``.
+
+    On PostgreSQL matches are ranked by trigram distance (``<->``, one
+    minus ``similarity()``) before the page is cut. The ``limit`` nearest
+    matches by name and the ``limit`` nearest by email are read off the
+    pg_trgm GiST indexes in distance order (KNN scans), so however many
+    users match, at most ``2 * limit`` are ranked by their best distance.
+    The best matches are always among them: a user nearer than the
+    ``limit``-th by its best column is among the nearest by that column.
+    Other databases get every match, to be ranked with
+    ``rank_by_similarity``.
+    """
+    users = UserModel.__table__
+    pattern = f"%{escape_like(query)}%"
+    # Backslash is PostgreSQL's default LIKE escape; keeping the operator
+    # bare lets the planner match it against the trigram indexes
+    escape = None if dialect_name == "postgresql" else LIKE_ESCAPE
+    matches = or_(
+        users.c.name.ilike(pattern, escape=escape),
+        users.c.email.ilike(pattern, escape=escape),
+    )
+    if dialect_name != "postgresql":
+        return select(users).where(matches)
+
+    def nearest(column: Column) -> Any:
+        distance = column.op("<->", return_type=Float)(query)
+        return (
+            select(users.c.id)
+            .where(matches)
+            .order_by(distance, users.c.id)
+            .limit(limit)
+            .subquery()
+        )
+
+    by_name = nearest(users.c.name)
+    by_email = nearest(users.c.email)
+    candidates = union(select(by_name.c.id), select(by_email.c.id))
+    distance = func.least(
+        users.c.name.op("<->", return_type=Float)(query),
+        users.c.email.op("<->", return_type=Float)(query),
+    )
+    return (
+        select(users)
+        .where(users.c.id.in_(candidates))
+        .order_by(distance, users.c.id)
+        .limit(limit)
+    )
+
+
+def trigrams(value: str) -> Set[str]:
+    """Get the trigrams of ``value`` the way pg_trgm extracts them."""
+    result: Set[str] = set()
+    for word in re.findall(r"[^\W_]+", value.lower()):
+        padded = f"  {word} "
+        result.update(
+            padded[start:start + 3] for start in range(len(padded) - 2)
+        )
+    return result
+
+
+def trigram_similarity(left: str, right: str) -> float:
+    """Compute pg_trgm's ``similarity(left, right)``."""
+    left_trigrams = trigrams(left)
+    right_trigrams = trigrams(right)
+    if not left_trigrams or not right_trigrams:
+        return 0.0
+    shared = len(left_trigrams & right_trigrams)
+    return shared / (len(left_trigrams) + len(right_trigrams) - shared)
+
+
+def rank_by_similarity(
+    users: Iterable[User], query: str, limit: int
+) -> List[User]:
+    """
+    Order users like the PostgreSQL search does and keep ``limit``.
+
+    ``users`` is consumed lazily; only the best ``limit`` are kept.
+    """
+    return heapq.nsmallest(
+        limit,
+        users,
+        key=lambda user: (
+            -max(
+                trigram_similarity(user.name, query),
+                trigram_similarity(str(user.email), query),
+            ),
+            user.id or 0,
+        ),
+    )
+
+
+def email_in(emails: Sequence[str], dialect_name: str) -> ColumnElement:
+    """
+    Build an ``email IN emails`` predicate.
+
+    On PostgreSQL the list is sent as a single array parameter
+    (``email = ANY(:emails)``), so the statement text does not depend on the
+    number of emails.
+    """
+    if dialect_name == "postgresql":
+        return UserModel.email == any_(
+            bindparam("emails", list(emails), type_=ARRAY(String))
+        )
+    return UserModel.email.in_(list(emails))
+
+
+def id_in(user_ids: Sequence[int], dialect_name: str) -> ColumnElement:
+    """
+    Build an ``id IN user_ids`` predicate.
+
+    Like ``email_in``, a single array parameter on PostgreSQL
+    (``id = ANY(:user_ids)``).
+    """
+    if dialect_name == "postgresql":
+        return UserModel.id == any_(
+            bindparam("user_ids", list(user_ids), type_=ARRAY(Integer))
+        )
+    return UserModel.id.in_(list(user_ids))
+
+
+def build_get_many_statement(
+    user_ids: Sequence[int], dialect_name: str
+) -> Any:
+    """Build ``SELECT * FROM users WHERE id = ANY(:user_ids)``."""
+    return select(*user_columns()).where(id_in(user_ids, dialect_name))
+
+
+def _dialect_insert(dialect_name: str) -> Any:
+    """Return an INSERT construct that supports ON CONFLICT."""
+    dialect_insert = (
+        postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    )
+    return dialect_insert(UserModel.__table__)
+
+
+def insert_ignoring_duplicate_emails(dialect_name: str) -> Any:
+    """Build ``INSERT INTO users ... ON CONFLICT (email) DO NOTHING``."""
+    return _dialect_insert(dialect_name).on_conflict_do_nothing(
+        index_elements=[UserModel.email]
+    )
+
+
+def insert_updating_duplicate_emails(dialect_name: str) -> Any:
+    """
+    Build ``INSERT INTO users ... ON CONFLICT (email) DO UPDATE``.
+
+    The user that has the email keeps its id and ``created_at``.
+    """
+    statement = _dialect_insert(dialect_name)
+    return statement.on_conflict_do_update(
+        index_elements=[UserModel.email],
+        set_={
+            "name": statement.excluded.name,
+            "active": statement.excluded.active,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+
+
+def build_upsert_by_email_statement(dialect_name: str, user: User) -> Any:
+    """
+    Build ``INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING``.
+
+    Besides the row, ``inserted`` tells whether it was created. On
+    PostgreSQL an updated row has the ``xmax`` of the upsert that locked
+    it; elsewhere an updated row kept the ``created_at`` of the user that
+    had the email.
+    """
+    if dialect_name == "postgresql":
+        inserted = literal_column("xmax = 0", Boolean)
+    else:
+        inserted = UserModel.__table__.c.created_at == user.created_at
+    return (
+        insert_updating_duplicate_emails(dialect_name)
+        .values(to_insert_row(user))
+        .returning(*UserModel.__table__.c, inserted.label("inserted"))
+    )
+
+
+def build_import_merge_statement(upsert: bool) -> TextClause:
+    """
+    Build the statement merging the import staging table into ``users``.
+
+    One row per email is merged, the first one (the last one on upsert),
+    since ``ON CONFLICT DO UPDATE`` cannot touch a row twice. Returns the
+    ``created`` and ``updated`` counts; ``xmax = 0`` only holds for rows
+    the statement inserted.
+    """
+    conflict_action = (
+        "DO UPDATE SET name = EXCLUDED.name, active = EXCLUDED.active, "
+        "updated_at = EXCLUDED.updated_at"
+        if upsert
+        else "DO NOTHING"
+    )
+    return text(
+        f"""
+        WITH merged AS (
+            INSERT INTO users (name, email, active, created_at, updated_at)
+            SELECT DISTINCT ON (email)
+                name, email, active, created_at, updated_at
+            FROM {IMPORT_STAGING_TABLE}
+            ORDER BY email, ordinal {"DESC" if upsert else "ASC"}
+            ON CONFLICT (email) {conflict_action}
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT
+            count(*) FILTER (WHERE inserted) AS created,
+            count(*) FILTER (WHERE NOT inserted) AS updated
+        FROM merged
+        """
+    )
+
+
+def build_update_fields_statement(
+    user_id: int,
+    changes: Mapping[str, Any],
+    expected: Optional[Mapping[str, Any]] = None,
+) -> Any:
+    """
+    Build ``UPDATE users ... RETURNING`` for a partial update.
+
+    The row only matches when every ``expected`` value holds and at least
+    one of ``changes`` (``updated_at`` aside) differs from the stored value,
+    so a patch that changes nothing performs no write.
+    """
+    columns = UserModel.__table__.c
+    conditions = [columns.id == user_id]
+    conditions.extend(
+        columns[field] == value for field, value in (expected or {}).items()
+    )
+    differences = [
+        columns[field].is_distinct_from(value)
+        for field, value in changes.items()
+        if field != "updated_at"
+    ]
+    if differences:
+        conditions.append(or_(*differences))
+
+    return (
+        update(UserModel.__table__)
+        .where(and_(*conditions))
+        .values(**changes)
+        .returning(*columns)
+    )
+
+
+def build_iter_all_statement(
+    batch_size: int, fields: Optional[Sequence[str]] = None
+) -> Any:
+    """
+    Build ``SELECT * FROM users ORDER BY id`` streamed in batches.
+
+    ``yield_per`` turns on ``stream_results``: psycopg reads through a
+    named server-side cursor, ``batch_size`` rows per round trip. With
+    ``fields`` only those columns are selected.
+    """
+    return (
+        select(*user_columns(fields))
+        .order_by(UserModel.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def unique_by_email(
+    users: Iterable[User], keep_last: bool = False
+) -> List[User]:
+    """Keep one user per email, the first one or, with keep_last, the last."""
+    by_email: dict = {}
+    for user in users:
+        email = str(user.email)
+        if keep_last or email not in by_email:
+            by_email[email] = user
+    return list(by_email.values())
+
+
+def to_staging_row(ordinal: int, user: User) -> tuple:
+    """Convert a domain entity to an import staging table COPY row."""
+    return (
+        ordinal,
+        user.name,
+        str(user.email),
+        user.active,
+        user.created_at,
+        user.updated_at,
+    )
+
+
+def to_insert_row(user: User) -> dict:
+    """Convert a domain entity to ``users`` insert values."""
+    return {
+        "name": user.name,
+        "email": str(user.email),
+        "active": user.active,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
+
+
+def row_to_domain_entity(row: Row) -> User:
+    """Convert a ``users`` result row to domain entity."""
+    return User(
+        id=row.id,
+        name=row.name,
+        email=EmailAddress(row.email),
+        active=row.active,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+def model_to_domain_entity(db_user: UserModel) -> User:
+    """Convert database model to domain entity."""
+    return User(
+        id=db_user.id,
+        name=db_user.name,
+        email=EmailAddress(db_user.email),
+        active=db_user.active,
+        created_at=db_user.created_at,
+        updated_at=db_user.updated_at,
+    )
+
+
+def row_to_response_dto(row: Row) -> UserResponseDto:
+    """
+    Map a ``users`` result row straight to a response DTO.
+
+    Rows were validated when written, so no entity or value object is
+    built. The row must be selected with ``user_columns()``: its leading
+    columns are then all columns in ``USER_FIELDS`` order, which is the
+    DTO's field order; trailing ones (e.g. ``total_count``) are ignored.
+    """
+    return UserResponseDto(*row[:USER_FIELD_COUNT])
+
+
+def row_to_fields(row: Row, fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    Convert a partial ``users`` result row to a dict of ``fields``.
+
+    The row's leading columns are ``fields``, in order.
+    """
+    return dict(zip(fields, row))
+
+
+def rows_to_page(
+    rows: Iterable[Row], fields: Optional[Sequence[str]]
+) -> List[UserRow]:
+    """Convert rows of a page to DTOs, or dicts of ``fields``."""
+    if fields is None:
+        return [row_to_response_dto(row) for row in rows]
+    return [row_to_fields(row, fields) for row in rows]
+
 
 class UserRepositoryPostgresAdapter(UserRepositoryPort):
     """PostgreSQL implementation of UserRepositoryPort."""
@@ -20,62 +607,253 @@ class UserRepositoryPostgresAdapter(UserRepositoryPort):
         self._db = db
 
     def create(self, user: User) -> User:
-        """Create a new user."""
-        db_user = UserModel(
-            name=user.name,
-            email=str(user.email),
-            active=user.active,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
+        """
+        Create a new user.
+
+        Relies on the unique email index instead of a read-before-write:
+        one ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING`` both
+        creates the user and detects a taken email, race free.
+        """
+        statement = (
+            insert_ignoring_duplicate_emails(self._dialect_name)
+            .values(to_insert_row(user))
+            .returning(*UserModel.__table__.c)
         )
-        self._db.add(db_user)
+        row = self._db.execute(statement).first()
         self._db.commit()
-        self._db.refresh(db_user)
+        if not row:
+            raise DuplicateEmailError(str(user.email))
+
+        return row_to_domain_entity(row)
 
-        return self._to_domain_entity(db_user)
+    def upsert_by_email(self, user: User) -> Tuple[User, bool]:
+        """Create or update a user by email in one statement."""
+        row = self._db.execute(
+            build_upsert_by_email_statement(self._dialect_name, user)
+        ).one()
+        self._db.commit()
+        return row_to_domain_entity(row), bool(row.inserted)
+
+    def create_many(self, users: Sequence[User]) -> List[Optional[User]]:
+        """Create many users with multi-row inserts in one transaction."""
+        statement = insert_ignoring_duplicate_emails(
+            self._dialect_name
+        ).returning(*UserModel.__table__.c)
+
+        created_by_email = {}
+        try:
+            for start in range(0, len(users), INSERT_BATCH_SIZE):
+                batch = users[start:start + INSERT_BATCH_SIZE]
+                rows = self._db.execute(
+                    statement.values([to_insert_row(user) for user in batch])
+                )
+                for row in rows:
+                    created_by_email[row.email] = row_to_domain_entity(
+                        row
+                    )
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+
+        return [created_by_email.get(str(user.email)) for user in users]
+
+    def import_users(
+        self, chunks: Iterable[Sequence[User]], upsert: bool = False
+    ) -> Tuple[int, int]:
+        """
+        Load users in one transaction, consuming ``chunks`` lazily.
+
+        On PostgreSQL every user is streamed with ``COPY`` into a temporary
+        staging table, which is then merged into ``users`` with a single
+        ``INSERT ... SELECT ... ON CONFLICT (email)``. Other databases get
+        multi-row ``INSERT ... ON CONFLICT`` statements per chunk.
+        """
+        try:
+            if self._dialect_name == "postgresql":
+                counts = self._copy_import(chunks, upsert)
+            else:
+                counts = self._insert_import(chunks, upsert)
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+        return counts
 
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by id."""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.id == user_id)
-            .first()
-        )
-        if not db_user:
+        row = self._db.execute(build_get_by_id_statement(user_id)).first()
+        if not row:
             return None
-        return self._to_domain_entity(db_user)
+        return row_to_domain_entity(row)
+
+    def get_response_by_id(
+        self, user_id: int
+    ) -> Optional[UserResponseDto]:
+        """Get a user by id mapped straight from its row to a DTO."""
+        row = self._db.execute(build_get_by_id_statement(user_id)).first()
+        if not row:
+            return None
+        return row_to_response_dto(row)
+
+    def get_fields_by_id(
+        self, user_id: int, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get only some columns of a user by id."""
+        row = self._db.execute(
+            build_get_by_id_statement(user_id, fields)
+        ).first()
+        if not row:
+            return None
+        return row_to_fields(row, fields)
+
+    def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """
+        Get the users with the given ids in a single query.
+
+        Users come in no particular order; ids without a user are left out.
+        """
+        if not user_ids:
+            return []
+        rows = self._db.execute(
+            build_get_many_statement(user_ids, self._dialect_name)
+        )
+        return [row_to_domain_entity(row) for row in rows]
+
+    def get_many_responses(
+        self, user_ids: Sequence[int]
+    ) -> List[UserResponseDto]:
+        """Get the users with the given ids as DTOs in a single query."""
+        if not user_ids:
+            return []
+        rows = self._db.execute(
+            build_get_many_statement(user_ids, self._dialect_name)
+        )
+        return [row_to_response_dto(row) for row in rows]
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.email == email)
-            .first()
-        )
-        if not db_user:
+        row = self._db.execute(build_get_by_email_statement(email)).first()
+        if not row:
             return None
-        return self._to_domain_entity(db_user)
+        return row_to_domain_entity(row)
+
+    def get_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """Get which of the given emails already belong to a user."""
+        rows: Iterable[str] = self._db.scalars(
+            select(UserModel.email).where(
+                email_in(emails, self._dialect_name)
+            )
+        )
+        return set(rows)
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination."""
-        db_users = (
-            self._db.query(UserModel).offset(skip).limit(limit).all()
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+    ) -> List[User]:
+        """Get all users ordered by id with offset or keyset pagination."""
+        rows = self._db.execute(
+            build_get_all_statement(skip, limit, after_id, filters)
         )
-        return [
-            self._to_domain_entity(db_user)
-            for db_user in db_users
-        ]
+        return [row_to_domain_entity(row) for row in rows]
+
+    def get_all_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        filters: Optional[UserFilterDto] = None,
+        fields: Optional[Sequence[str]] = None,
+        with_count: bool = False,
+    ) -> Tuple[List[UserRow], Optional[int]]:
+        """
+        Get a page of users as DTOs or dicts of ``fields``.
+
+        With ``with_count`` the exact count comes with the page, in one
+        query.
+        """
+        if not with_count:
+            result = self._db.execute(
+                build_get_all_statement(skip, limit, after_id, filters, fields)
+            )
+            return rows_to_page(result, fields), None
+        rows = self._db.execute(
+            build_get_all_with_count_statement(
+                skip, limit, after_id, filters, fields
+            )
+        ).all()
+        if not rows:
+            # Past the last page no row carries the count
+            total_count = self._db.execute(
+                build_count_statement(filters)
+            ).scalar()
+            return [], total_count
+        return rows_to_page(rows, fields), rows[0].total_count
+
+    def estimate_count(self, filters: Optional[UserFilterDto] = None) -> int:
+        """
+        Estimate how many users match ``filters`` from planner statistics.
+
+        On PostgreSQL the whole table estimate comes from ``pg_class``, and
+        filtered ones from ``EXPLAIN``; nothing is scanned. Other databases
+        count exactly.
+        """
+        if self._dialect_name != "postgresql":
+            return self._db.execute(
+                build_count_statement(filters)
+            ).scalar_one()
+        if not filter_conditions(filters):
+            estimate = self._db.execute(ESTIMATE_USERS_COUNT).scalar()
+            if estimate is not None:
+                return estimate
+        return self._explain_row_estimate(
+            select(UserModel.id).where(*filter_conditions(filters))
+        )
+
+    def search(self, query: str, limit: int = 20) -> List[User]:
+        """
+        Search users by partial name or email, best matches first.
+
+        Ranked by the pg_trgm indexes on PostgreSQL; elsewhere every match
+        is ranked in memory.
+        """
+        rows = self._db.execute(
+            build_search_statement(query, limit, self._dialect_name)
+        )
+        users = (row_to_domain_entity(row) for row in rows)
+        if self._dialect_name == "postgresql":
+            return list(users)
+        return rank_by_similarity(users, query, limit)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[User]:
+        """Iterate over all users ordered by id from a server-side cursor."""
+        result = self._db.execute(build_iter_all_statement(batch_size))
+        try:
+            for row in result:
+                yield row_to_domain_entity(row)
+        finally:
+            result.close()
+
+    def iter_all_fields(
+        self, fields: Sequence[str], batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over some columns of all users ordered by id."""
+        result = self._db.execute(build_iter_all_statement(batch_size, fields))
+        try:
+            for row in result:
+                yield row_to_fields(row, fields)
+        finally:
+            result.close()
 
     def update(self, user: User) -> User:
         """Update an existing user."""
         if not user.id:
             raise ValueError("User id is required for update")
 
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.id == user.id)
-            .first()
-        )
+        db_user = self._db.get(UserModel, user.id)
         if not db_user:
             raise ValueError(f"User with id {user.id} not found")
 
@@ -87,30 +865,103 @@ class UserRepositoryPostgresAdapter(UserRepositoryPort):
         self._db.commit()
         self._db.refresh(db_user)
 
-        return self._to_domain_entity(db_user)
+        return model_to_domain_entity(db_user)
 
-    def delete(self, user_id: int) -> bool:
-        """Delete a user by id."""
-        db_user = (
-            self._db.query(UserModel)
-            .filter(UserModel.id == user_id)
-            .first()
-        )
-        if not db_user:
-            return False
+    def update_fields(
+        self,
+        user_id: int,
+        changes: Mapping[str, Any],
+        expected: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[User]:
+        """Apply a partial update with one UPDATE ... RETURNING."""
+        try:
+            row = self._db.execute(
+                build_update_fields_statement(user_id, changes, expected)
+            ).first()
+            self._db.commit()
+        except IntegrityError as e:
+            self._db.rollback()
+            if "email" in changes:
+                raise DuplicateEmailError(changes["email"]) from e
+            raise
+        if not row:
+            return None
+        return row_to_domain_entity(row)
 
-        self._db.delete(db_user)
+    def delete(self, user_id: int) -> bool:
+        """Delete a user by id with one DELETE ... RETURNING id."""
+        deleted_id = self._db.execute(
+            delete(UserModel.__table__)
+            .where(UserModel.id == user_id)
+            .returning(UserModel.id)
+        ).scalar()
         self._db.commit()
-        return True
-
-    @staticmethod
-    def _to_domain_entity(db_user: UserModel) -> User:
-        """Convert database model to domain entity."""
-        return User(
-            id=db_user.id,
-            name=db_user.name,
-            email=EmailAddress(db_user.email),
-            active=db_user.active,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at,
-        )
+        return deleted_id is not None
+
+    def _copy_import(
+        self, chunks: Iterable[Sequence[User]], upsert: bool
+    ) -> Tuple[int, int]:
+        """Import through COPY into a staging table and one merge."""
+        connection = self._db.connection()
+        connection.exec_driver_sql(CREATE_IMPORT_STAGING_TABLE)
+        # psycopg connection, for its COPY support
+        driver_connection: Any = connection.connection.driver_connection
+        cursor = driver_connection.cursor()
+        ordinal = 0
+        with cursor.copy(COPY_IMPORT_STAGING) as copy:
+            for chunk in chunks:
+                for user in chunk:
+                    ordinal += 1
+                    copy.write_row(to_staging_row(ordinal, user))
+        counts = connection.execute(build_import_merge_statement(upsert))
+        row = counts.one()
+        return row.created, row.updated
+
+    def _insert_import(
+        self, chunks: Iterable[Sequence[User]], upsert: bool
+    ) -> Tuple[int, int]:
+        """
+        Import through multi-row INSERT ... ON CONFLICT statements.
+
+        Unlike the COPY merge, an email repeated in different chunks is
+        counted once per chunk on upsert.
+        """
+        statement = (
+            insert_updating_duplicate_emails(self._dialect_name)
+            if upsert
+            else insert_ignoring_duplicate_emails(self._dialect_name)
+        ).returning(UserModel.id)
+
+        created = updated = 0
+        for chunk in chunks:
+            users = unique_by_email(chunk, keep_last=upsert)
+            for start in range(0, len(users), INSERT_BATCH_SIZE):
+                batch = users[start:start + INSERT_BATCH_SIZE]
+                existing = (
+                    len(
+                        self.get_existing_emails(
+                            [str(user.email) for user in batch]
+                        )
+                    )
+                    if upsert
+                    else 0
+                )
+                merged = self._db.execute(
+                    statement, [to_insert_row(user) for user in batch]
+                ).all()
+                created += len(merged) - existing
+                updated += existing
+        return created, updated
+
+    def _explain_row_estimate(self, statement: Any) -> int:
+        """Get the planner's estimated row count of ``statement``."""
+        compiled = statement.compile(dialect=self._db.get_bind().dialect)
+        plan: Any = self._db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @property
+    def _dialect_name(self) -> str:
+        """Name of the SQL dialect the session is bound to."""
+        return self._db.get_bind().dialect.name
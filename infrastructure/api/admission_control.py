@@ -0,0 +1,229 @@
+"""Adaptive admission control: bounded in-flight requests per route class."""
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Mapping, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.config.settings import settings
+from infrastructure.prometheus import render_samples
+
+READ = "read"
+WRITE = "write"
+BULK = "bulk"
+
+# Only the users API is admission controlled; health checks, docs and
+# metrics must answer even under overload
+LIMITED_PREFIX = "/users"
+READ_METHODS = frozenset({"GET", "HEAD"})
+# POST routes that only read
+READ_PATHS = frozenset({"/users/batch-get"})
+# Long-running routes, whose latency says nothing about the database
+BULK_PATHS = frozenset({"/users/bulk", "/users/export", "/users/import"})
+
+SHED_DETAIL = "Server overloaded, retry later"
+
+
+def route_class(method: str, path: str) -> Optional[str]:
+    """Get the route class of a request, or None if it is not limited."""
+    if path != LIMITED_PREFIX and not path.startswith(f"{LIMITED_PREFIX}/"):
+        return None
+    if path in BULK_PATHS:
+        return BULK
+    if method in READ_METHODS or path in READ_PATHS:
+        return READ
+    if method == "OPTIONS":
+        return None
+    return WRITE
+
+
+@dataclass
+class AdmissionStats:
+    """Counters of an admission limiter."""
+
+    admitted: int = 0
+    shed: int = 0
+
+
+class AdaptiveLimiter:
+    """
+    Limit of concurrent requests, adapted to their latency (AIMD).
+
+    A request is admitted while fewer than ``limit`` are in flight. When
+    one finishes within ``latency_target_seconds`` while the limit is at
+    least half used, the limit grows additively by ``1 / limit``, about
+    one per ``limit`` requests. When one is slower or fails, the limit is
+    multiplied by ``backoff_ratio``, at most once per generation: requests
+    admitted before the last decrease do not decrease it again. Without a
+    latency target the limit is fixed. Meant for one event loop; not
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target_seconds: Optional[float],
+        backoff_ratio: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter with no request in flight."""
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.stats = AdmissionStats()
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_target_seconds = latency_target_seconds
+        self._backoff_ratio = backoff_ratio
+        self._clock = clock
+        self._last_decrease = float("-inf")
+
+    def try_acquire(self) -> Optional[float]:
+        """
+        Admit a request if the limit allows it.
+
+        Returns:
+            When the request was admitted, to pass to ``release``, or None
+            if it must be shed.
+        """
+        if self.in_flight >= int(self.limit):
+            self.stats.shed += 1
+            return None
+        self.in_flight += 1
+        self.stats.admitted += 1
+        return self._clock()
+
+    def release(self, admitted_at: float, failed: bool = False) -> None:
+        """Record that a request admitted at ``admitted_at`` finished."""
+        now = self._clock()
+        busy = self.in_flight * 2 >= self.limit
+        self.in_flight -= 1
+        if self._latency_target_seconds is None:
+            return
+        if failed or now - admitted_at > self._latency_target_seconds:
+            if admitted_at >= self._last_decrease:
+                self.limit = max(
+                    float(self._min_limit), self.limit * self._backoff_ratio
+                )
+                self._last_decrease = now
+        elif busy:
+            self.limit = min(
+                float(self._max_limit), self.limit + 1 / self.limit
+            )
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware shedding the requests over their route class's limit.
+
+    Shed requests get an immediate 503 with ``Retry-After`` instead of
+    waiting for a threadpool worker or a pooled connection. A request
+    counts as in flight until its response is fully sent; it failed if it
+    raised or answered with a 5xx status.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiters: Mapping[str, AdaptiveLimiter],
+        retry_after_seconds: int = 1,
+        classify: Callable[[str, str], Optional[str]] = route_class,
+    ) -> None:
+        """Initialize the middleware in front of ``app``."""
+        self.app = app
+        self._limiters = limiters
+        self._retry_after_seconds = retry_after_seconds
+        self._classify = classify
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Admit, or shed, an HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = self._classify(scope["method"], scope["path"])
+        limiter = None if name is None else self._limiters.get(name)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        admitted_at = limiter.try_acquire()
+        if admitted_at is None:
+            response = JSONResponse(
+                {"detail": SHED_DETAIL},
+                status_code=503,
+                headers={"Retry-After": str(self._retry_after_seconds)},
+            )
+            await response(scope, receive, send)
+            return
+
+        failed = True
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal failed
+            if message["type"] == "http.response.start":
+                failed = message["status"] >= 500
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            limiter.release(admitted_at, failed=failed)
+
+
+@lru_cache(maxsize=1)
+def get_admission_limiters() -> Dict[str, AdaptiveLimiter]:
+    """Get the process-wide limiters of every route class."""
+    latency_target_seconds = settings.admission_latency_target_ms / 1000
+
+    def adaptive() -> AdaptiveLimiter:
+        return AdaptiveLimiter(
+            initial_limit=settings.admission_initial_limit,
+            min_limit=settings.admission_min_limit,
+            max_limit=settings.admission_max_limit,
+            latency_target_seconds=latency_target_seconds,
+            backoff_ratio=settings.admission_backoff_ratio,
+        )
+
+    bulk_limit = settings.admission_bulk_limit
+    return {
+        READ: adaptive(),
+        WRITE: adaptive(),
+        BULK: AdaptiveLimiter(bulk_limit, bulk_limit, bulk_limit, None),
+    }
+
+
+METRICS = {
+    "admission_limit": ("gauge", "Current in-flight request limit."),
+    "admission_in_flight": ("gauge", "Requests currently in flight."),
+    "admission_admitted_total": ("counter", "Requests admitted."),
+    "admission_shed_total": (
+        "counter",
+        "Requests rejected with 503 because the limit was reached.",
+    ),
+}
+
+
+def render_metrics(limiters: Mapping[str, AdaptiveLimiter]) -> str:
+    """Render the state of named limiters in Prometheus text format."""
+    return render_samples(
+        METRICS,
+        "route_class",
+        {
+            name: {
+                "admission_limit": int(limiter.limit),
+                "admission_in_flight": limiter.in_flight,
+                "admission_admitted_total": limiter.stats.admitted,
+                "admission_shed_total": limiter.stats.shed,
+            }
+            for name, limiter in limiters.items()
+        },
+    )
@@ -0,0 +1,21 @@
+"""API response classes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+
+    Dataclasses (response DTOs), dicts and datetimes are serialized
+    natively, without ``jsonable_encoder`` or a Pydantic model. UTC
+    datetimes end in ``Z`` like Pydantic renders them, so the payload is
+    the same as with the response models.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode ``content`` as JSON."""
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
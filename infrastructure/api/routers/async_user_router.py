@@ -0,0 +1,603 @@
+"""Async user router."""
+
+import io
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import iterate_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.application.dto.user_dto import (
+    CreateUserDto,
+    UpdateUserDto,
+    UserFilterDto,
+    UserResponseDto,
+    normalize_fields,
+)
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.use_cases.async_bulk_create_users_use_case import (
+    AsyncBulkCreateUsersUseCase,
+)
+from core.application.use_cases.async_create_user_use_case import (
+    AsyncCreateUserUseCase,
+)
+from core.application.use_cases.async_delete_user_use_case import (
+    AsyncDeleteUserUseCase,
+)
+from core.application.use_cases.async_export_users_use_case import (
+    AsyncExportUsersUseCase,
+)
+from core.application.use_cases.async_get_many_users_use_case import (
+    AsyncGetManyUsersUseCase,
+)
+from core.application.use_cases.async_get_user_use_case import (
+    AsyncGetUserUseCase,
+)
+from core.application.use_cases.async_import_users_use_case import (
+    AsyncImportUsersUseCase,
+)
+from core.application.use_cases.async_list_users_use_case import (
+    AsyncListUsersUseCase,
+)
+from core.application.use_cases.async_search_users_use_case import (
+    AsyncSearchUsersUseCase,
+)
+from core.application.use_cases.async_update_user_use_case import (
+    AsyncUpdateUserUseCase,
+)
+from core.application.use_cases.import_users_use_case import (
+    IMPORT_CHUNK_SIZE,
+    ImportUsersUseCase,
+)
+from core.application.use_cases.search_users_use_case import (
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_MAX_LIMIT,
+    SEARCH_MIN_LENGTH,
+)
+from infrastructure.adapters.batching.write_batcher import AsyncWriteBatcher
+from infrastructure.adapters.cache.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.cache.single_flight import AsyncSingleFlight
+from infrastructure.adapters.files.user_file_reader import read_user_rows
+from infrastructure.adapters.repositories.async_batching_user_repository_adapter import (  # noqa: E501
+    AsyncBatchingUserRepositoryAdapter,
+)
+from infrastructure.adapters.repositories.async_cached_user_repository_adapter import (  # noqa: E501
+    AsyncCachedUserRepositoryAdapter,
+)
+from infrastructure.adapters.repositories.async_single_flight_user_repository_adapter import (  # noqa: E501
+    AsyncSingleFlightUserRepositoryAdapter,
+)
+from infrastructure.adapters.repositories.async_user_repository_postgres_adapter import (  # noqa: E501
+    AsyncUserRepositoryPostgresAdapter,
+)
+from infrastructure.api.responses import FastJSONResponse
+from infrastructure.api.routers.user_router import (
+    COUNT_DESCRIPTION,
+    EXPORT_BATCH_SIZE,
+    EXPORT_COLUMNS,
+    EXPORT_RESPONSES,
+    IMPORT_OPENAPI_EXTRA,
+    IMPORT_READ_BUFFER_SIZE,
+    RequestBodyReader,
+    build_bulk_create_response,
+    build_export_response,
+    build_import_response,
+    build_json_response,
+    build_user_filters,
+    encode_export_header,
+    encode_export_rows,
+    parse_user_fields,
+    set_page_headers,
+)
+from infrastructure.api.schemas.user_schema import (
+    BATCH_GET_MAX_IDS,
+    BatchGetUsersResponseSchema,
+    BatchGetUsersSchema,
+    BulkCreateUsersResponseSchema,
+    BulkCreateUsersSchema,
+    CreateUserSchema,
+    ImportUsersResponseSchema,
+    TotalCountMode,
+    UpdateUserSchema,
+    UserFileFormat,
+    UserResponseSchema,
+)
+from infrastructure.config.settings import settings
+from infrastructure.database.async_session import (
+    get_async_read_db,
+    get_async_session_factory,
+    get_async_write_db,
+)
+from infrastructure.database.session import reads_replica, wrote_recently
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+@lru_cache(maxsize=1)
+def get_async_user_cache() -> LruTtlCache:
+    """Get the process-wide user cache of the async request path."""
+    return LruTtlCache(
+        max_entries=settings.user_cache_max_entries,
+        ttl_seconds=settings.user_cache_ttl_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_user_write_batcher() -> AsyncWriteBatcher:
+    """Get the process-wide batcher of async user creates."""
+    return AsyncWriteBatcher(
+        max_size=settings.user_write_batch_max_rows,
+        max_wait_seconds=settings.user_write_batch_max_wait_ms / 1000,
+    )
+
+
+def get_async_user_repository(
+    db: AsyncSession = Depends(get_async_write_db),
+) -> AsyncUserRepositoryPort:
+    """
+    Get async user repository on the primary database, for writes.
+
+    See ``get_user_repository`` for write batching; batches are written on
+    sessions of their own.
+    """
+    repository = build_async_user_repository(db)
+    if not settings.user_write_batch_enabled:
+        return repository
+    return AsyncBatchingUserRepositoryAdapter(
+        repository,
+        get_async_user_write_batcher(),
+        open_async_repository,
+    )
+
+
+@asynccontextmanager
+async def open_async_repository() -> AsyncIterator[AsyncUserRepositoryPort]:
+    """Open an async user repository on a primary session of its own."""
+    async with get_async_session_factory()() as db:
+        yield build_async_user_repository(db)
+
+
+@lru_cache(maxsize=1)
+def get_async_user_single_flight() -> AsyncSingleFlight:
+    """Get the process-wide group coalescing async user lookups."""
+    return AsyncSingleFlight()
+
+
+def get_async_read_user_repository(
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> AsyncUserRepositoryPort:
+    """
+    Get async user repository on a read replica when available.
+
+    See ``get_read_user_repository`` for single-flight and the cache.
+    """
+    fresh = wrote_recently(request)
+    repository = build_async_user_repository(
+        db, cached=not (fresh or reads_replica(db))
+    )
+    if not settings.user_single_flight_enabled or fresh:
+        return repository
+    return AsyncSingleFlightUserRepositoryAdapter(
+        repository, get_async_user_single_flight()
+    )
+
+
+def build_async_user_repository(
+    db: AsyncSession, cached: bool = True
+) -> AsyncUserRepositoryPort:
+    """Build the async user repository, behind the cache when enabled."""
+    repository = AsyncUserRepositoryPostgresAdapter(db)
+    if not (cached and settings.user_cache_enabled):
+        return repository
+    return AsyncCachedUserRepositoryAdapter(
+        repository,
+        get_async_user_cache(),
+        negative_ttl_seconds=settings.user_cache_negative_ttl_seconds,
+    )
+
+
+async def _iter_export_chunks(
+    users: AsyncIterator[Union[UserResponseDto, Dict[str, Any]]],
+    export_format: UserFileFormat,
+    columns: Sequence[str] = EXPORT_COLUMNS,
+) -> AsyncIterator[str]:
+    """Encode users in chunks of ``EXPORT_BATCH_SIZE`` rows."""
+    header = encode_export_header(export_format, columns)
+    if header:
+        yield header
+    batch: List[Union[UserResponseDto, Dict[str, Any]]] = []
+    async for user in users:
+        batch.append(user)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield encode_export_rows(batch, export_format, columns)
+            batch = []
+    if batch:
+        yield encode_export_rows(batch, export_format, columns)
+
+
+@router.post(
+    "",
+    response_model=UserResponseSchema,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_200_OK: {
+            "model": UserResponseSchema,
+            "description": "Existing user updated (upsert)",
+        },
+    },
+    summary="Create a new user",
+    description=(
+        "Create a new user with name, email, and active status. With "
+        "`upsert=true` the user that already has the email is updated "
+        "instead of failing, and `200` is returned instead of `201`."
+    ),
+)
+async def create_user(
+    response: Response,
+    schema: CreateUserSchema,
+    upsert: bool = False,
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_user_repository
+    ),
+) -> FastJSONResponse:
+    """Create a new user."""
+    try:
+        dto = CreateUserDto(
+            name=schema.name,
+            email=schema.email,
+            active=schema.active,
+        )
+        use_case = AsyncCreateUserUseCase(repository)
+        result, created = await use_case.execute(dto, upsert=upsert)
+        return build_json_response(
+            result,
+            response,
+            status_code=(
+                status.HTTP_201_CREATED if created else status.HTTP_200_OK
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateUsersResponseSchema,
+    summary="Create many users",
+    description=(
+        "Create up to 10000 users in one request. Rows are validated "
+        "individually and valid rows are inserted in a single transaction; "
+        "the response reports the created user or the error of every row."
+    ),
+)
+async def bulk_create_users(
+    schema: BulkCreateUsersSchema,
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_user_repository
+    ),
+) -> BulkCreateUsersResponseSchema:
+    """Create many users."""
+    dtos = [
+        CreateUserDto(name=item.name, email=item.email, active=item.active)
+        for item in schema.users
+    ]
+    use_case = AsyncBulkCreateUsersUseCase(repository)
+    return build_bulk_create_response(await use_case.execute(dtos))
+
+
+@router.post(
+    "/import",
+    response_model=ImportUsersResponseSchema,
+    summary="Import users from a file",
+    description=(
+        "Import users from an NDJSON or CSV (`name,email[,active]` header) "
+        "request body of any size, sent as is rather than as a form. The "
+        "body is parsed and validated as it arrives and loaded in a single "
+        "transaction; existing emails are skipped, or updated with "
+        "`upsert=true`. Rows that fail validation are counted and the "
+        "first 1000 are reported."
+    ),
+    openapi_extra=IMPORT_OPENAPI_EXTRA,
+)
+async def import_users(
+    request: Request,
+    import_format: UserFileFormat = Query(
+        UserFileFormat.NDJSON, alias="format"
+    ),
+    upsert: bool = False,
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_user_repository
+    ),
+) -> ImportUsersResponseSchema:
+    """Import users."""
+    body = io.BufferedReader(
+        RequestBodyReader(request), IMPORT_READ_BUFFER_SIZE
+    )
+    # Parsing is blocking and CPU bound, so chunks are parsed on the
+    # threadpool, which pulls the body from the event loop as it goes
+    chunks = iterate_in_threadpool(
+        ImportUsersUseCase.chunk_rows(
+            read_user_rows(body, import_format.value), IMPORT_CHUNK_SIZE
+        )
+    )
+    use_case = AsyncImportUsersUseCase(repository)
+    try:
+        result = await use_case.execute(chunks, upsert=upsert)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return build_import_response(result)
+
+
+@router.get(
+    "",
+    response_model=List[UserResponseSchema],
+    summary="List all users",
+    description=(
+        "Get a list of users ordered by id. Pages are fetched with keyset "
+        "pagination: pass the `X-Next-Cursor` response header back as "
+        "`cursor` to get the next page. `skip` is still supported for "
+        "backward compatibility but gets slower the deeper the page. "
+        "Filters narrow the listing; send the same filters with every "
+        "page. `fields` returns only some fields of each user."
+    ),
+)
+async def list_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    filters: Optional[UserFilterDto] = Depends(build_user_filters),
+    count: Optional[TotalCountMode] = Query(
+        None, description=COUNT_DESCRIPTION
+    ),
+    fields: Optional[List[str]] = Depends(parse_user_fields),
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_read_user_repository
+    ),
+) -> FastJSONResponse:
+    """List all users."""
+    if skip and cursor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="skip and cursor cannot be combined",
+        )
+    use_case = AsyncListUsersUseCase(
+        repository, exact_count_max_rows=settings.user_count_exact_max_rows
+    )
+    count_mode = count.value if count else None
+    try:
+        if skip:
+            page = await use_case.execute_offset_page(
+                skip=skip,
+                limit=limit,
+                filters=filters,
+                count=count_mode,
+                fields=fields,
+            )
+        else:
+            page = await use_case.execute_page(
+                cursor=cursor,
+                limit=limit,
+                filters=filters,
+                count=count_mode,
+                fields=fields,
+            )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    set_page_headers(response, page)
+    return build_json_response(page.items, response)
+
+
+@router.get(
+    "/search",
+    response_model=List[UserResponseSchema],
+    summary="Search users",
+    description=(
+        "Find users whose name or email contains `q` (case-insensitive, "
+        f"at least {SEARCH_MIN_LENGTH} characters), best matches first."
+    ),
+)
+async def search_users(
+    response: Response,
+    q: str = Query(..., min_length=SEARCH_MIN_LENGTH, max_length=255),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT),
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_read_user_repository
+    ),
+) -> FastJSONResponse:
+    """Search users by partial name or email."""
+    use_case = AsyncSearchUsersUseCase(repository)
+    try:
+        results = await use_case.execute(q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return build_json_response(results, response)
+
+
+@router.post(
+    "/batch-get",
+    response_model=BatchGetUsersResponseSchema,
+    summary="Get many users by ID",
+    description=(
+        f"Get up to {BATCH_GET_MAX_IDS} users by ID in one request and a "
+        "single query. Users come in the order of `ids`; ids without a "
+        "user are listed in `missing_ids`."
+    ),
+)
+async def batch_get_users(
+    response: Response,
+    schema: BatchGetUsersSchema,
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_read_user_repository
+    ),
+) -> FastJSONResponse:
+    """Get many users by id."""
+    use_case = AsyncGetManyUsersUseCase(repository)
+    result = await use_case.execute(schema.ids)
+    return build_json_response(result, response)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all users",
+    description=(
+        "Stream every user ordered by id as NDJSON (one JSON object per "
+        "line) or CSV. Rows are read from a server-side cursor and sent "
+        "as they are fetched, so any table size can be exported. "
+        "`fields` exports only some columns."
+    ),
+    responses=EXPORT_RESPONSES,
+)
+async def export_users(
+    export_format: UserFileFormat = Query(
+        UserFileFormat.NDJSON, alias="format"
+    ),
+    fields: Optional[List[str]] = Depends(parse_user_fields),
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_read_user_repository
+    ),
+) -> StreamingResponse:
+    """Export all users."""
+    try:
+        columns = normalize_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    use_case = AsyncExportUsersUseCase(repository)
+    if columns is None:
+        users = use_case.execute(batch_size=EXPORT_BATCH_SIZE)
+        chunks = _iter_export_chunks(users, export_format)
+    else:
+        rows = use_case.execute_fields(columns, batch_size=EXPORT_BATCH_SIZE)
+        chunks = _iter_export_chunks(rows, export_format, columns)
+    return build_export_response(chunks, export_format)
+
+
+@router.get(
+    "/{user_id}",
+    response_model=UserResponseSchema,
+    summary="Get user by ID",
+    description=(
+        "Get a specific user by its ID. `fields` returns only some of its "
+        "fields."
+    ),
+)
+async def get_user(
+    response: Response,
+    user_id: int,
+    fields: Optional[List[str]] = Depends(parse_user_fields),
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_read_user_repository
+    ),
+) -> FastJSONResponse:
+    """Get user by id."""
+    use_case = AsyncGetUserUseCase(repository)
+    if fields is not None:
+        try:
+            partial = await use_case.execute_fields(user_id, fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+        if partial is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with id {user_id} not found",
+            )
+        return build_json_response(partial, response)
+
+    result = await use_case.execute(user_id)
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {user_id} not found",
+        )
+    return build_json_response(result, response)
+
+
+@router.put(
+    "/{user_id}",
+    response_model=UserResponseSchema,
+    summary="Update user",
+    description="Update an existing user by its ID",
+)
+async def update_user(
+    response: Response,
+    user_id: int,
+    schema: UpdateUserSchema,
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_user_repository
+    ),
+) -> FastJSONResponse:
+    """Update user."""
+    try:
+        dto = UpdateUserDto(
+            name=schema.name,
+            email=schema.email,
+            active=schema.active,
+        )
+        use_case = AsyncUpdateUserUseCase(repository)
+        result = await use_case.execute(user_id, dto)
+        if not result:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with id {user_id} not found",
+            )
+        return build_json_response(result, response)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete user",
+    description="Delete a user by its ID",
+)
+async def delete_user(
+    user_id: int,
+    repository: AsyncUserRepositoryPort = Depends(
+        get_async_user_repository
+    ),
+) -> None:
+    """Delete user."""
+    use_case = AsyncDeleteUserUseCase(repository)
+    deleted = await use_case.execute(user_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {user_id} not found",
+        )
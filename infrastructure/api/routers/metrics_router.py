@@ -0,0 +1,91 @@
+"""Internal metrics router."""
+
+from typing import Dict, Union
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from infrastructure.adapters.batching import write_batcher
+from infrastructure.adapters.batching.write_batcher import (
+    AsyncWriteBatcher,
+    WriteBatcher,
+)
+from infrastructure.adapters.cache import lru_ttl_cache, single_flight
+from infrastructure.adapters.cache.single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+)
+from infrastructure.api import admission_control
+from infrastructure.api.routers.user_router import (
+    get_user_cache,
+    get_user_single_flight,
+    get_user_write_batcher,
+)
+from infrastructure.config.settings import settings
+from infrastructure.database import pool_metrics
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary=(
+        "Connection pool, cache, coalescing, batching and admission metrics"
+    ),
+    description=(
+        "Live statistics of every database connection pool of this process "
+        "in Prometheus text format: pool size, checked-out, idle and "
+        "overflow connections, checkout duration histogram, checkout "
+        "timeouts and connections opened and invalidated. Also, with the "
+        "user cache enabled, its hits, misses and evictions, how many "
+        "user lookups went through single-flight and how many of them "
+        "shared an identical lookup in flight, how many user creates were "
+        "batched in how many transactions, and, with admission control "
+        "enabled, the admission limit, requests in flight, admitted and "
+        "shed per route class."
+    ),
+    include_in_schema=False,
+)
+def metrics() -> PlainTextResponse:
+    """Get pool, cache, single-flight, write batcher and admission metrics."""
+    caches = {"users": get_user_cache()}
+    single_flight_groups: Dict[str, Union[SingleFlight, AsyncSingleFlight]] = {
+        "users": get_user_single_flight()
+    }
+    write_batchers: Dict[str, Union[WriteBatcher, AsyncWriteBatcher]] = {
+        "users": get_user_write_batcher()
+    }
+    if settings.database_async:
+        # Imported here so that sync deployments never load the async stack
+        from infrastructure.api.routers.async_user_router import (
+            get_async_user_cache,
+            get_async_user_single_flight,
+            get_async_user_write_batcher,
+        )
+
+        caches["users-async"] = get_async_user_cache()
+        single_flight_groups["users-async"] = get_async_user_single_flight()
+        write_batchers["users-async"] = get_async_user_write_batcher()
+    cache_metrics = ""
+    if settings.user_cache_enabled:
+        cache_metrics = lru_ttl_cache.render_metrics(caches)
+    single_flight_metrics = single_flight.render_metrics(
+        single_flight_groups
+    )
+    write_batcher_metrics = write_batcher.render_metrics(write_batchers)
+    admission_metrics = ""
+    if settings.admission_control_enabled:
+        admission_metrics = admission_control.render_metrics(
+            admission_control.get_admission_limiters()
+        )
+    return PlainTextResponse(
+        pool_metrics.render_metrics()
+        + cache_metrics
+        + single_flight_metrics
+        + write_batcher_metrics
+        + admission_metrics,
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
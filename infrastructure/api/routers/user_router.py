@@ -1,12 +1,53 @@
 """User router."""
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+import io
+import json
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import anyio
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from core.application.dto.user_dto import (
+    USER_FIELDS,
+    BulkCreateUserResultDto,
     CreateUserDto,
+    ImportUsersResultDto,
     UpdateUserDto,
+    UserFilterDto,
+    UserPageDto,
+    UserResponseDto,
+    normalize_fields,
+)
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from core.application.use_cases.bulk_create_users_use_case import (
+    BulkCreateUsersUseCase,
 )
 from core.application.use_cases.create_user_use_case import (
     CreateUserUseCase,
@@ -14,48 +55,446 @@ from core.application.use_cases.create_user_use_case import (
 from core.application.use_cases.delete_user_use_case import (
     DeleteUserUseCase,
 )
+from core.application.use_cases.export_users_use_case import (
+    ExportUsersUseCase,
+)
+from core.application.use_cases.get_many_users_use_case import (
+    GetManyUsersUseCase,
+)
 from core.application.use_cases.get_user_use_case import (
     GetUserUseCase,
 )
+from core.application.use_cases.import_users_use_case import (
+    ImportUsersUseCase,
+)
 from core.application.use_cases.list_users_use_case import (
     ListUsersUseCase,
 )
+from core.application.use_cases.search_users_use_case import (
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_MAX_LIMIT,
+    SEARCH_MIN_LENGTH,
+    SearchUsersUseCase,
+)
 from core.application.use_cases.update_user_use_case import (
     UpdateUserUseCase,
 )
+from infrastructure.adapters.batching.write_batcher import WriteBatcher
+from infrastructure.adapters.cache.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.cache.single_flight import SingleFlight
+from infrastructure.adapters.files.user_file_reader import read_user_rows
+from infrastructure.adapters.repositories.batching_user_repository_adapter import (  # noqa: E501
+    BatchingUserRepositoryAdapter,
+)
+from infrastructure.adapters.repositories.cached_user_repository_adapter import (  # noqa: E501
+    CachedUserRepositoryAdapter,
+)
+from infrastructure.adapters.repositories.single_flight_user_repository_adapter import (  # noqa: E501
+    SingleFlightUserRepositoryAdapter,
+)
 from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
     UserRepositoryPostgresAdapter,
 )
+from infrastructure.api.responses import FastJSONResponse
 from infrastructure.api.schemas.user_schema import (
+    BATCH_GET_MAX_IDS,
+    BatchGetUsersResponseSchema,
+    BatchGetUsersSchema,
+    BulkCreateUserResultSchema,
+    BulkCreateUsersResponseSchema,
+    BulkCreateUsersSchema,
     CreateUserSchema,
+    ImportUserRejectionSchema,
+    ImportUsersResponseSchema,
+    TotalCountMode,
     UpdateUserSchema,
+    UserFileFormat,
     UserResponseSchema,
 )
-from infrastructure.database.session import get_db
+from infrastructure.config.settings import settings
+from infrastructure.database.session import (
+    get_read_db,
+    get_write_db,
+    reads_replica,
+    wrote_recently,
+)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_MODE_HEADER = "X-Total-Count-Mode"
+COUNT_DESCRIPTION = (
+    "Return the number of users matching the filters in `X-Total-Count`: "
+    "`exact` counts them in the same query as the page, `estimate` reads "
+    "the database statistics without scanning, `auto` counts exactly "
+    "unless the estimate is large. `X-Total-Count-Mode` tells which was "
+    "used."
+)
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return, among "
+    f"{', '.join(f'`{field}`' for field in USER_FIELDS)}; only those "
+    "columns are read. Defaults to all of them."
+)
+
+# Rows fetched per server-side cursor round trip and sent per body chunk
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = USER_FIELDS
+USER_FILE_MEDIA_TYPES = {
+    UserFileFormat.NDJSON: "application/x-ndjson",
+    UserFileFormat.CSV: "text/csv",
+}
+EXPORT_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "content": {
+            media_type: {} for media_type in USER_FILE_MEDIA_TYPES.values()
+        }
+    }
+}
+
+# Imports read the raw request body, documented here as a file upload
+IMPORT_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            media_type: {"schema": {"type": "string", "format": "binary"}}
+            for media_type in USER_FILE_MEDIA_TYPES.values()
+        },
+    }
+}
+IMPORT_READ_BUFFER_SIZE = 1 << 16
+
+
+class RequestBodyReader(io.RawIOBase):
+    """
+    Blocking binary file over a streamed request body.
+
+    Meant to be read from a worker thread (e.g. under
+    ``run_in_threadpool``): each read pulls the next body chunk from the
+    event loop, so an upload is received as fast as it is parsed and is
+    never buffered whole.
+    """
+
+    def __init__(self, request: Request) -> None:
+        """Initialize reader over the body of ``request``."""
+        self._chunks = request.stream().__aiter__()
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        """Return True; the body can be read."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read body bytes into ``buffer``; 0 means the body ended."""
+        while not self._pending:
+            chunk = anyio.from_thread.run(self._next_chunk)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    async def _next_chunk(self) -> Optional[bytes]:
+        """Receive the next body chunk, or None at the end of the body."""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+
+
+@lru_cache(maxsize=1)
+def get_user_cache() -> LruTtlCache:
+    """Get the process-wide user cache."""
+    return LruTtlCache(
+        max_entries=settings.user_cache_max_entries,
+        ttl_seconds=settings.user_cache_ttl_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_user_write_batcher() -> WriteBatcher:
+    """Get the process-wide batcher of user creates."""
+    return WriteBatcher(
+        max_size=settings.user_write_batch_max_rows,
+        max_wait_seconds=settings.user_write_batch_max_wait_ms / 1000,
+    )
+
 
 def get_user_repository(
-    db: Session = Depends(get_db),
-) -> UserRepositoryPostgresAdapter:
-    """Get user repository adapter."""
-    return UserRepositoryPostgresAdapter(db)
+    db: Session = Depends(get_write_db),
+) -> UserRepositoryPort:
+    """
+    Get user repository on the primary database, for writes.
+
+    With write batching enabled, concurrent creates share one transaction.
+    """
+    repository = build_user_repository(db)
+    if not settings.user_write_batch_enabled:
+        return repository
+    return BatchingUserRepositoryAdapter(
+        repository, get_user_write_batcher()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_user_single_flight() -> SingleFlight:
+    """Get the process-wide group coalescing user lookups."""
+    return SingleFlight()
+
+
+def get_read_user_repository(
+    request: Request,
+    db: Session = Depends(get_read_db),
+) -> UserRepositoryPort:
+    """
+    Get user repository on a read replica when available, for reads.
+
+    With single-flight enabled, identical lookups in flight are shared,
+    except for clients that wrote recently: they must read their writes.
+    For the same reason they bypass the user cache, which may hold a row
+    from before their write; so do replica reads, which could fill the
+    cache with a row older than a write through the primary.
+    """
+    fresh = wrote_recently(request)
+    repository = build_user_repository(
+        db, cached=not (fresh or reads_replica(db))
+    )
+    if not settings.user_single_flight_enabled or fresh:
+        return repository
+    return SingleFlightUserRepositoryAdapter(
+        repository, get_user_single_flight()
+    )
+
+
+def build_user_repository(
+    db: Session, cached: bool = True
+) -> UserRepositoryPort:
+    """Build the user repository adapter, behind the cache when enabled."""
+    repository = UserRepositoryPostgresAdapter(db)
+    if not (cached and settings.user_cache_enabled):
+        return repository
+    return CachedUserRepositoryAdapter(
+        repository,
+        get_user_cache(),
+        negative_ttl_seconds=settings.user_cache_negative_ttl_seconds,
+    )
+
+
+def build_user_filters(
+    active: Optional[bool] = Query(
+        None, description="Only active (true) or inactive (false) users"
+    ),
+    created_after: Optional[datetime] = Query(
+        None, description="Only users created at or after this time"
+    ),
+    created_before: Optional[datetime] = Query(
+        None, description="Only users created before this time"
+    ),
+    updated_since: Optional[datetime] = Query(
+        None, description="Only users updated at or after this time"
+    ),
+) -> Optional[UserFilterDto]:
+    """Get the listing filters from the query string, None if unfiltered."""
+    filters = UserFilterDto(
+        active=active,
+        created_after=created_after,
+        created_before=created_before,
+        updated_since=updated_since,
+    )
+    if filters == UserFilterDto():
+        return None
+    return filters
+
+
+def parse_user_fields(
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+) -> Optional[List[str]]:
+    """Get the sparse fieldset from the query string, None for all."""
+    if fields is None:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def build_json_response(
+    content: Any,
+    response: Response,
+    status_code: int = status.HTTP_200_OK,
+) -> FastJSONResponse:
+    """
+    Encode response DTOs, or sparse fieldset dicts, straight to JSON.
+
+    Returning a response skips the route's response model: DTOs are built
+    from validated domain entities, so validating them again as schemas
+    would only cost CPU. The response model still documents the route.
+    Headers and cookies set on the route's injected ``response`` (e.g. by
+    dependencies) are kept, as FastAPI does for returned values.
+    """
+    json_response = FastJSONResponse(content, status_code=status_code)
+    json_response.headers.raw.extend(response.headers.raw)
+    return json_response
+
+
+def set_page_headers(response: Response, page: UserPageDto) -> None:
+    """Expose a page's next cursor and total count as response headers."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total_count is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(page.total_count)
+        response.headers[TOTAL_COUNT_MODE_HEADER] = (
+            page.total_count_mode or ""
+        )
+
+
+def build_bulk_create_response(
+    results: List[BulkCreateUserResultDto],
+) -> BulkCreateUsersResponseSchema:
+    """Map bulk create results to the response schema."""
+    created = sum(1 for result in results if result.user is not None)
+    return BulkCreateUsersResponseSchema(
+        created=created,
+        failed=len(results) - created,
+        results=[
+            BulkCreateUserResultSchema(
+                index=result.index,
+                user=(
+                    UserResponseSchema.model_validate(result.user)
+                    if result.user
+                    else None
+                ),
+                error=result.error,
+            )
+            for result in results
+        ],
+    )
+
+
+def build_import_response(
+    result: ImportUsersResultDto,
+) -> ImportUsersResponseSchema:
+    """Map an import result to the response schema."""
+    return ImportUsersResponseSchema(
+        received=result.received,
+        created=result.created,
+        updated=result.updated,
+        skipped=result.skipped,
+        rejected=result.rejected,
+        rejections=[
+            ImportUserRejectionSchema(
+                line=rejection.line, error=rejection.error
+            )
+            for rejection in result.rejections
+        ],
+    )
+
+
+def encode_export_header(
+    export_format: UserFileFormat, columns: Sequence[str] = EXPORT_COLUMNS
+) -> str:
+    """Encode what precedes the rows of an export (the CSV header)."""
+    if export_format is UserFileFormat.CSV:
+        return _encode_csv([tuple(columns)])
+    return ""
+
+
+def encode_export_rows(
+    users: Iterable[Union[UserResponseDto, Dict[str, Any]]],
+    export_format: UserFileFormat,
+    columns: Sequence[str] = EXPORT_COLUMNS,
+) -> str:
+    """
+    Encode users as NDJSON lines or CSV records of ``columns``.
+
+    Users are response DTOs, or dicts of a sparse fieldset holding
+    ``columns``.
+    """
+    records = (_export_record(user, columns) for user in users)
+    if export_format is UserFileFormat.CSV:
+        return _encode_csv(records)
+    return "".join(
+        json.dumps(dict(zip(columns, record))) + "\n" for record in records
+    )
+
+
+def build_export_response(
+    chunks: Union[Iterator[str], AsyncIterable[str]],
+    export_format: UserFileFormat,
+) -> StreamingResponse:
+    """Wrap encoded export chunks in a downloadable streaming response."""
+    return StreamingResponse(
+        chunks,
+        media_type=USER_FILE_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f"attachment; filename=users.{export_format.value}"
+            )
+        },
+    )
+
+
+def _export_record(
+    user: Union[UserResponseDto, Dict[str, Any]], columns: Sequence[str]
+) -> tuple:
+    """Get the ``columns`` of a user, datetimes in ISO 8601."""
+    if isinstance(user, dict):
+        values = [user[column] for column in columns]
+    else:
+        values = [getattr(user, column) for column in columns]
+    return tuple(
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    )
+
+
+def _encode_csv(records: Iterable[tuple]) -> str:
+    """Encode records as CSV text."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(records)
+    return buffer.getvalue()
+
+
+def _iter_export_chunks(
+    users: Iterator[Union[UserResponseDto, Dict[str, Any]]],
+    export_format: UserFileFormat,
+    columns: Sequence[str] = EXPORT_COLUMNS,
+) -> Iterator[str]:
+    """Encode users in chunks of ``EXPORT_BATCH_SIZE`` rows."""
+    header = encode_export_header(export_format, columns)
+    if header:
+        yield header
+    while True:
+        batch = list(islice(users, EXPORT_BATCH_SIZE))
+        if not batch:
+            return
+        yield encode_export_rows(batch, export_format, columns)
 
 
 @router.post(
     "",
     response_model=UserResponseSchema,
     status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_200_OK: {
+            "model": UserResponseSchema,
+            "description": "Existing user updated (upsert)",
+        },
+    },
     summary="Create a new user",
-    description="Create a new user with name, email, and active status",
+    description=(
+        "Create a new user with name, email, and active status. With "
+        "`upsert=true` the user that already has the email is updated "
+        "instead of failing, and `200` is returned instead of `201`."
+    ),
 )
 def create_user(
+    response: Response,
     schema: CreateUserSchema,
-    repository: UserRepositoryPostgresAdapter = Depends(
+    upsert: bool = False,
+    repository: UserRepositoryPort = Depends(
         get_user_repository
     ),
-) -> UserResponseSchema:
+) -> FastJSONResponse:
     """Create a new user."""
     try:
         dto = CreateUserDto(
@@ -64,8 +503,14 @@ def create_user(
             active=schema.active,
         )
         use_case = CreateUserUseCase(repository)
-        result = use_case.execute(dto)
-        return UserResponseSchema(**result.__dict__)
+        result, created = use_case.execute(dto, upsert=upsert)
+        return build_json_response(
+            result,
+            response,
+            status_code=(
+                status.HTTP_201_CREATED if created else status.HTTP_200_OK
+            ),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -73,46 +518,272 @@ def create_user(
         ) from e
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkCreateUsersResponseSchema,
+    summary="Create many users",
+    description=(
+        "Create up to 10000 users in one request. Rows are validated "
+        "individually and valid rows are inserted in a single transaction; "
+        "the response reports the created user or the error of every row."
+    ),
+)
+def bulk_create_users(
+    schema: BulkCreateUsersSchema,
+    repository: UserRepositoryPort = Depends(
+        get_user_repository
+    ),
+) -> BulkCreateUsersResponseSchema:
+    """Create many users."""
+    dtos = [
+        CreateUserDto(name=item.name, email=item.email, active=item.active)
+        for item in schema.users
+    ]
+    use_case = BulkCreateUsersUseCase(repository)
+    return build_bulk_create_response(use_case.execute(dtos))
+
+
+@router.post(
+    "/import",
+    response_model=ImportUsersResponseSchema,
+    summary="Import users from a file",
+    description=(
+        "Import users from an NDJSON or CSV (`name,email[,active]` header) "
+        "request body of any size, sent as is rather than as a form. The "
+        "body is parsed and validated as it arrives and loaded in a single "
+        "transaction; existing emails are skipped, or updated with "
+        "`upsert=true`. Rows that fail validation are counted and the "
+        "first 1000 are reported."
+    ),
+    openapi_extra=IMPORT_OPENAPI_EXTRA,
+)
+async def import_users(
+    request: Request,
+    import_format: UserFileFormat = Query(
+        UserFileFormat.NDJSON, alias="format"
+    ),
+    upsert: bool = False,
+    repository: UserRepositoryPort = Depends(
+        get_user_repository
+    ),
+) -> ImportUsersResponseSchema:
+    """Import users."""
+    # The import runs on the threadpool like the sync routes, pulling the
+    # body from the event loop as it parses it
+    body = io.BufferedReader(
+        RequestBodyReader(request), IMPORT_READ_BUFFER_SIZE
+    )
+    use_case = ImportUsersUseCase(repository)
+    try:
+        result = await run_in_threadpool(
+            use_case.execute,
+            read_user_rows(body, import_format.value),
+            upsert,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return build_import_response(result)
+
+
 @router.get(
     "",
     response_model=List[UserResponseSchema],
     summary="List all users",
-    description="Get a list of all users with pagination support",
+    description=(
+        "Get a list of users ordered by id. Pages are fetched with keyset "
+        "pagination: pass the `X-Next-Cursor` response header back as "
+        "`cursor` to get the next page. `skip` is still supported for "
+        "backward compatibility but gets slower the deeper the page. "
+        "Filters narrow the listing; send the same filters with every "
+        "page. `fields` returns only some fields of each user."
+    ),
 )
 def list_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    repository: UserRepositoryPostgresAdapter = Depends(
-        get_user_repository
+    cursor: Optional[str] = None,
+    filters: Optional[UserFilterDto] = Depends(build_user_filters),
+    count: Optional[TotalCountMode] = Query(
+        None, description=COUNT_DESCRIPTION
     ),
-) -> List[UserResponseSchema]:
+    fields: Optional[List[str]] = Depends(parse_user_fields),
+    repository: UserRepositoryPort = Depends(
+        get_read_user_repository
+    ),
+) -> FastJSONResponse:
     """List all users."""
-    use_case = ListUsersUseCase(repository)
-    results = use_case.execute(skip=skip, limit=limit)
-    return [UserResponseSchema(**result.__dict__) for result in results]
+    if skip and cursor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="skip and cursor cannot be combined",
+        )
+    use_case = ListUsersUseCase(
+        repository, exact_count_max_rows=settings.user_count_exact_max_rows
+    )
+    count_mode = count.value if count else None
+    try:
+        if skip:
+            page = use_case.execute_offset_page(
+                skip=skip,
+                limit=limit,
+                filters=filters,
+                count=count_mode,
+                fields=fields,
+            )
+        else:
+            page = use_case.execute_page(
+                cursor=cursor,
+                limit=limit,
+                filters=filters,
+                count=count_mode,
+                fields=fields,
+            )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    set_page_headers(response, page)
+    return build_json_response(page.items, response)
+
+
+@router.get(
+    "/search",
+    response_model=List[UserResponseSchema],
+    summary="Search users",
+    description=(
+        "Find users whose name or email contains `q` (case-insensitive, "
+        f"at least {SEARCH_MIN_LENGTH} characters), best matches first."
+    ),
+)
+def search_users(
+    response: Response,
+    q: str = Query(..., min_length=SEARCH_MIN_LENGTH, max_length=255),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT),
+    repository: UserRepositoryPort = Depends(
+        get_read_user_repository
+    ),
+) -> FastJSONResponse:
+    """Search users by partial name or email."""
+    use_case = SearchUsersUseCase(repository)
+    try:
+        results = use_case.execute(q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return build_json_response(results, response)
+
+
+@router.post(
+    "/batch-get",
+    response_model=BatchGetUsersResponseSchema,
+    summary="Get many users by ID",
+    description=(
+        f"Get up to {BATCH_GET_MAX_IDS} users by ID in one request and a "
+        "single query. Users come in the order of `ids`; ids without a "
+        "user are listed in `missing_ids`."
+    ),
+)
+def batch_get_users(
+    response: Response,
+    schema: BatchGetUsersSchema,
+    repository: UserRepositoryPort = Depends(
+        get_read_user_repository
+    ),
+) -> FastJSONResponse:
+    """Get many users by id."""
+    use_case = GetManyUsersUseCase(repository)
+    return build_json_response(use_case.execute(schema.ids), response)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all users",
+    description=(
+        "Stream every user ordered by id as NDJSON (one JSON object per "
+        "line) or CSV. Rows are read from a server-side cursor and sent "
+        "as they are fetched, so any table size can be exported. "
+        "`fields` exports only some columns."
+    ),
+    responses=EXPORT_RESPONSES,
+)
+def export_users(
+    export_format: UserFileFormat = Query(
+        UserFileFormat.NDJSON, alias="format"
+    ),
+    fields: Optional[List[str]] = Depends(parse_user_fields),
+    repository: UserRepositoryPort = Depends(
+        get_read_user_repository
+    ),
+) -> StreamingResponse:
+    """Export all users."""
+    try:
+        columns = normalize_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    use_case = ExportUsersUseCase(repository)
+    # The sync iterator is advanced on the threadpool one chunk at a time,
+    # only after the previous chunk was sent; a disconnect stops it
+    if columns is None:
+        users = use_case.execute(batch_size=EXPORT_BATCH_SIZE)
+        chunks = _iter_export_chunks(users, export_format)
+    else:
+        rows = use_case.execute_fields(columns, batch_size=EXPORT_BATCH_SIZE)
+        chunks = _iter_export_chunks(rows, export_format, columns)
+    return build_export_response(chunks, export_format)
 
 
 @router.get(
     "/{user_id}",
     response_model=UserResponseSchema,
     summary="Get user by ID",
-    description="Get a specific user by its ID",
+    description=(
+        "Get a specific user by its ID. `fields` returns only some of its "
+        "fields."
+    ),
 )
 def get_user(
+    response: Response,
     user_id: int,
-    repository: UserRepositoryPostgresAdapter = Depends(
-        get_user_repository
+    fields: Optional[List[str]] = Depends(parse_user_fields),
+    repository: UserRepositoryPort = Depends(
+        get_read_user_repository
     ),
-) -> UserResponseSchema:
+) -> FastJSONResponse:
     """Get user by id."""
     use_case = GetUserUseCase(repository)
+    if fields is not None:
+        try:
+            partial = use_case.execute_fields(user_id, fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+        if partial is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with id {user_id} not found",
+            )
+        return build_json_response(partial, response)
+
     result = use_case.execute(user_id)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {user_id} not found",
         )
-    return UserResponseSchema(**result.__dict__)
+    return build_json_response(result, response)
 
 
 @router.put(
@@ -122,12 +793,13 @@ def get_user(
     description="Update an existing user by its ID",
 )
 def update_user(
+    response: Response,
     user_id: int,
     schema: UpdateUserSchema,
-    repository: UserRepositoryPostgresAdapter = Depends(
+    repository: UserRepositoryPort = Depends(
         get_user_repository
     ),
-) -> UserResponseSchema:
+) -> FastJSONResponse:
     """Update user."""
     try:
         dto = UpdateUserDto(
@@ -142,7 +814,7 @@ def update_user(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User with id {user_id} not found",
             )
-        return UserResponseSchema(**result.__dict__)
+        return build_json_response(result, response)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -158,7 +830,7 @@ def update_user(
 )
 def delete_user(
     user_id: int,
-    repository: UserRepositoryPostgresAdapter = Depends(
+    repository: UserRepositoryPort = Depends(
         get_user_repository
     ),
 ) -> None:
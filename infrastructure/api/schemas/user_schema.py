@@ -1,9 +1,13 @@
 """User API schemas."""
 
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
+BULK_CREATE_MAX_USERS = 10_000
+BATCH_GET_MAX_IDS = 1000
+
 ACTIVE_DESCRIPTION = "User active status"
 USER_NAME_DESCRIPTION = "User name"
 USER_EMAIL_DESCRIPTION = "User email"
@@ -74,6 +78,132 @@ class UserResponseSchema(BaseModel):
     updated_at: datetime = Field(..., description="Last update date")
 
 
+class BulkCreateUserItemSchema(BaseModel):
+    """
+    Schema for one row of a bulk create.
+
+    Fields are only type-checked here; name and email rules are applied per
+    row by the use case so one invalid row does not reject the whole batch.
+    """
+
+    name: str = Field(..., description=USER_NAME_DESCRIPTION)
+    email: str = Field(..., description=USER_EMAIL_DESCRIPTION)
+    active: bool = Field(default=True, description=ACTIVE_DESCRIPTION)
+
+
+class BulkCreateUsersSchema(BaseModel):
+    """Schema for creating many users at once."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "users": [
+                    {"name": "John Doe", "email": "john.doe@example.com"},
+                    {
+                        "name": "Jane Doe",
+                        "email": "jane.doe@example.com",
+                        "active": False,
+                    },
+                ]
+            }
+        }
+    )
+
+    users: List[BulkCreateUserItemSchema] = Field(
+        ...,
+        min_length=1,
+        max_length=BULK_CREATE_MAX_USERS,
+        description="Users to create",
+    )
+
+
+class BulkCreateUserResultSchema(BaseModel):
+    """Schema for the outcome of one row of a bulk create."""
+
+    index: int = Field(..., description="Position of the row in the request")
+    user: Optional[UserResponseSchema] = Field(
+        None, description="Created user, if the row succeeded"
+    )
+    error: Optional[str] = Field(
+        None, description="Error detail, if the row failed"
+    )
+
+
+class BulkCreateUsersResponseSchema(BaseModel):
+    """Schema for bulk create response."""
+
+    created: int = Field(..., description="Number of users created")
+    failed: int = Field(..., description="Number of rows that failed")
+    results: List[BulkCreateUserResultSchema] = Field(
+        ..., description="Per-row results in request order"
+    )
+
+
+class BatchGetUsersSchema(BaseModel):
+    """Schema for getting many users by id."""
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"ids": [1, 2, 3]}}
+    )
+
+    ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_GET_MAX_IDS,
+        description="Ids of the users to get",
+    )
+
+
+class BatchGetUsersResponseSchema(BaseModel):
+    """Schema for batch get response."""
+
+    users: List[UserResponseSchema] = Field(
+        ..., description="Users found, in request order"
+    )
+    missing_ids: List[int] = Field(
+        ..., description="Requested ids without a user, in request order"
+    )
+
+
+class ImportUserRejectionSchema(BaseModel):
+    """Schema for a rejected row of an import."""
+
+    line: int = Field(..., description="Line of the row in the file")
+    error: str = Field(..., description="Why the row was rejected")
+
+
+class ImportUsersResponseSchema(BaseModel):
+    """Schema for import response."""
+
+    received: int = Field(..., description="Number of rows read")
+    created: int = Field(..., description="Number of users created")
+    updated: int = Field(
+        ..., description="Number of existing users updated (upsert)"
+    )
+    skipped: int = Field(
+        ..., description="Number of valid rows whose email already existed"
+    )
+    rejected: int = Field(..., description="Number of invalid rows")
+    rejections: List[ImportUserRejectionSchema] = Field(
+        ..., description="First rejected rows, in file order"
+    )
+
+
+class UserFileFormat(str, Enum):
+    """Formats of users export and import files."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TotalCountMode(str, Enum):
+    """How the total count of a users listing is computed."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    AUTO = "auto"
+
+
 class ErrorResponseSchema(BaseModel):
     """Schema for error responses."""
 
@@ -1,5 +1,7 @@
 """Application settings."""
 
+from typing import List
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -18,6 +20,72 @@ class Settings(BaseSettings):
     postgres_db: str = "db"
     postgres_host: str = "localhost"
     postgres_port: int = 5432
+    # Serve the users API with async routes on an AsyncSession instead of
+    # sync routes on Starlette's threadpool
+    database_async: bool = False
+    # Connection pool of every engine (per process, per engine)
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    # Seconds a request waits for a free connection before failing
+    database_pool_timeout: float = 30.0
+    database_pool_recycle_seconds: int = 3600
+    # Test connections on checkout (pessimistic) instead of only handling
+    # disconnects when a statement fails (optimistic)
+    database_pool_pre_ping: bool = True
+    # Reuse the most recently returned connection so that spare ones idle
+    # out server-side
+    database_pool_use_lifo: bool = False
+    # Compiled SQL statements cached per engine
+    database_statement_cache_size: int = 500
+    # psycopg prepares a statement server-side once it ran this many times
+    # on a connection; turn off behind PgBouncer in transaction mode
+    database_prepared_statements: bool = True
+    database_prepare_threshold: int = 5
+    # Comma-separated read replica URLs; empty means all reads hit the
+    # primary
+    database_replica_urls: str = ""
+    # Seconds a replica that failed to connect is left out of rotation
+    database_replica_retry_seconds: float = 30.0
+    # Seconds a client's reads stay on the primary after its own write
+    database_read_your_writes_seconds: float = 5.0
+
+    # Largest estimated total still counted exactly by GET /users?count=auto
+    user_count_exact_max_rows: int = 100_000
+
+    # User cache (per process, in front of get_by_id/get_by_email)
+    user_cache_enabled: bool = False
+    user_cache_max_entries: int = 100_000
+    user_cache_ttl_seconds: float = 30.0
+    user_cache_negative_ttl_seconds: float = 5.0
+    # Share one query between concurrent identical user lookups (by id or
+    # email) of read-only requests (per process)
+    user_single_flight_enabled: bool = False
+    # Gather concurrent POST /users creates for up to this many milliseconds
+    # or rows and insert them in one statement and transaction (per process)
+    user_write_batch_enabled: bool = False
+    user_write_batch_max_rows: int = 100
+    user_write_batch_max_wait_ms: float = 2.0
+
+    # Admission control of /users requests, per route class and process:
+    # read and write limits grow while requests finish within the latency
+    # target and shrink when they do not; bulk routes get a fixed limit.
+    # Requests over the limit get a 503 with Retry-After
+    admission_control_enabled: bool = False
+    admission_initial_limit: int = 20
+    admission_min_limit: int = 2
+    admission_max_limit: int = 200
+    admission_latency_target_ms: float = 250.0
+    admission_backoff_ratio: float = 0.9
+    admission_bulk_limit: int = 4
+    admission_retry_after_seconds: int = 1
+
+    # Production server (serve.py): worker processes, 0 for one per
+    # available CPU, and event loop and HTTP parser implementations
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int = 0
+    server_loop: str = "auto"
+    server_http: str = "auto"
 
     # Application
     app_name: str = "Users API"
@@ -33,5 +101,14 @@ class Settings(BaseSettings):
             f"{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def replica_urls(self) -> List[str]:
+        """Get read replica connection URLs."""
+        return [
+            url.strip()
+            for url in self.database_replica_urls.split(",")
+            if url.strip()
+        ]
+
 
 settings = Settings()
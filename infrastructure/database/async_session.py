@@ -0,0 +1,118 @@
+"""Async database session management."""
+
+from functools import lru_cache
+from typing import AsyncIterator
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from infrastructure.config.settings import settings
+from infrastructure.database.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    instrument_engine,
+)
+from infrastructure.database.replicas import ReplicaSet
+from infrastructure.database.session import (
+    REPLICA_INFO_KEY,
+    connect_args,
+    engine_options,
+    mark_write,
+    wrote_recently,
+)
+
+
+def create_instrumented_async_engine(name: str, url: str) -> AsyncEngine:
+    """Create an async engine whose pool stats are exposed as ``name``."""
+    new_engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        connect_args=connect_args(url),
+        **engine_options(),
+    )
+    instrument_engine(name, new_engine.sync_engine)
+    return new_engine
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async engine, creating it on first use.
+
+    psycopg 3 drives both engines natively, so the same URL is used.
+    Created lazily so sync-only deployments never build an async pool.
+    """
+    return create_instrumented_async_engine(
+        "async-primary", settings.database_url
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the async session factory bound to the async engine."""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Get async database session."""
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+@lru_cache(maxsize=1)
+def get_async_replica_set() -> ReplicaSet[AsyncEngine]:
+    """Get the async read replica engines, creating them on first use."""
+    return ReplicaSet(
+        [
+            create_instrumented_async_engine(f"async-replica-{index}", url)
+            for index, url in enumerate(settings.replica_urls)
+        ],
+        retry_after_seconds=settings.database_replica_retry_seconds,
+    )
+
+
+async def get_async_write_db(
+    response: Response, db: AsyncSession = Depends(get_async_db)
+) -> AsyncSession:
+    """Get a primary async database session for a request that writes."""
+    mark_write(response)
+    return db
+
+
+async def get_async_read_db(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> AsyncIterator[AsyncSession]:
+    """Get an async database session for a request that only reads."""
+    if wrote_recently(request):
+        yield db
+        return
+
+    replicas = get_async_replica_set()
+    for replica in replicas.candidates():
+        try:
+            connection = await replica.connect()
+        except DBAPIError:
+            replicas.mark_down(replica)
+            continue
+        async with AsyncSession(
+            bind=connection,
+            autoflush=False,
+            expire_on_commit=False,
+            info={REPLICA_INFO_KEY: True},
+        ) as replica_db:
+            try:
+                yield replica_db
+            finally:
+                await connection.close()
+        return
+
+    yield db
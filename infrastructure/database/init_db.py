@@ -1,9 +1,14 @@
 """Initialize database tables."""
 
 from infrastructure.database.models.user_model import Base
-from infrastructure.database.session import engine
+from infrastructure.database.session import get_engine
 
 
 def init_db() -> None:
-    """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
+    """
+    Create all database tables.
+
+    On PostgreSQL this also creates the ``pg_trgm`` extension, which the
+    search indexes need.
+    """
+    Base.metadata.create_all(bind=get_engine())
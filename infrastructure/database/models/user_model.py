@@ -1,11 +1,31 @@
 """User database model."""
 
 from datetime import UTC, datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    event,
+    text,
+)
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
+# The trigram indexes below need pg_trgm; create it with the tables (e.g.
+# by init_db) as the migrations do, with a role allowed to create it
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql"
+    ),
+)
+
 
 def utc_now() -> datetime:
     """Get current UTC datetime."""
@@ -16,6 +36,41 @@ class UserModel(Base):
     """User ORM model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Trigram indexes serving substring search (ILIKE '%...%') and
+        # its ranking, read in similarity order (KNN ``<->``); plain
+        # indexes on databases without pg_trgm
+        Index(
+            "ix_users_name_trgm_gist",
+            "name",
+            postgresql_using="gist",
+            postgresql_ops={"name": "gist_trgm_ops"},
+        ),
+        Index(
+            "ix_users_email_trgm_gist",
+            "email",
+            postgresql_using="gist",
+            postgresql_ops={"email": "gist_trgm_ops"},
+        ),
+        # Listing filters. Only active users, in id order, so that
+        # active-only pages are read straight off the index
+        Index(
+            "ix_users_active_id",
+            "id",
+            postgresql_where=text("active"),
+            sqlite_where=text("active = 1"),
+        ),
+        # Rows are appended in created_at order, so a BRIN index (block
+        # ranges of min/max) serves created_at ranges at a tiny size;
+        # updated_at moves with every update and needs a B-tree
+        Index(
+            "ix_users_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("ix_users_updated_at", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
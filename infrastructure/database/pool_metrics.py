@@ -0,0 +1,241 @@
+"""Connection pool instrumentation."""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+# Upper bounds, in seconds, of the checkout duration histogram buckets
+CHECKOUT_DURATION_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+class PoolStats:
+    """Thread-safe counters and checkout duration histogram of a pool."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * (len(CHECKOUT_DURATION_BUCKETS) + 1)
+        self.checkout_seconds_sum = 0.0
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connections_created = 0
+        self.connections_invalidated = 0
+
+    def observe_checkout(self, seconds: float, timed_out: bool) -> None:
+        """Record how long a checkout took and whether it timed out."""
+        index = bisect.bisect_left(CHECKOUT_DURATION_BUCKETS, seconds)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.checkout_seconds_sum += seconds
+            self.checkouts += 1
+            if timed_out:
+                self.checkout_timeouts += 1
+
+    def count_connection_created(self) -> None:
+        """Record a new DBAPI connection."""
+        with self._lock:
+            self.connections_created += 1
+
+    def count_connection_invalidated(self) -> None:
+        """Record a DBAPI connection discarded as unusable."""
+        with self._lock:
+            self.connections_invalidated += 1
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times ``connect()``, the whole checkout of a connection.
+
+    That is waiting for a free pooled connection, but also opening a new
+    one when the pool may grow, and the pre-ping of ``pool_pre_ping``.
+    """
+
+    stats: PoolStats
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording its duration and timeouts."""
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()  # type: ignore[misc]
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.stats.observe_checkout(
+                time.perf_counter() - started, timed_out
+            )
+
+    def recreate(self) -> Any:
+        """Recreate the pool (e.g. on ``dispose``), keeping its stats."""
+        pool = super().recreate()  # type: ignore[misc]
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool recording checkout wait times and timeouts."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool with empty statistics."""
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+
+class InstrumentedAsyncAdaptedQueuePool(
+    _InstrumentedPoolMixin, AsyncAdaptedQueuePool
+):
+    """AsyncAdaptedQueuePool recording checkout wait times and timeouts."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool with empty statistics."""
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+
+InstrumentedPool = Union[
+    InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
+]
+
+
+def instrumented_pool(engine: Engine) -> Optional[InstrumentedPool]:
+    """Get the pool of an engine if it is instrumented, else None."""
+    pool = engine.pool
+    if isinstance(
+        pool, (InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool)
+    ):
+        return pool
+    return None
+
+
+def instrument_engine(name: str, engine: Engine) -> None:
+    """
+    Register an engine with an instrumented pool for ``render_metrics``.
+
+    Pool events count new and invalidated connections (e.g. after a failed
+    pre-ping). For async engines pass ``async_engine.sync_engine``.
+    """
+
+    def on_connect(*_: Any) -> None:
+        pool = instrumented_pool(engine)
+        if pool is not None:
+            pool.stats.count_connection_created()
+
+    def on_invalidate(*_: Any) -> None:
+        pool = instrumented_pool(engine)
+        if pool is not None:
+            pool.stats.count_connection_invalidated()
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "invalidate", on_invalidate)
+    with _engines_lock:
+        _engines[name] = engine
+
+
+def instrumented_engines() -> List[Engine]:
+    """Get every engine registered so far."""
+    with _engines_lock:
+        return list(_engines.values())
+
+
+METRICS = {
+    "db_pool_size": ("gauge", "Configured number of pooled connections."),
+    "db_pool_checked_out": ("gauge", "Connections currently in use."),
+    "db_pool_checked_in": ("gauge", "Idle connections in the pool."),
+    "db_pool_overflow": ("gauge", "Connections open beyond the pool size."),
+    "db_pool_checkout_timeouts_total": (
+        "counter",
+        "Checkouts that gave up after the pool timeout.",
+    ),
+    "db_pool_connections_created_total": (
+        "counter",
+        "DBAPI connections opened.",
+    ),
+    "db_pool_connections_invalidated_total": (
+        "counter",
+        "DBAPI connections discarded as unusable.",
+    ),
+    "db_pool_checkout_duration_seconds": (
+        "histogram",
+        "Time spent checking out a connection, including waiting for a "
+        "free one, opening a new one and pre-ping.",
+    ),
+}
+
+# (metric, sample name suffix, extra labels, value)
+_Sample = Tuple[str, str, Dict[str, str], float]
+
+
+def _pool_samples(pool: QueuePool, stats: PoolStats) -> List[_Sample]:
+    """Get the metric samples of an instrumented pool."""
+    samples: List[_Sample] = [
+        ("db_pool_size", "", {}, pool.size()),
+        ("db_pool_checked_out", "", {}, pool.checkedout()),
+        ("db_pool_checked_in", "", {}, pool.checkedin()),
+        # QueuePool counts overflow from -pool_size until the pool is full
+        ("db_pool_overflow", "", {}, max(pool.overflow(), 0)),
+        ("db_pool_checkout_timeouts_total", "", {}, stats.checkout_timeouts),
+        (
+            "db_pool_connections_created_total",
+            "",
+            {},
+            stats.connections_created,
+        ),
+        (
+            "db_pool_connections_invalidated_total",
+            "",
+            {},
+            stats.connections_invalidated,
+        ),
+    ]
+
+    histogram = "db_pool_checkout_duration_seconds"
+    bounds = [str(bound) for bound in CHECKOUT_DURATION_BUCKETS] + ["+Inf"]
+    cumulative = 0
+    for bound, count in zip(bounds, stats.bucket_counts):
+        cumulative += count
+        samples.append((histogram, "_bucket", {"le": bound}, cumulative))
+    samples.append((histogram, "_sum", {}, stats.checkout_seconds_sum))
+    samples.append((histogram, "_count", {}, stats.checkouts))
+    return samples
+
+
+def render_metrics() -> str:
+    """Render the stats of every registered pool in Prometheus text format."""
+    with _engines_lock:
+        engines = list(_engines.items())
+
+    lines_by_metric: Dict[str, List[str]] = {metric: [] for metric in METRICS}
+    for name, engine in engines:
+        pool = instrumented_pool(engine)
+        if pool is None:
+            continue
+        for metric, suffix, labels, value in _pool_samples(pool, pool.stats):
+            label_text = ",".join(
+                f'{key}="{label}"'
+                for key, label in {"pool": name, **labels}.items()
+            )
+            lines_by_metric[metric].append(
+                f"{metric}{suffix}{{{label_text}}} {value}"
+            )
+
+    lines = []
+    for metric, (metric_type, help_text) in METRICS.items():
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.extend(lines_by_metric[metric])
+    return "\n".join(lines) + "\n"
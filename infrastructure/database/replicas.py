@@ -0,0 +1,63 @@
+"""Read replica selection."""
+
+import threading
+import time
+from typing import Callable, Dict, Generic, List, Sequence, TypeVar
+
+EngineT = TypeVar("EngineT")
+
+
+class ReplicaSet(Generic[EngineT]):
+    """
+    Round-robin choice among read replica engines, skipping failed ones.
+
+    Engines are created with ``pool_pre_ping``, so a replica that went away
+    makes ``connect()`` fail instead of handing out a dead connection. The
+    caller then reports it with ``mark_down`` and it is left out of the
+    rotation for ``retry_after_seconds``, after which it is tried again.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[EngineT],
+        retry_after_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the set with its replica engines."""
+        self._engines = list(engines)
+        self._retry_after_seconds = retry_after_seconds
+        self._clock = clock
+        self._down_until: Dict[int, float] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of replicas, healthy or not."""
+        return len(self._engines)
+
+    @property
+    def engines(self) -> List[EngineT]:
+        """Get every replica engine, healthy or not."""
+        return list(self._engines)
+
+    def candidates(self) -> List[EngineT]:
+        """Get the healthy replicas, starting with the next in rotation."""
+        if not self._engines:
+            return []
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self._engines)
+            now = self._clock()
+            rotation = self._engines[start:] + self._engines[:start]
+            return [
+                engine
+                for engine in rotation
+                if self._down_until.get(id(engine), 0.0) <= now
+            ]
+
+    def mark_down(self, engine: EngineT) -> None:
+        """Leave a replica that failed to connect out for a while."""
+        with self._lock:
+            self._down_until[id(engine)] = (
+                self._clock() + self._retry_after_seconds
+            )
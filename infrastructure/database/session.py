@@ -1,24 +1,193 @@
 """Database session management."""
 
-from sqlalchemy import create_engine
+import math
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, Union
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, Session
 
 from infrastructure.config.settings import settings
-
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    echo=settings.debug,
-    pool_recycle=3600,
+from infrastructure.database.pool_metrics import (
+    InstrumentedQueuePool,
+    instrument_engine,
+    instrumented_engines,
 )
+from infrastructure.database.replicas import ReplicaSet
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Cookie holding when the client last wrote, to route its reads to the
+# primary until replicas have caught up
+LAST_WRITE_COOKIE = "users_api_last_write"
+# Session.info key marking the sessions bound to a read replica
+REPLICA_INFO_KEY = "replica"
+
+
+def connect_args(url: str) -> dict:
+    """
+    Get the DBAPI connect arguments for ``url``.
+
+    psycopg connections prepare statements server-side after
+    ``prepare_threshold`` executions; ``None`` never prepares them.
+    """
+    if make_url(url).get_backend_name() != "postgresql":
+        return {}
+    return {
+        "prepare_threshold": (
+            settings.database_prepare_threshold
+            if settings.database_prepared_statements
+            else None
+        )
+    }
+
+
+def engine_options() -> dict:
+    """Get the pool, caching and logging options shared by every engine."""
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle_seconds,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_use_lifo": settings.database_pool_use_lifo,
+        "query_cache_size": settings.database_statement_cache_size,
+        "echo": settings.debug,
+    }
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def create_instrumented_engine(name: str, url: str) -> Engine:
+    """Create an engine whose pool stats are exposed as ``name``."""
+    new_engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        connect_args=connect_args(url),
+        **engine_options(),
+    )
+    instrument_engine(name, new_engine)
+    return new_engine
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Get the primary engine, creating it on first use.
+
+    Created lazily so that importing the app loads no database driver.
+    """
+    return create_instrumented_engine("primary", settings.database_url)
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker[Session]:
+    """Get the session factory bound to the primary engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 
 def get_db() -> Session:
     """Get database session."""
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
         db.close()
+
+
+@lru_cache(maxsize=1)
+def get_replica_set() -> ReplicaSet[Engine]:
+    """Get the read replica engines, creating them on first use."""
+    return ReplicaSet(
+        [
+            create_instrumented_engine(f"replica-{index}", url)
+            for index, url in enumerate(settings.replica_urls)
+        ],
+        retry_after_seconds=settings.database_replica_retry_seconds,
+    )
+
+
+def mark_write(response: Response) -> None:
+    """Pin the client's reads to the primary for the stickiness window."""
+    if not settings.replica_urls:
+        return
+    response.set_cookie(
+        LAST_WRITE_COOKIE,
+        str(time.time()),
+        max_age=math.ceil(settings.database_read_your_writes_seconds),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def wrote_recently(request: Request) -> bool:
+    """Check whether the client wrote within the stickiness window."""
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+    except ValueError:
+        return False
+    return (
+        time.time() - last_write
+        < settings.database_read_your_writes_seconds
+    )
+
+
+def reads_replica(db: Union[Session, "AsyncSession"]) -> bool:
+    """Check whether ``db`` is bound to a read replica."""
+    return bool(db.info.get(REPLICA_INFO_KEY, False))
+
+
+def get_write_db(
+    response: Response, db: Session = Depends(get_db)
+) -> Session:
+    """Get a primary database session for a request that writes."""
+    mark_write(response)
+    return db
+
+
+def get_read_db(
+    request: Request, db: Session = Depends(get_db)
+) -> Iterator[Session]:
+    """
+    Get a database session for a request that only reads.
+
+    Reads go to a healthy replica, round-robin, unless the client wrote
+    recently (read-your-writes) or no replica can be reached; then they use
+    the primary session ``db``, which never connected otherwise.
+    """
+    if wrote_recently(request):
+        yield db
+        return
+
+    replicas = get_replica_set()
+    for replica in replicas.candidates():
+        try:
+            connection = replica.connect()
+        except DBAPIError:
+            replicas.mark_down(replica)
+            continue
+        replica_db = Session(
+            bind=connection, autoflush=False, info={REPLICA_INFO_KEY: True}
+        )
+        try:
+            yield replica_db
+        finally:
+            replica_db.close()
+            connection.close()
+        return
+
+    yield db
+
+
+def dispose_engines_after_fork() -> None:
+    """
+    Drop the pooled connections a forked worker inherited from its parent.
+
+    Connections must not be shared across processes. ``close=False`` only
+    forgets them, leaving the sockets to the parent, and the pools of the
+    worker start empty. Engines created later start empty anyway.
+    """
+    for engine in instrumented_engines():
+        engine.dispose(close=False)
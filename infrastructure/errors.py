@@ -0,0 +1,19 @@
+"""Errors shared between concurrent callers."""
+
+import copy
+
+
+def error_copy(error: BaseException) -> BaseException:
+    """
+    Get a copy of ``error`` for one of the callers sharing it to raise.
+
+    Raising one instance in several threads or tasks would make each of
+    them extend its traceback, so every caller raises its own copy, caused
+    by the original. An error that cannot be copied is returned as is.
+    """
+    try:
+        own = copy.copy(error)
+    except Exception:
+        return error
+    own.__cause__ = error
+    return own
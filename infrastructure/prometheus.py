@@ -0,0 +1,56 @@
+"""Prometheus text format rendering."""
+
+from typing import Any, Mapping, Tuple
+
+
+def render_samples(
+    metrics: Mapping[str, Tuple[str, str]],
+    label: str,
+    samples: Mapping[str, Mapping[str, Any]],
+) -> str:
+    """
+    Render labelled samples in Prometheus text format.
+
+    Args:
+        metrics: Type (``counter`` or ``gauge``) and help text by metric.
+        label: Name of the label telling apart the samples of a metric.
+        samples: Value of each metric by value of the label.
+    """
+    lines = []
+    for metric, (metric_type, help_text) in metrics.items():
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.extend(
+            f'{metric}{{{label}="{name}"}} {values[metric]}'
+            for name, values in samples.items()
+        )
+    return "\n".join(lines) + "\n"
+
+
+def render_counters(
+    counters: Mapping[str, Tuple[str, str]],
+    label: str,
+    snapshots: Mapping[str, Mapping[str, Any]],
+) -> str:
+    """
+    Render counters read from snapshots in Prometheus text format.
+
+    Args:
+        counters: Snapshot key and help text by metric.
+        label: Name of the label telling apart the snapshots.
+        snapshots: Snapshot of counters by value of the label.
+    """
+    return render_samples(
+        {
+            metric: ("counter", help_text)
+            for metric, (_, help_text) in counters.items()
+        },
+        label,
+        {
+            name: {
+                metric: snapshot[key]
+                for metric, (key, _) in counters.items()
+            }
+            for name, snapshot in snapshots.items()
+        },
+    )
@@ -0,0 +1,252 @@
+"""Pre-forking multi-worker server for the ASGI app."""
+
+import gc
+import logging
+import math
+import os
+import resource
+import signal
+import socket
+import time
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from uvicorn.config import HTTPProtocolType, LoopSetupType
+from uvicorn.importer import import_from_string
+from uvicorn.main import STARTUP_FAILURE
+
+from infrastructure.database.session import dispose_engines_after_fork
+
+logger = logging.getLogger("uvicorn.error")
+
+LOOPS = ("auto", "asyncio", "uvloop")
+HTTP_PARSERS = ("auto", "h11", "httptools")
+
+# cgroup v2 CPU quota of the container, as "<quota> <period>" or "max"
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+SMAPS_ROLLUP = "/proc/self/smaps_rollup"
+
+# Seconds between checks for workers that died
+SUPERVISE_INTERVAL = 0.5
+
+
+def available_cpus(cpu_max_path: str = CGROUP_CPU_MAX) -> int:
+    """
+    Get how many CPUs this process may use.
+
+    The CPUs it is pinned to, capped by the container CPU quota, if any.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open(cpu_max_path) as cpu_max:
+            quota, period = cpu_max.read().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+
+
+def worker_count(configured: int) -> int:
+    """Get the number of workers: ``configured``, or one per CPU if 0."""
+    return configured if configured > 0 else available_cpus()
+
+
+def memory_usage(smaps_rollup_path: str = SMAPS_ROLLUP) -> Dict[str, int]:
+    """
+    Get the memory used by this process, in KiB.
+
+    On Linux, the resident (``rss``) and proportional (``pss``) set sizes,
+    and how much of it is ``shared`` with other processes, e.g. the pages
+    a forked worker still shares with its parent, or ``private``. Adding
+    up ``pss`` over the workers gives their real footprint. Elsewhere, only
+    the peak ``rss``.
+    """
+    try:
+        with open(smaps_rollup_path) as smaps:
+            fields = {
+                name: int(value.split()[0])
+                for name, value in (
+                    line.split(":", 1) for line in smaps if ":" in line
+                )
+                if value.strip().endswith("kB")
+            }
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"rss": peak}
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "shared": fields["Shared_Clean"] + fields["Shared_Dirty"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def format_memory(usage: Dict[str, int]) -> str:
+    """Format memory usage as ``name=<MiB>`` pairs."""
+    return " ".join(
+        f"{name}={kib / 1024:.1f}MiB" for name, kib in usage.items()
+    )
+
+
+class _WorkerServer(uvicorn.Server):
+    """Uvicorn server of one worker, reporting once it accepts requests."""
+
+    def __init__(self, config: uvicorn.Config, started: float) -> None:
+        """Initialize the server of a worker forked at ``started``."""
+        super().__init__(config)
+        self._started = started
+
+    async def startup(
+        self, sockets: Optional[List[socket.socket]] = None
+    ) -> None:
+        """Start serving, then report startup time and memory."""
+        await super().startup(sockets=sockets)
+        if self.should_exit:
+            # Startup failed (e.g. a lifespan error); the worker is exiting
+            return
+        logger.info(
+            "Worker %d ready in %.3fs: %s",
+            os.getpid(),
+            time.perf_counter() - self._started,
+            format_memory(memory_usage()),
+        )
+
+
+class PreforkServer:
+    """
+    Serve an ASGI app from several worker processes forked from one parent.
+
+    The parent imports the app once, binds the listening socket and moves
+    every object it allocated to the permanent generation with
+    ``gc.freeze()``, so the collector of the workers never writes to them
+    and the forked workers keep sharing those pages copy-on-write. Each
+    worker forgets the database connections it inherited, then runs
+    uvicorn on the shared socket. Workers that die are replaced, unless
+    they failed to start; SIGTERM or SIGINT shuts every worker down
+    gracefully.
+    """
+
+    def __init__(
+        self,
+        app: str,
+        host: str,
+        port: int,
+        workers: int,
+        loop: LoopSetupType = "auto",
+        http: HTTPProtocolType = "auto",
+    ) -> None:
+        """Initialize the server; ``app`` is an ``module:attribute`` path."""
+        self._app = app
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._loop = loop
+        self._http = http
+        self._pids: Dict[int, int] = {}
+        self._stopping = False
+        self._exit_code = 0
+
+    def run(self) -> int:
+        """
+        Import the app, fork the workers and supervise them until told.
+
+        Returns:
+            The exit code: 0, or 1 if a worker failed to start.
+        """
+        started = time.perf_counter()
+        # No collection until the freeze, so none leaves holes in pages
+        # the workers will share
+        gc.disable()
+        app = import_from_string(self._app)
+        config = uvicorn.Config(
+            app,
+            host=self._host,
+            port=self._port,
+            loop=self._loop,
+            http=self._http,
+        )
+        # Import the event loop, protocol and lifespan classes here too
+        config.load()
+        sock = config.bind_socket()
+        sock.set_inheritable(True)
+        gc.freeze()
+        logger.info(
+            "App imported in %.3fs: %s",
+            time.perf_counter() - started,
+            format_memory(memory_usage()),
+        )
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        for index in range(self._workers):
+            self._spawn(index, config, sock)
+        gc.enable()
+        try:
+            self._supervise(config, sock)
+        finally:
+            sock.close()
+        return self._exit_code
+
+    def _spawn(
+        self, index: int, config: uvicorn.Config, sock: socket.socket
+    ) -> None:
+        """Fork the worker in slot ``index``."""
+        started = time.perf_counter()
+        pid = os.fork()
+        if pid:
+            self._pids[pid] = index
+            return
+
+        # Worker: the server installs its own handlers for SIGTERM/SIGINT
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        gc.enable()
+        exit_code = STARTUP_FAILURE
+        try:
+            dispose_engines_after_fork()
+            server = _WorkerServer(config, started)
+            server.run(sockets=[sock])
+            if server.started:
+                exit_code = 0
+        except BaseException:
+            logger.exception("Worker %d failed", os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _supervise(self, config: uvicorn.Config, sock: socket.socket) -> None:
+        """Replace workers that die until stopped, then reap them all."""
+        while self._pids:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if not pid:
+                time.sleep(SUPERVISE_INTERVAL)
+                continue
+            index = self._pids.pop(pid)
+            exit_code = os.waitstatus_to_exitcode(status)
+            if self._stopping:
+                continue
+            if exit_code == STARTUP_FAILURE:
+                logger.error("Worker %d failed to start, stopping", pid)
+                self._exit_code = 1
+                self._handle_stop(signal.SIGTERM, None)
+                continue
+            logger.warning(
+                "Worker %d exited with status %d, replacing it", pid, exit_code
+            )
+            self._spawn(index, config, sock)
+
+    def _handle_stop(self, signum: int, frame: Any) -> None:
+        """Ask every worker to finish its requests and exit."""
+        self._stopping = True
+        for pid in self._pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
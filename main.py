@@ -1,27 +1,58 @@
 """FastAPI application main file."""
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
 
-from infrastructure.api.routers.user_router import router as user_router
+from infrastructure.api.admission_control import (
+    AdmissionControlMiddleware,
+    get_admission_limiters,
+)
+from infrastructure.api.docs import (
+    OPENAPI_URL,
+    openapi_document,
+    redoc_document,
+    swagger_document,
+)
+from infrastructure.api.responses import FastJSONResponse
+from infrastructure.api.routers.metrics_router import (
+    router as metrics_router,
+)
 from infrastructure.config.settings import settings
 from infrastructure.database.init_db import init_db
 
+# Import only the users router that is served: the async one loads the
+# asyncio extension of SQLAlchemy
+if settings.database_async:
+    from infrastructure.api.routers.async_user_router import (
+        router as user_router,
+    )
+else:
+    from infrastructure.api.routers.user_router import router as user_router
+
 # Initialize database tables (only if database is available)
 # Uncomment the line below or set INIT_DB=true in .env to auto-initialize
 # init_db()
 
-# Create FastAPI app
+# Create FastAPI app; the documentation routes are declared below so that
+# their documents are built once and revalidated with ETags
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="REST API for user management with Clean Architecture",
-    docs_url="/docs",
-    redoc_url=None,  # Disable default ReDoc to use custom endpoint below
-    openapi_url="/openapi.json",
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=FastJSONResponse,
 )
 
+# Admission control, inside CORS so that shed responses get CORS headers
+if settings.admission_control_enabled:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limiters=get_admission_limiters(),
+        retry_after_seconds=settings.admission_retry_after_seconds,
+    )
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +64,7 @@ app.add_middleware(
 
 # Include routers
 app.include_router(user_router)
+app.include_router(metrics_router)
 
 
 @app.get("/", tags=["root"])
@@ -51,43 +83,19 @@ def health() -> dict:
     return {"status": "healthy"}
 
 
+@app.get(OPENAPI_URL, include_in_schema=False)
+def openapi(request: Request) -> Response:
+    """OpenAPI schema."""
+    return openapi_document(app).response(request)
+
+
+@app.get("/docs", include_in_schema=False)
+def swagger_ui_html(request: Request) -> Response:
+    """Swagger UI endpoint."""
+    return swagger_document(app).response(request)
+
+
 @app.get("/redoc", include_in_schema=False)
-async def redoc_html() -> HTMLResponse:
+def redoc_html(request: Request) -> Response:
     """Custom ReDoc endpoint that injects OpenAPI schema directly to avoid CORB issues."""
-    import json
-    openapi_schema = app.openapi()
-    schema_json = json.dumps(openapi_schema)
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-        <head>
-            <title>Users API - ReDoc</title>
-            <meta charset="utf-8"/>
-            <meta name="viewport" content="width=device-width, initial-scale=1">
-            <link href="https://fonts.googleapis.com/css?family=Montserrat:300,400,700|Roboto:300,400,700" rel="stylesheet">
-            <style>
-                body {{
-                    margin: 0;
-                    padding: 0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div id="redoc-container"></div>
-            <script>
-                window.OPENAPI_SPEC = {schema_json};
-            </script>
-            <script src="https://cdn.redoc.ly/redoc/latest/bundles/redoc.standalone.js"></script>
-            <script>
-                Redoc.init(window.OPENAPI_SPEC, {{
-                    scrollYOffset: 0,
-                    hideDownloadButton: false,
-                    disableSearch: false,
-                }}, document.getElementById('redoc-container'));
-            </script>
-        </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
-
+    return redoc_document(app).response(request)
@@ -0,0 +1,45 @@
+"""Script to run the application in production, one worker per CPU."""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from infrastructure.config.settings import settings
+from infrastructure.server.prefork import (
+    HTTP_PARSERS,
+    LOOPS,
+    PreforkServer,
+    worker_count,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Serve the app from pre-forked workers until SIGTERM or SIGINT."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.server_workers,
+        help="worker processes (default: 0, one per available CPU)",
+    )
+    parser.add_argument("--loop", choices=LOOPS, default=settings.server_loop)
+    parser.add_argument(
+        "--http", choices=HTTP_PARSERS, default=settings.server_http
+    )
+    args = parser.parse_args(argv)
+
+    server = PreforkServer(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=worker_count(args.workers),
+        loop=args.loop,
+        http=args.http,
+    )
+    return server.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Tests for AsyncCreateUserUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+import pytest
+
+from core.application.dto.user_dto import CreateUserDto
+from core.application.use_cases.async_create_user_use_case import (
+    AsyncCreateUserUseCase,
+)
+from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
+from core.domain.value_objects.email_address import EmailAddress
+
+
+@pytest.mark.asyncio
+async def test_create_user_success() -> None:
+    """Test successful user creation."""
+    # Arrange
+    mock_repository = AsyncMock()
+    now = datetime.now(UTC)
+    created_user = User(
+        id=1,
+        name="John Doe",
+        email=EmailAddress("test@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    mock_repository.create.return_value = created_user
+
+    use_case = AsyncCreateUserUseCase(mock_repository)
+    dto = CreateUserDto(
+        name="John Doe", email="test@example.com", active=True
+    )
+
+    # Act
+    result, created = await use_case.execute(dto)
+
+    # Assert
+    assert created is True
+    assert result.id == 1
+    assert result.email == "test@example.com"
+    mock_repository.get_by_email.assert_not_awaited()
+    mock_repository.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_user_email_already_exists() -> None:
+    """Test creating user with existing email raises error."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.create.side_effect = DuplicateEmailError(
+        "test@example.com"
+    )
+
+    use_case = AsyncCreateUserUseCase(mock_repository)
+    dto = CreateUserDto(
+        name="John Doe", email="test@example.com", active=True
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="already exists"):
+        await use_case.execute(dto)
+
+
+@pytest.mark.asyncio
+async def test_create_user_upsert() -> None:
+    """Test upsert mode creates or updates by email."""
+    # Arrange
+    mock_repository = AsyncMock()
+    now = datetime.now(UTC)
+    mock_repository.upsert_by_email.return_value = (
+        User(
+            id=7,
+            name="John Doe",
+            email=EmailAddress("test@example.com"),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        ),
+        False,
+    )
+
+    use_case = AsyncCreateUserUseCase(mock_repository)
+    dto = CreateUserDto(name="John Doe", email="test@example.com")
+
+    # Act
+    result, created = await use_case.execute(dto, upsert=True)
+
+    # Assert
+    assert created is False
+    assert result.id == 7
+    mock_repository.create.assert_not_awaited()
@@ -0,0 +1,42 @@
+"""Tests for AsyncDeleteUserUseCase."""
+
+from unittest.mock import AsyncMock
+import pytest
+
+from core.application.use_cases.async_delete_user_use_case import (
+    AsyncDeleteUserUseCase,
+)
+
+
+@pytest.mark.asyncio
+async def test_delete_user_success() -> None:
+    """Test successful user deletion."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.delete.return_value = True
+
+    use_case = AsyncDeleteUserUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(1)
+
+    # Assert
+    assert result is True
+    mock_repository.delete.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_delete_user_not_found() -> None:
+    """Test deleting non-existent user returns False."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.delete.return_value = False
+
+    use_case = AsyncDeleteUserUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(999)
+
+    # Assert
+    assert result is False
+    mock_repository.delete.assert_awaited_once_with(999)
@@ -0,0 +1,48 @@
+"""Tests for AsyncExportUsersUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+import pytest
+
+from core.application.use_cases.async_export_users_use_case import (
+    AsyncExportUsersUseCase,
+)
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+
+
+def _user(user_id: int) -> User:
+    """Build a persisted user."""
+    now = datetime.now(UTC)
+    return User(
+        id=user_id,
+        name=f"User {user_id}",
+        email=EmailAddress(f"user{user_id}@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def _iterate(*users: User):
+    """Async iterator over users."""
+    for user in users:
+        yield user
+
+
+@pytest.mark.asyncio
+async def test_export_users() -> None:
+    """Test every streamed user is mapped to a response DTO in order."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.iter_all.return_value = _iterate(_user(1), _user(2))
+
+    use_case = AsyncExportUsersUseCase(mock_repository)
+
+    # Act
+    result = [item async for item in use_case.execute(batch_size=500)]
+
+    # Assert
+    assert [item.id for item in result] == [1, 2]
+    assert result[1].email == "user2@example.com"
+    mock_repository.iter_all.assert_called_once_with(batch_size=500)
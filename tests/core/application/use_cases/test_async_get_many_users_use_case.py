@@ -0,0 +1,38 @@
+"""Tests for AsyncGetManyUsersUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+import pytest
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.use_cases.async_get_many_users_use_case import (
+    AsyncGetManyUsersUseCase,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_many_users_in_request_order() -> None:
+    """Test users follow the requested ids and missing ids are reported."""
+    # Arrange
+    mock_repository = AsyncMock()
+    now = datetime.now(UTC)
+    mock_repository.get_many_responses.return_value = [
+        UserResponseDto(
+            id=user_id,
+            name=f"User {user_id}",
+            email=f"user{user_id}@example.com",
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for user_id in (1, 2)
+    ]
+    use_case = AsyncGetManyUsersUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute([2, 5, 1, 2])
+
+    # Assert
+    assert [user.id for user in result.users] == [2, 1]
+    assert result.missing_ids == [5]
+    mock_repository.get_many_responses.assert_awaited_once_with([2, 5, 1])
@@ -0,0 +1,53 @@
+"""Tests for AsyncGetUserUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+import pytest
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.use_cases.async_get_user_use_case import (
+    AsyncGetUserUseCase,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_user_success() -> None:
+    """Test successful user retrieval."""
+    # Arrange
+    mock_repository = AsyncMock()
+    now = datetime.now(UTC)
+    mock_repository.get_response_by_id.return_value = UserResponseDto(
+        id=1,
+        name="John Doe",
+        email="test@example.com",
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+    use_case = AsyncGetUserUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(1)
+
+    # Assert
+    assert result is not None
+    assert result.id == 1
+    assert result.email == "test@example.com"
+    mock_repository.get_response_by_id.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_get_user_not_found() -> None:
+    """Test getting non-existent user returns None."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.get_response_by_id.return_value = None
+
+    use_case = AsyncGetUserUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(999)
+
+    # Assert
+    assert result is None
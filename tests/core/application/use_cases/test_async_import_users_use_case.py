@@ -0,0 +1,57 @@
+"""Tests for AsyncImportUsersUseCase."""
+
+from unittest.mock import Mock
+import pytest
+
+from core.application.dto.user_dto import CreateUserDto, ImportUserRowDto
+from core.application.use_cases.async_import_users_use_case import (
+    AsyncImportUsersUseCase,
+)
+
+
+async def _chunks(*chunks):
+    """Async iterator over row chunks."""
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_import_users() -> None:
+    """Test chunks are validated and passed on to the repository."""
+    # Arrange
+    mock_repository = Mock()
+    imported = []
+
+    async def import_users(chunks, upsert=False):
+        async for chunk in chunks:
+            imported.extend(str(user.email) for user in chunk)
+        return 1, 1
+
+    mock_repository.import_users.side_effect = import_users
+    chunks = _chunks(
+        [
+            ImportUserRowDto(
+                line=1,
+                user=CreateUserDto(name="John Doe", email="john@example.com"),
+            ),
+            ImportUserRowDto(line=2, error="Invalid JSON"),
+        ],
+        [
+            ImportUserRowDto(
+                line=3,
+                user=CreateUserDto(name="Jane Doe", email="jane@example.com"),
+            )
+        ],
+    )
+
+    use_case = AsyncImportUsersUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(chunks, upsert=True)
+
+    # Assert
+    assert imported == ["john@example.com", "jane@example.com"]
+    assert result.received == 3
+    assert (result.created, result.updated, result.skipped) == (1, 1, 0)
+    assert result.rejected == 1
+    assert result.rejections[0].line == 2
@@ -0,0 +1,97 @@
+"""Tests for AsyncListUsersUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+import pytest
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.use_cases.async_list_users_use_case import (
+    AsyncListUsersUseCase,
+)
+from core.application.use_cases.list_users_use_case import (
+    COUNT_AUTO,
+    COUNT_ESTIMATE,
+    COUNT_EXACT,
+    ListUsersUseCase,
+)
+
+
+def _user(user_id: int) -> UserResponseDto:
+    """Build a user with the given id."""
+    now = datetime.now(UTC)
+    return UserResponseDto(
+        id=user_id,
+        name=f"User {user_id}",
+        email=f"user{user_id}@example.com",
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_users_success() -> None:
+    """Test successful user listing."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.get_all_page.return_value = ([_user(1), _user(2)], None)
+
+    use_case = AsyncListUsersUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(skip=10, limit=5)
+
+    # Assert
+    assert [item.id for item in result] == [1, 2]
+    mock_repository.get_all_page.assert_awaited_once_with(
+        skip=10, limit=5, filters=None, fields=None, with_count=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_users_page_with_cursor() -> None:
+    """Test keyset page seeks after the id encoded in the cursor."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.get_all_page.return_value = ([_user(8), _user(9)], None)
+
+    use_case = AsyncListUsersUseCase(mock_repository)
+    cursor = ListUsersUseCase.encode_cursor(7)
+
+    # Act
+    result = await use_case.execute_page(cursor=cursor, limit=2)
+
+    # Assert
+    assert [item.id for item in result.items] == [8, 9]
+    assert ListUsersUseCase.decode_cursor(result.next_cursor or "") == 9
+    mock_repository.get_all_page.assert_awaited_once_with(
+        limit=2, after_id=7, filters=None, fields=None, with_count=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_users_page_counts() -> None:
+    """Test exact and estimated counts of a page."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.get_all_page.side_effect = [
+        ([_user(1)], 3),
+        ([_user(1)], None),
+    ]
+    mock_repository.estimate_count.return_value = 200_000
+
+    use_case = AsyncListUsersUseCase(mock_repository)
+
+    # Act
+    exact = await use_case.execute_page(count=COUNT_EXACT)
+    auto = await use_case.execute_offset_page(skip=5, count=COUNT_AUTO)
+
+    # Assert
+    assert (exact.total_count, exact.total_count_mode) == (3, COUNT_EXACT)
+    assert (auto.total_count, auto.total_count_mode) == (
+        200_000,
+        COUNT_ESTIMATE,
+    )
+    mock_repository.get_all_page.assert_awaited_with(
+        skip=5, limit=100, filters=None, fields=None, with_count=False
+    )
@@ -0,0 +1,52 @@
+"""Tests for AsyncSearchUsersUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+import pytest
+
+from core.application.use_cases.async_search_users_use_case import (
+    AsyncSearchUsersUseCase,
+)
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+
+
+@pytest.mark.asyncio
+async def test_search_users_success() -> None:
+    """Test search returns the users found with a normalized query."""
+    # Arrange
+    mock_repository = AsyncMock()
+    now = datetime.now(UTC)
+    mock_repository.search.return_value = [
+        User(
+            id=1,
+            name="John Doe",
+            email=EmailAddress("john@example.com"),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    ]
+
+    use_case = AsyncSearchUsersUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(" john ", limit=10)
+
+    # Assert
+    assert [item.id for item in result] == [1]
+    mock_repository.search.assert_awaited_once_with("john", limit=10)
+
+
+@pytest.mark.asyncio
+async def test_search_users_query_too_short() -> None:
+    """Test a query shorter than the minimum is rejected."""
+    # Arrange
+    mock_repository = AsyncMock()
+    use_case = AsyncSearchUsersUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="at least 3 characters"):
+        await use_case.execute("jo")
+
+    mock_repository.search.assert_not_awaited()
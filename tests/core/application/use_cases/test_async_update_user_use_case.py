@@ -0,0 +1,99 @@
+"""Tests for AsyncUpdateUserUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+import pytest
+
+from core.application.dto.user_dto import UpdateUserDto
+from core.application.use_cases.async_update_user_use_case import (
+    AsyncUpdateUserUseCase,
+)
+from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
+from core.domain.value_objects.email_address import EmailAddress
+
+
+def _user(user_id: int, email: str, name: str = "John Doe") -> User:
+    """Build a user with the given id and email."""
+    now = datetime.now(UTC)
+    return User(
+        id=user_id,
+        name=name,
+        email=EmailAddress(email),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_user_success() -> None:
+    """Test successful user update."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.update_fields.return_value = _user(
+        1, "test@example.com", name="John Doe Updated"
+    )
+
+    use_case = AsyncUpdateUserUseCase(mock_repository)
+    dto = UpdateUserDto(name="John Doe Updated")
+
+    # Act
+    result = await use_case.execute(1, dto)
+
+    # Assert
+    assert result is not None
+    assert result.name == "John Doe Updated"
+    mock_repository.update_fields.assert_awaited_once()
+    mock_repository.get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_user_not_found() -> None:
+    """Test updating non-existent user returns None."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.update_fields.return_value = None
+    mock_repository.get_by_id.return_value = None
+
+    use_case = AsyncUpdateUserUseCase(mock_repository)
+
+    # Act
+    result = await use_case.execute(999, UpdateUserDto(name="Jane Doe"))
+
+    # Assert
+    assert result is None
+    mock_repository.get_by_id.assert_awaited_once_with(999)
+
+
+@pytest.mark.asyncio
+async def test_update_user_email_already_exists() -> None:
+    """Test updating user with existing email raises error."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.update_fields.side_effect = DuplicateEmailError(
+        "new@example.com"
+    )
+
+    use_case = AsyncUpdateUserUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="already exists"):
+        await use_case.execute(1, UpdateUserDto(email="new@example.com"))
+
+    mock_repository.get_by_email.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_user_already_active() -> None:
+    """Test activating an active user raises the domain error."""
+    # Arrange
+    mock_repository = AsyncMock()
+    mock_repository.update_fields.return_value = None
+    mock_repository.get_by_id.return_value = _user(1, "test@example.com")
+
+    use_case = AsyncUpdateUserUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="already active"):
+        await use_case.execute(1, UpdateUserDto(active=True))
@@ -0,0 +1,125 @@
+"""Tests for BulkCreateUsersUseCase."""
+
+from unittest.mock import Mock
+
+from core.application.dto.user_dto import CreateUserDto
+from core.application.use_cases.bulk_create_users_use_case import (
+    BulkCreateUsersUseCase,
+)
+from core.domain.entities.user import User
+
+
+def _echo_created(users):
+    """Simulate the repository assigning ids to every user."""
+    return [
+        User(
+            id=i + 1,
+            name=user.name,
+            email=user.email,
+            active=user.active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+        for i, user in enumerate(users)
+    ]
+
+
+def test_bulk_create_users_success() -> None:
+    """Test all valid rows are created with one existence check."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_existing_emails.return_value = set()
+    mock_repository.create_many.side_effect = _echo_created
+
+    use_case = BulkCreateUsersUseCase(mock_repository)
+    dtos = [
+        CreateUserDto(name="John Doe", email="john@example.com"),
+        CreateUserDto(name="Jane Doe", email="jane@example.com"),
+    ]
+
+    # Act
+    results = use_case.execute(dtos)
+
+    # Assert
+    assert [r.index for r in results] == [0, 1]
+    assert all(r.error is None for r in results)
+    assert [r.user.email for r in results] == [
+        "john@example.com",
+        "jane@example.com",
+    ]
+    mock_repository.get_existing_emails.assert_called_once_with(
+        ["john@example.com", "jane@example.com"]
+    )
+    mock_repository.create_many.assert_called_once()
+
+
+def test_bulk_create_users_reports_row_errors() -> None:
+    """Test invalid, duplicated and taken rows get per-row errors."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_existing_emails.return_value = {"taken@example.com"}
+    mock_repository.create_many.side_effect = _echo_created
+
+    use_case = BulkCreateUsersUseCase(mock_repository)
+    dtos = [
+        CreateUserDto(name="Valid", email="valid@example.com"),
+        CreateUserDto(name="Bad Email", email="not-an-email"),
+        CreateUserDto(name="   ", email="blank@example.com"),
+        CreateUserDto(name="Repeated", email="valid@example.com"),
+        CreateUserDto(name="Taken", email="taken@example.com"),
+    ]
+
+    # Act
+    results = use_case.execute(dtos)
+
+    # Assert
+    assert results[0].user is not None
+    assert "Invalid email format" in (results[1].error or "")
+    assert "Name cannot be empty" in (results[2].error or "")
+    assert "Duplicate email" in (results[3].error or "")
+    assert "already exists" in (results[4].error or "")
+    created = mock_repository.create_many.call_args.args[0]
+    assert [str(user.email) for user in created] == ["valid@example.com"]
+
+
+def test_bulk_create_users_conflict_on_insert() -> None:
+    """Test rows skipped by the insert are reported as already existing."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_existing_emails.return_value = set()
+    mock_repository.create_many.side_effect = lambda users: [
+        None,
+        *_echo_created(users[1:]),
+    ]
+
+    use_case = BulkCreateUsersUseCase(mock_repository)
+    dtos = [
+        CreateUserDto(name="Racer", email="race@example.com"),
+        CreateUserDto(name="Winner", email="winner@example.com"),
+    ]
+
+    # Act
+    results = use_case.execute(dtos)
+
+    # Assert
+    assert results[0].user is None
+    assert "already exists" in (results[0].error or "")
+    assert results[1].user is not None
+    assert results[1].user.email == "winner@example.com"
+
+
+def test_bulk_create_users_all_invalid_skips_repository() -> None:
+    """Test a batch without valid rows never touches the repository."""
+    # Arrange
+    mock_repository = Mock()
+    use_case = BulkCreateUsersUseCase(mock_repository)
+
+    # Act
+    results = use_case.execute(
+        [CreateUserDto(name="Bad Email", email="nope")]
+    )
+
+    # Assert
+    assert results[0].error is not None
+    mock_repository.get_existing_emails.assert_not_called()
+    mock_repository.create_many.assert_not_called()
@@ -9,6 +9,7 @@ from core.application.use_cases.create_user_use_case import (
     CreateUserUseCase,
 )
 from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
 from core.domain.value_objects.email_address import EmailAddress
 
 
@@ -26,7 +27,6 @@ def test_create_user_success() -> None:
         created_at=now,
         updated_at=now,
     )
-    mock_repository.get_by_email.return_value = None
     mock_repository.create.return_value = created_user
 
     use_case = CreateUserUseCase(mock_repository)
@@ -35,14 +35,15 @@ def test_create_user_success() -> None:
     )
 
     # Act
-    result = use_case.execute(dto)
+    result, created = use_case.execute(dto)
 
     # Assert
+    assert created is True
     assert result.id == 1
     assert result.name == "John Doe"
     assert result.email == "test@example.com"
     assert result.active is True
-    mock_repository.get_by_email.assert_called_once_with("test@example.com")
+    mock_repository.get_by_email.assert_not_called()
     mock_repository.create.assert_called_once()
 
 
@@ -50,17 +51,9 @@ def test_create_user_email_already_exists() -> None:
     """Test creating user with existing email raises error."""
     # Arrange
     mock_repository = Mock()
-    now = datetime.now(UTC)
-    email = EmailAddress("test@example.com")
-    existing_user = User(
-        id=1,
-        name="Existing User",
-        email=email,
-        active=True,
-        created_at=now,
-        updated_at=now,
+    mock_repository.create.side_effect = DuplicateEmailError(
+        "test@example.com"
     )
-    mock_repository.get_by_email.return_value = existing_user
 
     use_case = CreateUserUseCase(mock_repository)
     dto = CreateUserDto(
@@ -71,5 +64,37 @@ def test_create_user_email_already_exists() -> None:
     with pytest.raises(ValueError, match="already exists"):
         use_case.execute(dto)
 
-    mock_repository.get_by_email.assert_called_once_with("test@example.com")
+    mock_repository.get_by_email.assert_not_called()
+
+
+def test_create_user_upsert() -> None:
+    """Test upsert mode creates or updates by email."""
+    # Arrange
+    mock_repository = Mock()
+    now = datetime.now(UTC)
+    mock_repository.upsert_by_email.return_value = (
+        User(
+            id=7,
+            name="John Doe",
+            email=EmailAddress("test@example.com"),
+            active=False,
+            created_at=now,
+            updated_at=now,
+        ),
+        False,
+    )
+
+    use_case = CreateUserUseCase(mock_repository)
+    dto = CreateUserDto(
+        name="John Doe", email="test@example.com", active=False
+    )
+
+    # Act
+    result, created = use_case.execute(dto, upsert=True)
+
+    # Assert
+    assert created is False
+    assert result.id == 7
+    assert result.active is False
+    mock_repository.upsert_by_email.assert_called_once()
     mock_repository.create.assert_not_called()
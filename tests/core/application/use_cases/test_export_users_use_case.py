@@ -0,0 +1,43 @@
+"""Tests for ExportUsersUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+from core.application.use_cases.export_users_use_case import (
+    ExportUsersUseCase,
+)
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+
+
+def _user(user_id: int) -> User:
+    """Build a persisted user."""
+    now = datetime.now(UTC)
+    return User(
+        id=user_id,
+        name=f"User {user_id}",
+        email=EmailAddress(f"user{user_id}@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_export_users_is_lazy() -> None:
+    """Test users are mapped as they are pulled from the repository."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.iter_all.return_value = iter([_user(1), _user(2)])
+
+    use_case = ExportUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute(batch_size=500)
+
+    # Assert
+    mock_repository.iter_all.assert_not_called()
+    first = next(result)
+    assert first.id == 1
+    assert first.email == "user1@example.com"
+    assert [item.id for item in result] == [2]
+    mock_repository.iter_all.assert_called_once_with(batch_size=500)
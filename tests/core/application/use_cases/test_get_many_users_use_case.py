@@ -0,0 +1,54 @@
+"""Tests for GetManyUsersUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+from core.application.dto.user_dto import UserResponseDto
+from core.application.use_cases.get_many_users_use_case import (
+    GetManyUsersUseCase,
+)
+
+
+def _user(user_id: int) -> UserResponseDto:
+    """Build a stored user."""
+    now = datetime.now(UTC)
+    return UserResponseDto(
+        id=user_id,
+        name=f"User {user_id}",
+        email=f"user{user_id}@example.com",
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_get_many_users_in_request_order() -> None:
+    """Test users follow the requested ids and missing ids are reported."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_many_responses.return_value = [_user(1), _user(3)]
+    use_case = GetManyUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute([3, 2, 1, 3, 4])
+
+    # Assert
+    assert [user.id for user in result.users] == [3, 1]
+    assert result.missing_ids == [2, 4]
+    mock_repository.get_many_responses.assert_called_once_with(
+        [3, 2, 1, 4]
+    )
+
+
+def test_get_many_users_no_ids() -> None:
+    """Test an empty request does not query the repository."""
+    # Arrange
+    mock_repository = Mock()
+    use_case = GetManyUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute([])
+
+    # Assert
+    assert (result.users, result.missing_ids) == ([], [])
+    mock_repository.get_many_responses.assert_not_called()
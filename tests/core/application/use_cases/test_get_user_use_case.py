@@ -3,9 +3,8 @@
 from datetime import UTC, datetime
 from unittest.mock import Mock
 
+from core.application.dto.user_dto import UserResponseDto
 from core.application.use_cases.get_user_use_case import GetUserUseCase
-from core.domain.entities.user import User
-from core.domain.value_objects.email_address import EmailAddress
 
 
 def test_get_user_success() -> None:
@@ -13,8 +12,8 @@ def test_get_user_success() -> None:
     # Arrange
     mock_repository = Mock()
     now = datetime.now(UTC)
-    email = EmailAddress("test@example.com")
-    user = User(
+    email = "test@example.com"
+    user = UserResponseDto(
         id=1,
         name="John Doe",
         email=email,
@@ -22,7 +21,7 @@ def test_get_user_success() -> None:
         created_at=now,
         updated_at=now,
     )
-    mock_repository.get_by_id.return_value = user
+    mock_repository.get_response_by_id.return_value = user
 
     use_case = GetUserUseCase(mock_repository)
 
@@ -34,14 +33,14 @@ def test_get_user_success() -> None:
     assert result.id == 1
     assert result.name == "John Doe"
     assert result.email == "test@example.com"
-    mock_repository.get_by_id.assert_called_once_with(1)
+    mock_repository.get_response_by_id.assert_called_once_with(1)
 
 
 def test_get_user_not_found() -> None:
     """Test getting non-existent user returns None."""
     # Arrange
     mock_repository = Mock()
-    mock_repository.get_by_id.return_value = None
+    mock_repository.get_response_by_id.return_value = None
 
     use_case = GetUserUseCase(mock_repository)
 
@@ -50,4 +49,26 @@ def test_get_user_not_found() -> None:
 
     # Assert
     assert result is None
-    mock_repository.get_by_id.assert_called_once_with(999)
+    mock_repository.get_response_by_id.assert_called_once_with(999)
+
+
+def test_get_user_fields() -> None:
+    """Test a sparse fieldset is read without building the user."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_fields_by_id.return_value = {
+        "id": 1,
+        "email": "test@example.com",
+    }
+
+    use_case = GetUserUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute_fields(1, ["email", "id"])
+
+    # Assert
+    assert result == {"id": 1, "email": "test@example.com"}
+    mock_repository.get_fields_by_id.assert_called_once_with(
+        1, ("id", "email")
+    )
+    mock_repository.get_response_by_id.assert_not_called()
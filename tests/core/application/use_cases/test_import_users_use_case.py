@@ -0,0 +1,107 @@
+"""Tests for ImportUsersUseCase."""
+
+from unittest.mock import Mock
+
+from core.application.dto.user_dto import CreateUserDto, ImportUserRowDto
+from core.application.use_cases import import_users_use_case
+from core.application.use_cases.import_users_use_case import (
+    ImportUsersUseCase,
+)
+
+
+def _row(line: int, email: str, name: str = "John Doe") -> ImportUserRowDto:
+    """Build a parsed import row."""
+    return ImportUserRowDto(
+        line=line, user=CreateUserDto(name=name, email=email)
+    )
+
+
+def _consume_chunks(chunk_sizes: list, counts: tuple):
+    """Build an import_users side effect recording each chunk size."""
+
+    def import_users(chunks, upsert=False):
+        for chunk in chunks:
+            chunk_sizes.append(len(chunk))
+        return counts
+
+    return import_users
+
+
+def test_import_users_counts_and_rejections() -> None:
+    """Test invalid rows are rejected and the rest are imported."""
+    # Arrange
+    mock_repository = Mock()
+    chunk_sizes: list = []
+    mock_repository.import_users.side_effect = _consume_chunks(
+        chunk_sizes, (2, 0)
+    )
+    rows = [
+        _row(1, "john@example.com"),
+        _row(2, "not-an-email"),
+        _row(3, "jane@example.com", name="   "),
+        ImportUserRowDto(line=4, error="Invalid JSON"),
+        _row(5, "jane@example.com"),
+        _row(6, "john@example.com"),
+    ]
+
+    use_case = ImportUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute(rows, upsert=True)
+
+    # Assert
+    assert result.received == 6
+    assert result.created == 2
+    assert result.updated == 0
+    assert result.skipped == 1
+    assert result.rejected == 3
+    assert [rejection.line for rejection in result.rejections] == [2, 3, 4]
+    assert result.rejections[2].error == "Invalid JSON"
+    assert chunk_sizes == [3]
+    assert mock_repository.import_users.call_args.kwargs == {"upsert": True}
+
+
+def test_import_users_is_chunked_and_lazy() -> None:
+    """Test rows are pulled and validated one chunk at a time."""
+    # Arrange
+    mock_repository = Mock()
+    chunk_sizes: list = []
+    mock_repository.import_users.side_effect = _consume_chunks(
+        chunk_sizes, (5, 0)
+    )
+    pulled = []
+
+    def rows():
+        for i in range(5):
+            pulled.append(i)
+            # Only the current chunk has been read from the file
+            assert len(pulled) <= (len(chunk_sizes) + 1) * 2
+            yield _row(i + 1, f"user{i}@example.com")
+
+    use_case = ImportUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute(rows(), chunk_size=2)
+
+    # Assert
+    assert chunk_sizes == [2, 2, 1]
+    assert result.created == 5
+
+
+def test_import_users_caps_reported_rejections(monkeypatch) -> None:
+    """Test every rejection is counted but only the first are reported."""
+    # Arrange
+    monkeypatch.setattr(import_users_use_case, "MAX_REPORTED_REJECTIONS", 2)
+    mock_repository = Mock()
+    mock_repository.import_users.side_effect = _consume_chunks([], (0, 0))
+    rows = [ImportUserRowDto(line=i, error="Invalid JSON") for i in range(5)]
+
+    use_case = ImportUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute(rows)
+
+    # Assert
+    assert result.rejected == 5
+    assert len(result.rejections) == 2
+    assert result.skipped == 0
@@ -1,13 +1,20 @@
 """Tests for ListUsersUseCase."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from unittest.mock import Mock
+import pytest
 
+from core.application.dto.user_dto import (
+    UserFilterDto,
+    UserResponseDto,
+    normalize_fields,
+)
 from core.application.use_cases.list_users_use_case import (
+    COUNT_AUTO,
+    COUNT_ESTIMATE,
+    COUNT_EXACT,
     ListUsersUseCase,
 )
-from core.domain.entities.user import User
-from core.domain.value_objects.email_address import EmailAddress
 
 
 def test_list_users_success() -> None:
@@ -16,24 +23,24 @@ def test_list_users_success() -> None:
     mock_repository = Mock()
     now = datetime.now(UTC)
     users = [
-        User(
+        UserResponseDto(
             id=1,
             name="John Doe",
-            email=EmailAddress("juan@example.com"),
+            email="juan@example.com",
             active=True,
             created_at=now,
             updated_at=now,
         ),
-        User(
+        UserResponseDto(
             id=2,
             name="Jane Doe",
-            email=EmailAddress("maria@example.com"),
+            email="maria@example.com",
             active=True,
             created_at=now,
             updated_at=now,
         ),
     ]
-    mock_repository.get_all.return_value = users
+    mock_repository.get_all_page.return_value = (users, None)
 
     use_case = ListUsersUseCase(mock_repository)
 
@@ -48,7 +55,9 @@ def test_list_users_success() -> None:
     assert result[1].id == 2
     assert result[1].name == "Jane Doe"
     assert result[1].email == "maria@example.com"
-    mock_repository.get_all.assert_called_once_with(skip=0, limit=100)
+    mock_repository.get_all_page.assert_called_once_with(
+        skip=0, limit=100, filters=None, fields=None, with_count=False
+    )
 
 
 def test_list_users_with_pagination() -> None:
@@ -57,16 +66,16 @@ def test_list_users_with_pagination() -> None:
     mock_repository = Mock()
     now = datetime.now(UTC)
     users = [
-        User(
+        UserResponseDto(
             id=1,
             name="John Doe",
-            email=EmailAddress("juan@example.com"),
+            email="juan@example.com",
             active=True,
             created_at=now,
             updated_at=now,
         ),
     ]
-    mock_repository.get_all.return_value = users
+    mock_repository.get_all_page.return_value = (users, None)
 
     use_case = ListUsersUseCase(mock_repository)
 
@@ -75,14 +84,16 @@ def test_list_users_with_pagination() -> None:
 
     # Assert
     assert len(result) == 1
-    mock_repository.get_all.assert_called_once_with(skip=10, limit=5)
+    mock_repository.get_all_page.assert_called_once_with(
+        skip=10, limit=5, filters=None, fields=None, with_count=False
+    )
 
 
 def test_list_users_empty() -> None:
     """Test listing users when repository returns empty list."""
     # Arrange
     mock_repository = Mock()
-    mock_repository.get_all.return_value = []
+    mock_repository.get_all_page.return_value = ([], None)
 
     use_case = ListUsersUseCase(mock_repository)
 
@@ -92,4 +103,260 @@ def test_list_users_empty() -> None:
     # Assert
     assert len(result) == 0
     assert result == []
-    mock_repository.get_all.assert_called_once_with(skip=0, limit=100)
+    mock_repository.get_all_page.assert_called_once_with(
+        skip=0, limit=100, filters=None, fields=None, with_count=False
+    )
+
+
+def test_list_users_page_first_page() -> None:
+    """Test keyset page without cursor starts from the beginning."""
+    # Arrange
+    mock_repository = Mock()
+    now = datetime.now(UTC)
+    users = [
+        UserResponseDto(
+            id=i,
+            name=f"User {i}",
+            email=f"user{i}@example.com",
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in (1, 2)
+    ]
+    mock_repository.get_all_page.return_value = (users, None)
+
+    use_case = ListUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute_page(limit=2)
+
+    # Assert
+    assert [item.id for item in result.items] == [1, 2]
+    assert result.next_cursor is not None
+    assert ListUsersUseCase.decode_cursor(result.next_cursor) == 2
+    mock_repository.get_all_page.assert_called_once_with(
+        limit=2, after_id=None, filters=None, fields=None, with_count=False
+    )
+
+
+def test_list_users_page_with_cursor() -> None:
+    """Test keyset page seeks after the id encoded in the cursor."""
+    # Arrange
+    mock_repository = Mock()
+    now = datetime.now(UTC)
+    users = [
+        UserResponseDto(
+            id=8,
+            name="John Doe",
+            email="juan@example.com",
+            active=True,
+            created_at=now,
+            updated_at=now,
+        ),
+    ]
+    mock_repository.get_all_page.return_value = (users, None)
+
+    use_case = ListUsersUseCase(mock_repository)
+    cursor = ListUsersUseCase.encode_cursor(7)
+
+    # Act
+    result = use_case.execute_page(cursor=cursor, limit=10)
+
+    # Assert
+    assert len(result.items) == 1
+    assert result.next_cursor is None
+    mock_repository.get_all_page.assert_called_once_with(
+        limit=10, after_id=7, filters=None, fields=None, with_count=False
+    )
+
+
+def test_list_users_page_invalid_cursor() -> None:
+    """Test malformed cursor raises error without querying."""
+    # Arrange
+    mock_repository = Mock()
+    use_case = ListUsersUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        use_case.execute_page(cursor="not-a-cursor")
+
+    mock_repository.get_all_page.assert_not_called()
+
+
+def test_list_users_page_with_filters() -> None:
+    """Test filters reach the repository with datetimes in UTC."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_all_page.return_value = ([], None)
+    use_case = ListUsersUseCase(mock_repository)
+    filters = UserFilterDto(
+        active=True,
+        created_after=datetime(2025, 1, 1),
+        created_before=datetime(
+            2025, 1, 8, 2, tzinfo=timezone(timedelta(hours=2))
+        ),
+    )
+
+    # Act
+    use_case.execute_page(limit=10, filters=filters)
+
+    # Assert
+    mock_repository.get_all_page.assert_called_once_with(
+        limit=10,
+        after_id=None,
+        filters=UserFilterDto(
+            active=True,
+            created_after=datetime(2025, 1, 1, tzinfo=UTC),
+            created_before=datetime(2025, 1, 8, tzinfo=UTC),
+        ),
+        fields=None,
+        with_count=False,
+    )
+
+
+def test_list_users_invalid_created_range() -> None:
+    """Test an empty created_at range raises error without querying."""
+    # Arrange
+    mock_repository = Mock()
+    use_case = ListUsersUseCase(mock_repository)
+    filters = UserFilterDto(
+        created_after=datetime(2025, 1, 8, tzinfo=UTC),
+        created_before=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="created_after"):
+        use_case.execute(filters=filters)
+
+    mock_repository.get_all_page.assert_not_called()
+
+
+def _user(user_id: int) -> UserResponseDto:
+    """Build a user with the given id."""
+    now = datetime.now(UTC)
+    return UserResponseDto(
+        id=user_id,
+        name=f"User {user_id}",
+        email=f"user{user_id}@example.com",
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_list_users_page_exact_count() -> None:
+    """Test an exact count comes with the page from a single call."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_all_page.return_value = ([_user(1)], 42)
+    use_case = ListUsersUseCase(mock_repository)
+
+    # Act
+    page = use_case.execute_page(limit=1, count=COUNT_EXACT)
+
+    # Assert
+    assert page.total_count == 42
+    assert page.total_count_mode == COUNT_EXACT
+    assert page.next_cursor is not None
+    mock_repository.get_all_page.assert_called_once_with(
+        limit=1, after_id=None, filters=None, fields=None, with_count=True
+    )
+    mock_repository.estimate_count.assert_not_called()
+
+
+def test_list_users_offset_page_estimated_count() -> None:
+    """Test an estimated count does not count the rows."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_all_page.return_value = ([_user(11)], None)
+    mock_repository.estimate_count.return_value = 5_000_000
+    use_case = ListUsersUseCase(mock_repository)
+
+    # Act
+    page = use_case.execute_offset_page(
+        skip=10, limit=1, count=COUNT_ESTIMATE
+    )
+
+    # Assert
+    assert page.total_count == 5_000_000
+    assert page.total_count_mode == COUNT_ESTIMATE
+    assert page.next_cursor is None
+    mock_repository.get_all_page.assert_called_once_with(
+        skip=10, limit=1, filters=None, fields=None, with_count=False
+    )
+
+
+def test_list_users_auto_count() -> None:
+    """Test auto counts exactly only when the estimate is small."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_all_page.return_value = ([], 0)
+    use_case = ListUsersUseCase(mock_repository, exact_count_max_rows=1000)
+
+    # Act
+    mock_repository.estimate_count.return_value = 1000
+    small = use_case.execute_page(count=COUNT_AUTO)
+    mock_repository.estimate_count.return_value = 1001
+    large = use_case.execute_page(count=COUNT_AUTO)
+
+    # Assert
+    assert (small.total_count, small.total_count_mode) == (0, COUNT_EXACT)
+    assert (large.total_count, large.total_count_mode) == (
+        1001,
+        COUNT_ESTIMATE,
+    )
+
+
+def test_list_users_invalid_count_mode() -> None:
+    """Test an unknown count mode raises error without querying."""
+    # Arrange
+    mock_repository = Mock()
+    use_case = ListUsersUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid count mode"):
+        use_case.execute_page(count="approximate")
+
+    mock_repository.get_all_page.assert_not_called()
+
+
+def test_list_users_page_fields() -> None:
+    """Test a sparse fieldset reads its fields plus id for the cursor."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.get_all_page.return_value = (
+        [
+            {"id": 1, "email": "user1@example.com"},
+            {"id": 2, "email": "user2@example.com"},
+        ],
+        None,
+    )
+    use_case = ListUsersUseCase(mock_repository)
+
+    # Act
+    page = use_case.execute_page(limit=2, fields=["email", "email"])
+
+    # Assert
+    assert page.items == [
+        {"email": "user1@example.com"},
+        {"email": "user2@example.com"},
+    ]
+    assert ListUsersUseCase.decode_cursor(page.next_cursor) == 2
+    mock_repository.get_all_page.assert_called_once_with(
+        limit=2,
+        after_id=None,
+        filters=None,
+        fields=("id", "email"),
+        with_count=False,
+    )
+
+
+def test_normalize_fields() -> None:
+    """Test fieldsets are put in response order and unknown ones fail."""
+    assert normalize_fields(None) is None
+    assert normalize_fields(["email", "id", "email"]) == ("id", "email")
+    with pytest.raises(ValueError, match="Unknown fields: password"):
+        normalize_fields(["email", "password"])
+    with pytest.raises(ValueError, match="At least one field"):
+        normalize_fields([])
@@ -0,0 +1,69 @@
+"""Tests for SearchUsersUseCase."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+import pytest
+
+from core.application.use_cases.search_users_use_case import (
+    SearchUsersUseCase,
+)
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+
+
+def _user(user_id: int) -> User:
+    """Build a user with the given id."""
+    now = datetime.now(UTC)
+    return User(
+        id=user_id,
+        name=f"User {user_id}",
+        email=EmailAddress(f"user{user_id}@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_search_users_success() -> None:
+    """Test search returns users in repository order."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.search.return_value = [_user(2), _user(1)]
+
+    use_case = SearchUsersUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute("user", limit=5)
+
+    # Assert
+    assert [item.id for item in result] == [2, 1]
+    assert result[0].email == "user2@example.com"
+    mock_repository.search.assert_called_once_with("user", limit=5)
+
+
+def test_search_users_normalizes_whitespace() -> None:
+    """Test the query is trimmed and inner whitespace collapsed."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.search.return_value = []
+
+    use_case = SearchUsersUseCase(mock_repository)
+
+    # Act
+    use_case.execute("  John   Doe ")
+
+    # Assert
+    mock_repository.search.assert_called_once_with("John Doe", limit=20)
+
+
+def test_search_users_query_too_short() -> None:
+    """Test a query shorter than the minimum is rejected before searching."""
+    # Arrange
+    mock_repository = Mock()
+    use_case = SearchUsersUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="at least 3 characters"):
+        use_case.execute(" ab ")
+
+    mock_repository.search.assert_not_called()
@@ -1,7 +1,7 @@
 """Tests for UpdateUserUseCase."""
 
 from datetime import UTC, datetime
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 import pytest
 
 from core.application.dto.user_dto import UpdateUserDto
@@ -9,23 +9,16 @@ from core.application.use_cases.update_user_use_case import (
     UpdateUserUseCase,
 )
 from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
 from core.domain.value_objects.email_address import EmailAddress
 
 
 def test_update_user_success() -> None:
-    """Test successful user update."""
+    """Test successful user update in a single repository write."""
     # Arrange
     mock_repository = Mock()
     now = datetime.now(UTC)
     email = EmailAddress("test@example.com")
-    user = User(
-        id=1,
-        name="John Doe",
-        email=email,
-        active=True,
-        created_at=now,
-        updated_at=now,
-    )
     updated_user = User(
         id=1,
         name="John Doe Updated",
@@ -34,8 +27,7 @@ def test_update_user_success() -> None:
         created_at=now,
         updated_at=now,
     )
-    mock_repository.get_by_id.return_value = user
-    mock_repository.update.return_value = updated_user
+    mock_repository.update_fields.return_value = updated_user
 
     use_case = UpdateUserUseCase(mock_repository)
     dto = UpdateUserDto(name="John Doe Updated")
@@ -47,14 +39,18 @@ def test_update_user_success() -> None:
     assert result is not None
     assert result.id == 1
     assert result.name == "John Doe Updated"
-    mock_repository.get_by_id.assert_called_once_with(1)
-    mock_repository.update.assert_called_once()
+    mock_repository.update_fields.assert_called_once_with(
+        1, {"name": "John Doe Updated", "updated_at": ANY}, {}
+    )
+    mock_repository.get_by_id.assert_not_called()
+    mock_repository.update.assert_not_called()
 
 
 def test_update_user_not_found() -> None:
     """Test updating non-existent user returns None."""
     # Arrange
     mock_repository = Mock()
+    mock_repository.update_fields.return_value = None
     mock_repository.get_by_id.return_value = None
 
     use_case = UpdateUserUseCase(mock_repository)
@@ -66,71 +62,112 @@ def test_update_user_not_found() -> None:
     # Assert
     assert result is None
     mock_repository.get_by_id.assert_called_once_with(999)
-    mock_repository.update.assert_not_called()
 
 
-def test_update_user_email() -> None:
-    """Test updating user email."""
+def test_update_user_nothing_to_change() -> None:
+    """Test a patch that changes nothing returns the current user."""
     # Arrange
     mock_repository = Mock()
     now = datetime.now(UTC)
-    email = EmailAddress("test@example.com")
     user = User(
         id=1,
         name="John Doe",
-        email=email,
-        active=True,
-        created_at=now,
-        updated_at=now,
-    )
-    updated_user = User(
-        id=1,
-        name="John Doe",
-        email=EmailAddress("new@example.com"),
+        email=EmailAddress("test@example.com"),
         active=True,
         created_at=now,
         updated_at=now,
     )
+    mock_repository.update_fields.return_value = None
     mock_repository.get_by_id.return_value = user
-    mock_repository.get_by_email.return_value = None
-    mock_repository.update.return_value = updated_user
 
     use_case = UpdateUserUseCase(mock_repository)
-    dto = UpdateUserDto(email="new@example.com")
+    dto = UpdateUserDto(name="John Doe")
 
     # Act
     result = use_case.execute(1, dto)
 
     # Assert
     assert result is not None
-    assert result.email == "new@example.com"
-    mock_repository.get_by_email.assert_called_once_with("new@example.com")
+    assert result.name == "John Doe"
+    assert result.updated_at == now
 
 
-def test_update_user_email_already_exists() -> None:
-    """Test updating user with existing email raises error."""
+def test_update_user_empty_patch() -> None:
+    """Test an empty patch does not write and returns the current user."""
     # Arrange
     mock_repository = Mock()
     now = datetime.now(UTC)
-    email = EmailAddress("test@example.com")
-    user = User(
+    mock_repository.get_by_id.return_value = User(
         id=1,
         name="John Doe",
-        email=email,
+        email=EmailAddress("test@example.com"),
         active=True,
         created_at=now,
         updated_at=now,
     )
-    existing_user = User(
-        id=2,  # Different ID
-        name="Other User",
+
+    use_case = UpdateUserUseCase(mock_repository)
+
+    # Act
+    result = use_case.execute(1, UpdateUserDto())
+
+    # Assert
+    assert result is not None
+    assert result.id == 1
+    mock_repository.update_fields.assert_not_called()
+
+
+def test_update_user_invalid_name() -> None:
+    """Test updating user with blank name raises error before any query."""
+    # Arrange
+    mock_repository = Mock()
+    use_case = UpdateUserUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Name cannot be empty"):
+        use_case.execute(1, UpdateUserDto(name="   "))
+
+    mock_repository.update_fields.assert_not_called()
+    mock_repository.get_by_id.assert_not_called()
+
+
+def test_update_user_email() -> None:
+    """Test updating user email."""
+    # Arrange
+    mock_repository = Mock()
+    now = datetime.now(UTC)
+    updated_user = User(
+        id=1,
+        name="John Doe",
         email=EmailAddress("new@example.com"),
         active=True,
         created_at=now,
         updated_at=now,
     )
-    mock_repository.get_by_id.return_value = user
-    mock_repository.get_by_email.return_value = existing_user
+    mock_repository.update_fields.return_value = updated_user
+
+    use_case = UpdateUserUseCase(mock_repository)
+    dto = UpdateUserDto(email="new@example.com")
+
+    # Act
+    result = use_case.execute(1, dto)
+
+    # Assert
+    assert result is not None
+    assert result.email == "new@example.com"
+    mock_repository.get_by_email.assert_not_called()
+    mock_repository.update_fields.assert_called_once_with(
+        1, {"email": "new@example.com", "updated_at": ANY}, {}
+    )
+
+
+def test_update_user_email_already_exists() -> None:
+    """Test updating user with existing email raises error."""
+    # Arrange
+    mock_repository = Mock()
+    mock_repository.update_fields.side_effect = DuplicateEmailError(
+        "new@example.com"
+    )
 
     use_case = UpdateUserUseCase(mock_repository)
     dto = UpdateUserDto(email="new@example.com")
@@ -139,8 +176,7 @@ def test_update_user_email_already_exists() -> None:
     with pytest.raises(ValueError, match="already exists"):
         use_case.execute(1, dto)
 
-    mock_repository.get_by_email.assert_called_once_with("new@example.com")
-    mock_repository.update.assert_not_called()
+    mock_repository.get_by_email.assert_not_called()
 
 
 def test_update_user_email_same_user() -> None:
@@ -148,26 +184,16 @@ def test_update_user_email_same_user() -> None:
     # Arrange
     mock_repository = Mock()
     now = datetime.now(UTC)
-    email = EmailAddress("test@example.com")
     user = User(
         id=1,
         name="John Doe",
-        email=email,
-        active=True,
-        created_at=now,
-        updated_at=now,
-    )
-    updated_user = User(
-        id=1,
-        name="John Doe",
-        email=email,
+        email=EmailAddress("test@example.com"),
         active=True,
         created_at=now,
         updated_at=now,
     )
+    mock_repository.update_fields.return_value = None
     mock_repository.get_by_id.return_value = user
-    mock_repository.get_by_email.return_value = user  # Same user
-    mock_repository.update.return_value = updated_user
 
     use_case = UpdateUserUseCase(mock_repository)
     dto = UpdateUserDto(email="test@example.com")
@@ -177,33 +203,23 @@ def test_update_user_email_same_user() -> None:
 
     # Assert
     assert result is not None
-    mock_repository.update.assert_called_once()
+    mock_repository.update_fields.assert_called_once()
 
 
 def test_update_user_active() -> None:
-    """Test updating user active status."""
+    """Test deactivating requires the user to be currently active."""
     # Arrange
     mock_repository = Mock()
     now = datetime.now(UTC)
-    email = EmailAddress("test@example.com")
-    user = User(
-        id=1,
-        name="John Doe",
-        email=email,
-        active=True,
-        created_at=now,
-        updated_at=now,
-    )
     updated_user = User(
         id=1,
         name="John Doe",
-        email=email,
+        email=EmailAddress("test@example.com"),
         active=False,
         created_at=now,
         updated_at=now,
     )
-    mock_repository.get_by_id.return_value = user
-    mock_repository.update.return_value = updated_user
+    mock_repository.update_fields.return_value = updated_user
 
     use_case = UpdateUserUseCase(mock_repository)
     dto = UpdateUserDto(active=False)
@@ -214,23 +230,38 @@ def test_update_user_active() -> None:
     # Assert
     assert result is not None
     assert result.active is False
-    mock_repository.update.assert_called_once()
+    mock_repository.update_fields.assert_called_once_with(
+        1, {"active": False, "updated_at": ANY}, {"active": True}
+    )
 
 
-def test_update_user_multiple_fields() -> None:
-    """Test updating multiple user fields at once."""
+def test_update_user_already_active() -> None:
+    """Test activating an active user raises the domain error."""
     # Arrange
     mock_repository = Mock()
     now = datetime.now(UTC)
-    email = EmailAddress("test@example.com")
-    user = User(
+    mock_repository.update_fields.return_value = None
+    mock_repository.get_by_id.return_value = User(
         id=1,
         name="John Doe",
-        email=email,
+        email=EmailAddress("test@example.com"),
         active=True,
         created_at=now,
         updated_at=now,
     )
+
+    use_case = UpdateUserUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="already active"):
+        use_case.execute(1, UpdateUserDto(active=True))
+
+
+def test_update_user_multiple_fields() -> None:
+    """Test updating multiple user fields at once."""
+    # Arrange
+    mock_repository = Mock()
+    now = datetime.now(UTC)
     updated_user = User(
         id=1,
         name="John Doe Updated",
@@ -239,9 +270,7 @@ def test_update_user_multiple_fields() -> None:
         created_at=now,
         updated_at=now,
     )
-    mock_repository.get_by_id.return_value = user
-    mock_repository.get_by_email.return_value = None
-    mock_repository.update.return_value = updated_user
+    mock_repository.update_fields.return_value = updated_user
 
     use_case = UpdateUserUseCase(mock_repository)
     dto = UpdateUserDto(
@@ -258,3 +287,13 @@ def test_update_user_multiple_fields() -> None:
     assert result.name == "John Doe Updated"
     assert result.email == "new@example.com"
     assert result.active is False
+    mock_repository.update_fields.assert_called_once_with(
+        1,
+        {
+            "name": "John Doe Updated",
+            "email": "new@example.com",
+            "active": False,
+            "updated_at": ANY,
+        },
+        {"active": True},
+    )
@@ -25,6 +25,22 @@ def test_create_user() -> None:
     assert user.active is True
 
 
+def test_user_is_slotted() -> None:
+    """Test users hold their fields in slots, without a ``__dict__``."""
+    now = datetime.now(UTC)
+    user = User(
+        id=1,
+        name="John Doe",
+        email=EmailAddress("test@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(AttributeError):
+        user.nickname = "Johnny"  # type: ignore[attr-defined]
+
+
 def test_create_user_empty_name() -> None:
     """Test creating user with empty name raises error."""
     email = EmailAddress("test@example.com")
@@ -120,3 +136,30 @@ def test_update_name_empty() -> None:
     )
     with pytest.raises(ValueError, match="Name cannot be empty"):
         user.update_name("")
+
+
+def test_validate_many() -> None:
+    """Test batch validation builds valid users and indexes errors."""
+    now = datetime.now(UTC)
+    users, errors = User.validate_many(
+        [
+            ("John Doe", "john@example.com", True),
+            ("", "empty@example.com", True),
+            ("Jane Doe", "invalid-email", False),
+            ("Jane Doe", "jane@example.com", False),
+        ],
+        now=now,
+    )
+    assert [index for index, _ in users] == [0, 3]
+    jane = users[1][1]
+    assert (jane.id, jane.name, str(jane.email), jane.active) == (
+        None,
+        "Jane Doe",
+        "jane@example.com",
+        False,
+    )
+    assert jane.created_at == jane.updated_at == now
+    assert errors == {
+        1: "Name cannot be empty",
+        2: "Invalid email format: invalid-email",
+    }
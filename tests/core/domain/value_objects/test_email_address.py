@@ -1,5 +1,6 @@
 """Tests for EmailAddress value object."""
 
+import copy
 import pytest
 
 from core.domain.value_objects.email_address import EmailAddress
@@ -36,3 +37,39 @@ def test_email_immutability() -> None:
     # Should be frozen dataclass
     with pytest.raises(Exception):
         email.value = "new@example.com"
+
+
+def test_email_is_slotted() -> None:
+    """Test EmailAddress has no ``__dict__`` and still copies and hashes."""
+    email = EmailAddress("test@example.com")
+    assert not hasattr(email, "__dict__")
+    assert copy.copy(email) == email
+    assert hash(copy.deepcopy(email)) == hash(email)
+
+
+def test_parse_many_reports_errors_by_index() -> None:
+    """Test a batch keeps valid emails and indexes the invalid ones."""
+    emails, errors = EmailAddress.parse_many(
+        ["a@example.com", "invalid-email", "", "b@example.com"]
+    )
+    assert emails == [
+        (0, EmailAddress("a@example.com")),
+        (3, EmailAddress("b@example.com")),
+    ]
+    assert errors == {
+        1: "Invalid email format: invalid-email",
+        2: "Email cannot be empty",
+    }
+
+
+def test_parse_many_memoized() -> None:
+    """Test memoized parsing reuses outcomes of repeated values."""
+    emails, errors = EmailAddress.parse_many(
+        ["a@example.com", "bad", "a@example.com", "bad"], memoize=True
+    )
+    assert [index for index, _ in emails] == [0, 2]
+    assert emails[0][1] is emails[1][1]
+    assert errors == {
+        1: "Invalid email format: bad",
+        3: "Invalid email format: bad",
+    }
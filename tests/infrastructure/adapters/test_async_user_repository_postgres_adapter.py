@@ -0,0 +1,352 @@
+"""Tests for AsyncUserRepositoryPostgresAdapter."""
+
+from datetime import UTC, datetime
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core.application.dto.user_dto import UserFilterDto
+from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
+from core.domain.value_objects.email_address import EmailAddress
+from infrastructure.adapters.repositories.async_user_repository_postgres_adapter import (  # noqa: E501
+    AsyncUserRepositoryPostgresAdapter,
+)
+from infrastructure.database.models.user_model import Base
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Create a test async database session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+def _new_user(email: str = "test@example.com") -> User:
+    """Build a user that has not been persisted yet."""
+    now = datetime.now(UTC)
+    return User(
+        id=None,
+        name="John Doe",
+        email=EmailAddress(email),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_user(db_session) -> None:
+    """Test creating a user and reading it back by id and email."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+
+    # Act
+    created = await adapter.create(_new_user())
+    by_id = await adapter.get_by_id(created.id or 0)
+    by_email = await adapter.get_by_email("test@example.com")
+
+    # Assert
+    assert created.id is not None
+    assert by_id is not None and by_id.id == created.id
+    assert by_email is not None and by_email.id == created.id
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_not_found(db_session) -> None:
+    """Test getting non-existent user returns None."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+
+    # Act
+    result = await adapter.get_by_id(999)
+
+    # Assert
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_many(db_session) -> None:
+    """Test many users are read by id, leaving out unknown ids."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create_many(
+        [_new_user(f"test{i}@example.com") for i in range(3)]
+    )
+    ids = [user.id for user in created if user]
+
+    # Act
+    users = await adapter.get_many([ids[2], 999, ids[0]])
+    responses = await adapter.get_many_responses([ids[1]])
+
+    # Assert
+    assert sorted(user.id for user in users) == [ids[0], ids[2]]
+    assert [user.email for user in responses] == ["test1@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_after_id(db_session) -> None:
+    """Test keyset pagination returns users after the given id in order."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = [
+        await adapter.create(_new_user(f"test{i}@example.com"))
+        for i in range(4)
+    ]
+
+    # Act
+    everyone = await adapter.get_all()
+    page = await adapter.get_all(limit=2, after_id=created[0].id)
+
+    # Assert
+    assert len(everyone) == 4
+    assert [u.id for u in page] == [created[1].id, created[2].id]
+
+
+@pytest.mark.asyncio
+async def test_get_all_active_filter(db_session) -> None:
+    """Test listing only active users."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    active = await adapter.create(_new_user("a@example.com"))
+    inactive_user = _new_user("b@example.com")
+    inactive_user.active = False
+    await adapter.create(inactive_user)
+
+    # Act
+    results = await adapter.get_all(filters=UserFilterDto(active=True))
+
+    # Assert
+    assert [user.id for user in results] == [active.id]
+
+
+@pytest.mark.asyncio
+async def test_get_all_page_with_count(db_session) -> None:
+    """Test a page carries the count of all users."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    first = await adapter.create(_new_user("a@example.com"))
+    await adapter.create(_new_user("b@example.com"))
+
+    # Act
+    page, total_count = await adapter.get_all_page(
+        limit=1, with_count=True
+    )
+    estimate = await adapter.estimate_count()
+
+    # Assert
+    assert [user.id for user in page] == [first.id]
+    assert total_count == 2
+    assert estimate == 2
+
+
+@pytest.mark.asyncio
+async def test_update_user(db_session) -> None:
+    """Test updating a user."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create(_new_user())
+    created.update_name("Jane Doe")
+
+    # Act
+    result = await adapter.update(created)
+
+    # Assert
+    assert result.name == "Jane Doe"
+
+
+@pytest.mark.asyncio
+async def test_delete_user(db_session) -> None:
+    """Test deleting a user and deleting it again."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create(_new_user())
+
+    # Act
+    deleted = await adapter.delete(created.id or 0)
+    deleted_again = await adapter.delete(created.id or 0)
+
+    # Assert
+    assert deleted is True
+    assert deleted_again is False
+    assert await adapter.get_by_id(created.id or 0) is None
+
+
+@pytest.mark.asyncio
+async def test_create_many(db_session) -> None:
+    """Test creating many users skips emails that already exist."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    await adapter.create(_new_user("test1@example.com"))
+    users = [_new_user(f"test{i}@example.com") for i in range(3)]
+
+    # Act
+    results = await adapter.create_many(users)
+    existing = await adapter.get_existing_emails(
+        ["test0@example.com", "missing@example.com"]
+    )
+
+    # Assert
+    assert results[0] is not None and results[0].id is not None
+    assert results[1] is None
+    assert results[2] is not None
+    assert existing == {"test0@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_update_fields(db_session) -> None:
+    """Test partial update applies once and skips a no-op patch."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create(_new_user())
+
+    # Act
+    updated = await adapter.update_fields(
+        created.id or 0, {"name": "Jane Doe"}
+    )
+    noop = await adapter.update_fields(created.id or 0, {"name": "Jane Doe"})
+
+    # Assert
+    assert updated is not None and updated.name == "Jane Doe"
+    assert noop is None
+
+
+@pytest.mark.asyncio
+async def test_create_duplicate_and_upsert(db_session) -> None:
+    """Test create rejects a taken email while upsert updates it."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create(_new_user())
+    renamed = _new_user()
+    renamed.update_name("Jane Doe")
+
+    # Act & Assert
+    with pytest.raises(DuplicateEmailError):
+        await adapter.create(_new_user())
+    upserted, inserted = await adapter.upsert_by_email(renamed)
+    assert inserted is False
+    assert upserted.id == created.id
+    assert upserted.name == "Jane Doe"
+
+
+@pytest.mark.asyncio
+async def test_search(db_session) -> None:
+    """Test search matches emails, ranks them and ties by id."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    await adapter.create(_new_user("johnny.walker@example.com"))
+    await adapter.create(_new_user("mary@example.com"))
+    await adapter.create(_new_user("john@example.com"))
+
+    # Act
+    walkers = await adapter.search("walker")
+    closest = await adapter.search("example", limit=2)
+
+    # Assert
+    assert [str(user.email) for user in walkers] == [
+        "johnny.walker@example.com"
+    ]
+    # Closer (shorter) emails first, equally close ones by id
+    assert [str(user.email) for user in closest] == [
+        "mary@example.com",
+        "john@example.com",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_all(db_session) -> None:
+    """Test iterating over all users across several fetch batches."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create_many(
+        [_new_user(f"test{i}@example.com") for i in range(5)]
+    )
+
+    # Act
+    results = [user async for user in adapter.iter_all(batch_size=2)]
+
+    # Assert
+    assert [user.id for user in results] == [
+        user.id for user in created if user
+    ]
+
+
+@pytest.mark.asyncio
+async def test_responses_map_rows_to_dtos(db_session) -> None:
+    """Test reads as response DTOs match the users that were stored."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create_many(
+        [_new_user(f"test{i}@example.com") for i in range(3)]
+    )
+    ids = [user.id for user in created if user]
+
+    # Act
+    by_id = await adapter.get_response_by_id(ids[0])
+    missing = await adapter.get_response_by_id(999)
+    page, no_count = await adapter.get_all_page(limit=2)
+    counted, total = await adapter.get_all_page(skip=2, with_count=True)
+
+    # Assert
+    assert by_id is not None
+    assert (by_id.id, by_id.email) == (ids[0], "test0@example.com")
+    assert missing is None
+    assert ([user.id for user in page], no_count) == (ids[:2], None)
+    assert ([user.id for user in counted], total) == ([ids[2]], 3)
+
+
+@pytest.mark.asyncio
+async def test_fields_read_only_requested_columns(db_session) -> None:
+    """Test sparse fieldsets come back as dicts of their columns."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    created = await adapter.create_many(
+        [_new_user(f"test{i}@example.com") for i in range(3)]
+    )
+    ids = [user.id for user in created if user]
+
+    # Act
+    by_id = await adapter.get_fields_by_id(ids[0], ("email",))
+    page, _ = await adapter.get_all_page(limit=2, fields=("id",))
+    counted, total = await adapter.get_all_page(
+        skip=2, fields=("email",), with_count=True
+    )
+    exported = [
+        row async for row in adapter.iter_all_fields(("id",), batch_size=2)
+    ]
+
+    # Assert
+    assert by_id == {"email": "test0@example.com"}
+    assert page == [{"id": ids[0]}, {"id": ids[1]}]
+    assert (counted, total) == ([{"email": "test2@example.com"}], 3)
+    assert exported == [{"id": user_id} for user_id in ids]
+
+
+@pytest.mark.asyncio
+async def test_import_users(db_session) -> None:
+    """Test importing skips existing emails, or updates them on upsert."""
+    # Arrange
+    adapter = AsyncUserRepositoryPostgresAdapter(db_session)
+    await adapter.create(_new_user("john@example.com"))
+    renamed = _new_user("john@example.com")
+    renamed.update_name("John Again")
+
+    async def chunks():
+        yield [renamed, _new_user("jane@example.com")]
+
+    # Act
+    skipped_counts = await adapter.import_users(chunks())
+    upserted_counts = await adapter.import_users(chunks(), upsert=True)
+
+    # Assert
+    assert skipped_counts == (1, 0)
+    assert upserted_counts == (0, 2)
+    john = await adapter.get_by_email("john@example.com")
+    assert john is not None and john.name == "John Again"
@@ -0,0 +1,141 @@
+"""Tests for BatchingUserRepositoryAdapter and its async twin."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import AsyncIterator, List, Optional, Sequence
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
+from core.domain.value_objects.email_address import EmailAddress
+from infrastructure.adapters.batching.write_batcher import (
+    AsyncWriteBatcher,
+    WriteBatcher,
+)
+from infrastructure.adapters.repositories.async_batching_user_repository_adapter import (  # noqa: E501
+    AsyncBatchingUserRepositoryAdapter,
+)
+from infrastructure.adapters.repositories.batching_user_repository_adapter import (  # noqa: E501
+    BatchingUserRepositoryAdapter,
+    to_create_outcomes,
+)
+
+
+def _user(email: str, user_id: Optional[int] = None) -> User:
+    """Build a user with the given email."""
+    now = datetime.now(UTC)
+    return User(
+        id=user_id,
+        name="John Doe",
+        email=EmailAddress(email),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_concurrent_creates_share_one_transaction() -> None:
+    """Test creates of concurrent requests run one create_many."""
+    # Arrange
+    batcher = WriteBatcher(max_size=3, max_wait_seconds=5)
+    repository = Mock()
+
+    def create_many(users: Sequence[User]) -> List[Optional[User]]:
+        return [
+            None if str(user.email) == "taken@example.com"
+            else replace(user, id=index + 1)
+            for index, user in enumerate(users)
+        ]
+
+    repository.create_many.side_effect = create_many
+    adapters = [
+        BatchingUserRepositoryAdapter(repository, batcher) for _ in range(3)
+    ]
+    emails = ["a@example.com", "taken@example.com", "b@example.com"]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(adapter.create, _user(email))
+            for adapter, email in zip(adapters, emails)
+        ]
+        outcomes = [
+            future.exception(timeout=5) or future.result()
+            for future in futures
+        ]
+
+    # Assert
+    repository.create_many.assert_called_once()
+    repository.create.assert_not_called()
+    assert str(outcomes[0].email) == "a@example.com"
+    assert isinstance(outcomes[1], DuplicateEmailError)
+    assert str(outcomes[2].email) == "b@example.com"
+    assert outcomes[0].id != outcomes[2].id
+
+
+def test_create_raises_duplicate_email_for_taken_email() -> None:
+    """Test a lone create whose email is taken raises DuplicateEmailError."""
+    # Arrange
+    repository = Mock()
+    repository.create_many.return_value = [None]
+    adapter = BatchingUserRepositoryAdapter(
+        repository, WriteBatcher(max_size=1, max_wait_seconds=0)
+    )
+
+    # Act & Assert
+    with pytest.raises(DuplicateEmailError):
+        adapter.create(_user("taken@example.com"))
+
+
+def test_to_create_outcomes_rejects_repeated_emails() -> None:
+    """Test only the first create of an email in a batch succeeds."""
+    # Arrange
+    users = [_user("a@example.com"), _user("a@example.com")]
+    created = [_user("a@example.com", user_id=1)]
+
+    # Act
+    outcomes = to_create_outcomes(users, created)
+
+    # Assert
+    assert outcomes[0] is created[0]
+    assert isinstance(outcomes[1], DuplicateEmailError)
+
+
+@pytest.mark.asyncio
+async def test_async_batch_is_written_on_its_own_repository() -> None:
+    """Test a batch outlives the cancelled request that opened it."""
+    # Arrange
+    batcher = AsyncWriteBatcher(max_size=10, max_wait_seconds=0.01)
+    request_repository = AsyncMock()
+    batch_repository = AsyncMock()
+    batch_repository.create_many.side_effect = lambda users: [
+        replace(user, id=index + 1) for index, user in enumerate(users)
+    ]
+    opened = []
+
+    @asynccontextmanager
+    async def open_repository() -> AsyncIterator[AsyncMock]:
+        opened.append(1)
+        yield batch_repository
+
+    adapter = AsyncBatchingUserRepositoryAdapter(
+        request_repository, batcher, open_repository
+    )
+    first = asyncio.ensure_future(adapter.create(_user("a@example.com")))
+    second = asyncio.ensure_future(adapter.create(_user("b@example.com")))
+    await asyncio.sleep(0)
+
+    # Act
+    first.cancel()
+    created = await asyncio.wait_for(second, timeout=5)
+
+    # Assert
+    assert created.id == 2
+    assert opened == [1]
+    batch_repository.create_many.assert_awaited_once()
+    request_repository.create_many.assert_not_called()
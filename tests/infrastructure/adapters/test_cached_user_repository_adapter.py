@@ -0,0 +1,243 @@
+"""Tests for CachedUserRepositoryAdapter."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+from infrastructure.adapters.cache.lru_ttl_cache import LruTtlCache
+from infrastructure.adapters.repositories.async_cached_user_repository_adapter import (  # noqa: E501
+    AsyncCachedUserRepositoryAdapter,
+)
+from infrastructure.adapters.repositories.cached_user_repository_adapter import (  # noqa: E501
+    CachedUserRepositoryAdapter,
+)
+
+
+def _user(user_id: int = 1, email: str = "test@example.com") -> User:
+    """Build a persisted user."""
+    now = datetime.now(UTC)
+    return User(
+        id=user_id,
+        name="John Doe",
+        email=EmailAddress(email),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _adapter(repository: Mock) -> CachedUserRepositoryAdapter:
+    """Wrap a mock repository with a fresh cache."""
+    return CachedUserRepositoryAdapter(
+        repository, LruTtlCache(max_entries=100, ttl_seconds=60)
+    )
+
+
+def test_get_by_id_is_read_through() -> None:
+    """Test repeated lookups by id hit the repository once."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_id.return_value = _user()
+    adapter = _adapter(repository)
+
+    # Act
+    first = adapter.get_by_id(1)
+    second = adapter.get_by_id(1)
+
+    # Assert
+    assert first is not None and second is not None
+    assert second.id == 1
+    assert second is not first
+    repository.get_by_id.assert_called_once_with(1)
+
+
+def test_get_response_by_id_uses_cache() -> None:
+    """Test response DTO lookups share the cached user."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_id.return_value = _user()
+    adapter = _adapter(repository)
+
+    # Act
+    first = adapter.get_response_by_id(1)
+    second = adapter.get_response_by_id(1)
+
+    # Assert
+    assert first == second
+    assert second is not None and second.email == "test@example.com"
+    repository.get_by_id.assert_called_once_with(1)
+    repository.get_response_by_id.assert_not_called()
+
+
+def test_get_many_queries_only_uncached_ids() -> None:
+    """Test a batch reads cached users and loads the rest in one call."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_id.return_value = _user(1)
+    repository.get_many.return_value = [_user(2, "two@example.com")]
+    adapter = _adapter(repository)
+    adapter.get_by_id(1)
+
+    # Act
+    first = adapter.get_many([1, 2, 3])
+    second = adapter.get_many_responses([1, 2, 3])
+
+    # Assert
+    assert sorted(user.id for user in first) == [1, 2]
+    assert sorted(user.email for user in second) == [
+        "test@example.com",
+        "two@example.com",
+    ]
+    repository.get_many.assert_called_once_with([2, 3])
+
+
+def test_get_by_email_shares_entry_with_id() -> None:
+    """Test a user loaded by id also serves lookups by email."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_id.return_value = _user()
+    adapter = _adapter(repository)
+    adapter.get_by_id(1)
+
+    # Act
+    result = adapter.get_by_email("test@example.com")
+
+    # Assert
+    assert result is not None and result.id == 1
+    repository.get_by_email.assert_not_called()
+
+
+def test_misses_are_cached() -> None:
+    """Test lookups that found nothing are not repeated."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_id.return_value = None
+    repository.get_by_email.return_value = None
+    adapter = _adapter(repository)
+
+    # Act
+    adapter.get_by_id(999)
+    adapter.get_by_email("nobody@example.com")
+
+    # Assert
+    assert adapter.get_by_id(999) is None
+    assert adapter.get_by_email("nobody@example.com") is None
+    repository.get_by_id.assert_called_once()
+    repository.get_by_email.assert_called_once()
+
+
+def test_create_replaces_negative_entries() -> None:
+    """Test creating a user makes it visible after a cached miss."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_email.return_value = None
+    repository.create.return_value = _user(5)
+    adapter = _adapter(repository)
+    adapter.get_by_email("test@example.com")
+
+    # Act
+    adapter.create(_user(None))
+
+    # Assert
+    result = adapter.get_by_email("test@example.com")
+    assert result is not None and result.id == 5
+    repository.get_by_email.assert_called_once()
+
+
+def test_update_fields_invalidates_old_email() -> None:
+    """Test changing email makes the old email a miss."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_id.return_value = _user()
+    repository.update_fields.return_value = _user(1, "new@example.com")
+    repository.get_by_email.return_value = None
+    adapter = _adapter(repository)
+    adapter.get_by_id(1)
+
+    # Act
+    adapter.update_fields(1, {"email": "new@example.com"})
+
+    # Assert
+    assert adapter.get_by_email("test@example.com") is None
+    repository.get_by_email.assert_called_once_with("test@example.com")
+    updated = adapter.get_by_id(1)
+    assert updated is not None
+    assert str(updated.email) == "new@example.com"
+    repository.get_by_id.assert_called_once()
+
+
+def test_delete_invalidates() -> None:
+    """Test a deleted user is looked up again."""
+    # Arrange
+    repository = Mock()
+    repository.get_by_id.side_effect = [_user(), None]
+    repository.delete.return_value = True
+    adapter = _adapter(repository)
+    adapter.get_by_id(1)
+
+    # Act
+    adapter.delete(1)
+
+    # Assert
+    assert adapter.get_by_id(1) is None
+    assert repository.get_by_id.call_count == 2
+
+
+def test_uncached_reads_pass_through() -> None:
+    """Test reads the cache does not serve go to the repository."""
+    # Arrange
+    repository = Mock()
+    adapter = _adapter(repository)
+
+    # Act
+    result = adapter.search("john", limit=5)
+
+    # Assert
+    assert result is repository.search.return_value
+    repository.search.assert_called_once_with("john", limit=5)
+
+
+@pytest.mark.asyncio
+async def test_async_get_by_id_is_read_through() -> None:
+    """Test async lookups by id and email share one cached user."""
+    # Arrange
+    repository = AsyncMock()
+    repository.get_by_id.return_value = _user()
+    adapter = AsyncCachedUserRepositoryAdapter(
+        repository, LruTtlCache(max_entries=100, ttl_seconds=60)
+    )
+
+    # Act
+    first = await adapter.get_by_id(1)
+    second = await adapter.get_response_by_id(1)
+    by_email = await adapter.get_by_email("test@example.com")
+
+    # Assert
+    assert first is not None and by_email is not None
+    assert by_email is not first
+    assert second is not None and second.id == 1
+    repository.get_by_id.assert_awaited_once_with(1)
+    repository.get_by_email.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_delete_invalidates() -> None:
+    """Test a user deleted through the async adapter is looked up again."""
+    # Arrange
+    repository = AsyncMock()
+    repository.get_by_id.side_effect = [_user(), None]
+    repository.delete.return_value = True
+    adapter = AsyncCachedUserRepositoryAdapter(
+        repository, LruTtlCache(max_entries=100, ttl_seconds=60)
+    )
+    await adapter.get_by_id(1)
+
+    # Act
+    await adapter.delete(1)
+
+    # Assert
+    assert await adapter.get_by_id(1) is None
+    assert repository.get_by_id.await_count == 2
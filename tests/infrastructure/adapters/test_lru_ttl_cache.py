@@ -0,0 +1,117 @@
+"""Tests for LruTtlCache."""
+
+import pytest
+
+from infrastructure.adapters.cache.lru_ttl_cache import (
+    MISSING,
+    LruTtlCache,
+    render_metrics,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_get_hit_and_miss() -> None:
+    """Test stored values are returned and counted as hits."""
+    # Arrange
+    cache = LruTtlCache(max_entries=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    # Act & Assert
+    assert cache.get("a") == 1
+    assert cache.get("b") is MISSING
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_none_is_a_cacheable_value() -> None:
+    """Test None can be cached to remember negative lookups."""
+    # Arrange
+    cache = LruTtlCache(max_entries=10, ttl_seconds=60)
+
+    # Act
+    cache.set("missing-user", None)
+
+    # Assert
+    assert cache.get("missing-user") is None
+
+
+def test_entries_expire_after_ttl() -> None:
+    """Test entries expire after their own TTL."""
+    # Arrange
+    clock = FakeClock()
+    cache = LruTtlCache(max_entries=10, ttl_seconds=30, clock=clock)
+    cache.set("long", 1)
+    cache.set("short", 2, ttl_seconds=5)
+
+    # Act
+    clock.now = 10
+
+    # Assert
+    assert cache.get("short") is MISSING
+    assert cache.get("long") == 1
+    assert cache.stats.expirations == 1
+
+
+def test_least_recently_used_is_evicted() -> None:
+    """Test the least recently used entry is evicted when full."""
+    # Arrange
+    cache = LruTtlCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_delete_counts_invalidations() -> None:
+    """Test deleting present keys counts invalidations."""
+    # Arrange
+    cache = LruTtlCache(max_entries=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    # Act
+    cache.delete("a", "never-set")
+
+    # Assert
+    assert cache.get("a") is MISSING
+    assert cache.snapshot()["invalidations"] == 1
+
+
+def test_invalid_capacity() -> None:
+    """Test a cache needs room for at least one entry."""
+    with pytest.raises(ValueError):
+        LruTtlCache(max_entries=0, ttl_seconds=60)
+
+
+def test_render_metrics() -> None:
+    """Test cache counters are rendered as labelled Prometheus counters."""
+    cache = LruTtlCache(max_entries=1, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("b")
+    cache.get("a")
+
+    text = render_metrics({"users": cache})
+
+    assert "# TYPE cache_evictions_total counter" in text
+    assert 'cache_hits_total{cache="users"} 1' in text
+    assert 'cache_misses_total{cache="users"} 1' in text
+    assert 'cache_evictions_total{cache="users"} 1' in text
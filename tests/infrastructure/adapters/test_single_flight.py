@@ -0,0 +1,177 @@
+"""Tests for SingleFlight and AsyncSingleFlight."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+from infrastructure.adapters.cache.single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    render_metrics,
+)
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    """Test callers of a key in flight wait for it and share its result."""
+    # Arrange
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def lookup() -> dict:
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"id": 1}
+
+    # Act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(group.do, ("id", 1), lookup) for _ in range(4)
+        ]
+        while group.snapshot()["calls"] < 4:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    # Assert
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.snapshot() == {"in_flight": 0, "calls": 4, "collapsed": 3}
+
+
+def test_errors_are_shared_and_keys_forgotten() -> None:
+    """Test a failed call raises for its waiters and is not remembered."""
+    # Arrange
+    group = SingleFlight()
+
+    def fail() -> None:
+        raise RuntimeError("database is down")
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="database is down"):
+        group.do("key", fail)
+    assert group.do("key", lambda: 2) == 2
+    assert group.stats.collapsed == 0
+
+
+def test_waiters_raise_their_own_copy_of_an_error() -> None:
+    """Test each waiter gets its own exception, caused by the original."""
+    # Arrange
+    group = SingleFlight()
+    release = threading.Event()
+    original = RuntimeError("database is down")
+
+    def fail() -> None:
+        release.wait(timeout=5)
+        raise original
+
+    def call() -> BaseException:
+        try:
+            group.do("key", fail)
+        except RuntimeError as e:
+            return e
+        raise AssertionError("the call did not fail")
+
+    # Act
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(call) for _ in range(3)]
+        while group.stats.calls < 3:
+            time.sleep(0.001)
+        release.set()
+        errors = [future.result() for future in futures]
+
+    # Assert
+    assert len({id(error) for error in errors}) == 3
+    assert original in errors
+    waiter_errors = [error for error in errors if error is not original]
+    assert all(error.__cause__ is original for error in waiter_errors)
+    assert all(str(error) == "database is down" for error in errors)
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_calls_share_one_execution() -> None:
+    """Test coroutines awaiting a key in flight share one execution."""
+    # Arrange
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def lookup() -> dict:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    # Act
+    results = await asyncio.gather(
+        *(group.do(("id", 1), lookup) for _ in range(5))
+    )
+    later = await group.do(("id", 1), lookup)
+
+    # Assert
+    assert len(calls) == 2
+    assert all(result is results[0] for result in results)
+    assert later is not results[0]
+    assert group.snapshot() == {"in_flight": 0, "calls": 6, "collapsed": 4}
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_caller_does_not_cancel_others() -> None:
+    """Test cancelling the first caller has a waiter run its own call."""
+    # Arrange
+    group = AsyncSingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def lookup() -> str:
+        calls.append(1)
+        await release.wait()
+        return "user"
+
+    first = asyncio.ensure_future(group.do("key", lookup))
+    second = asyncio.ensure_future(group.do("key", lookup))
+    await asyncio.sleep(0)
+
+    # Act
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    # Assert
+    assert await second == "user"
+    assert first.cancelled()
+    assert len(calls) == 2
+    assert group.snapshot() == {"in_flight": 0, "calls": 2, "collapsed": 0}
+
+
+def test_render_metrics() -> None:
+    """Test group counters are rendered as labelled Prometheus counters."""
+    group = SingleFlight()
+    group.do("key", lambda: None)
+
+    text = render_metrics({"users": group})
+
+    assert "# TYPE single_flight_collapsed_total counter" in text
+    assert 'single_flight_calls_total{group="users"} 1' in text
+    assert 'single_flight_collapsed_total{group="users"} 0' in text
+
+
+@pytest.mark.asyncio
+async def test_async_waiters_raise_their_own_copy_of_an_error() -> None:
+    """Test coroutines sharing a failed call get distinct exceptions."""
+    # Arrange
+    group = AsyncSingleFlight()
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("database is down")
+
+    # Act
+    errors = await asyncio.gather(
+        *(group.do("key", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    # Assert
+    assert len({id(error) for error in errors}) == 3
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert sum(error.__cause__ is None for error in errors) == 1
@@ -0,0 +1,80 @@
+"""Tests for SingleFlightUserRepositoryAdapter."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+from core.domain.entities.user import User
+from core.domain.value_objects.email_address import EmailAddress
+from infrastructure.adapters.cache.single_flight import SingleFlight
+from infrastructure.adapters.repositories.single_flight_user_repository_adapter import (  # noqa: E501
+    SingleFlightUserRepositoryAdapter,
+)
+
+
+def _user() -> User:
+    """Build a persisted user."""
+    now = datetime.now(UTC)
+    return User(
+        id=1,
+        name="John Doe",
+        email=EmailAddress("test@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_concurrent_lookups_share_one_query() -> None:
+    """Test requests looking up the same id in flight run one query."""
+    # Arrange
+    group = SingleFlight()
+    release = threading.Event()
+    repository = Mock()
+
+    def get_by_id(user_id: int) -> User:
+        release.wait(timeout=5)
+        return _user()
+
+    repository.get_by_id.side_effect = get_by_id
+    adapters = [
+        SingleFlightUserRepositoryAdapter(repository, group) for _ in range(3)
+    ]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(adapter.get_by_id, 1) for adapter in adapters
+        ]
+        while group.stats.calls < 3:
+            time.sleep(0.001)
+        release.set()
+        users = [future.result(timeout=5) for future in futures]
+
+    # Assert
+    repository.get_by_id.assert_called_once_with(1)
+    assert group.stats.collapsed == 2
+    assert all(user.id == 1 for user in users)
+    assert users[0] is not users[1]
+
+
+def test_keys_distinguish_lookups() -> None:
+    """Test lookups of other kinds or fields are not coalesced together."""
+    # Arrange
+    group = SingleFlight()
+    repository = Mock()
+    adapter = SingleFlightUserRepositoryAdapter(repository, group)
+
+    # Act
+    adapter.get_fields_by_id(1, ["email"])
+    adapter.get_fields_by_id(1, ["name"])
+    adapter.get_by_email("test@example.com")
+    adapter.delete(1)
+
+    # Assert
+    assert repository.get_fields_by_id.call_count == 2
+    repository.get_by_email.assert_called_once_with("test@example.com")
+    repository.delete.assert_called_once_with(1)
+    assert (group.stats.calls, group.stats.collapsed) == (3, 0)
@@ -0,0 +1,75 @@
+"""Tests for the users import file reader."""
+
+import io
+
+import pytest
+
+from infrastructure.adapters.files.user_file_reader import read_user_rows
+
+
+def _read(content: bytes, file_format: str) -> list:
+    """Parse an in-memory file."""
+    return list(read_user_rows(io.BytesIO(content), file_format))
+
+
+def test_read_ndjson_rows() -> None:
+    """Test NDJSON lines are parsed with their line numbers."""
+    # Arrange
+    content = (
+        b'{"name": "John Doe", "email": "john@example.com"}\n'
+        b"\n"
+        b'{"name": "Jane Doe", "email": "jane@example.com", '
+        b'"active": false}\r\n'
+        b"not json\n"
+        b"[1, 2]\n"
+        b'{"name": "No Email"}\n'
+        b'{"name": "A", "email": "a@example.com", "active": "yes"}'
+    )
+
+    # Act
+    rows = _read(content, "ndjson")
+
+    # Assert
+    assert [row.line for row in rows] == [1, 3, 4, 5, 6, 7]
+    assert rows[0].user.email == "john@example.com"
+    assert rows[0].user.active is True
+    assert rows[1].user.active is False
+    assert rows[2].error == "Invalid JSON"
+    assert rows[3].error == "Expected a JSON object"
+    assert rows[4].error == "Field email must be a string"
+    assert rows[5].error == "Field active must be a boolean"
+
+
+def test_read_csv_rows() -> None:
+    """Test CSV records are parsed by header with physical line numbers."""
+    # Arrange
+    content = (
+        "email,name,active\n"
+        "john@example.com,John Doe,\n"
+        'jane@example.com,"Doe,\nJane",false\n'
+        "ana@example.com,Ana,maybe\n"
+        "short@example.com\n"
+    ).encode()
+
+    # Act
+    rows = _read(content, "csv")
+
+    # Assert
+    assert [row.line for row in rows] == [2, 4, 5, 6]
+    assert rows[0].user.active is True
+    assert rows[1].user.name == "Doe,\nJane"
+    assert rows[1].user.active is False
+    assert rows[2].error == "Field active must be a boolean"
+    assert rows[3].error == "Field name must be a string"
+
+
+def test_read_csv_missing_columns() -> None:
+    """Test a CSV header without the required columns is an error."""
+    with pytest.raises(ValueError, match="missing columns: email"):
+        _read(b"name,mail\nJohn,john@example.com\n", "csv")
+
+
+def test_read_unknown_format() -> None:
+    """Test unknown formats are rejected."""
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        _read(b"", "xml")
@@ -0,0 +1,97 @@
+"""Tests for UserRepositoryDecorator and AsyncUserRepositoryDecorator."""
+
+import inspect
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.application.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort,
+)
+from core.application.ports.user_repository_port import (
+    UserRepositoryPort,
+)
+from infrastructure.adapters.repositories.async_user_repository_decorator import (  # noqa: E501
+    AsyncUserRepositoryDecorator,
+)
+from infrastructure.adapters.repositories.user_repository_decorator import (
+    UserRepositoryDecorator,
+)
+from infrastructure.prometheus import render_counters, render_samples
+
+
+def _port_calls(port: type) -> list:
+    """Get each method of a repository port with its required arguments."""
+    return [
+        (
+            name,
+            [
+                object()
+                for parameter in inspect.signature(method).parameters.values()
+                if parameter.name != "self"
+                and parameter.default is inspect.Parameter.empty
+            ],
+        )
+        for name, method in inspect.getmembers(port, inspect.isfunction)
+        if not name.startswith("_")
+    ]
+
+
+def test_decorator_passes_every_call_through() -> None:
+    """Test each port method reaches the wrapped repository unchanged."""
+    # Arrange
+    repository = Mock()
+    decorator = UserRepositoryDecorator(repository)
+
+    for name, args in _port_calls(UserRepositoryPort):
+        # Act
+        result = getattr(decorator, name)(*args)
+
+        # Assert
+        wrapped = getattr(repository, name)
+        assert result is wrapped.return_value
+        wrapped.assert_called_once()
+        assert list(wrapped.call_args.args[: len(args)]) == args
+
+
+@pytest.mark.asyncio
+async def test_async_decorator_passes_every_call_through() -> None:
+    """Test each async port method reaches the wrapped repository."""
+    # Arrange
+    repository = AsyncMock()
+    decorator = AsyncUserRepositoryDecorator(repository)
+
+    for name, args in _port_calls(AsyncUserRepositoryPort):
+        # Act
+        result = getattr(decorator, name)(*args)
+        if inspect.isawaitable(result):
+            result = await result
+
+        # Assert
+        wrapped = getattr(repository, name)
+        assert result is not None
+        wrapped.assert_called_once()
+        assert list(wrapped.call_args.args[: len(args)]) == args
+
+
+def test_render_counters() -> None:
+    """Test counters are read from snapshots and labelled by name."""
+    # Act
+    text = render_counters(
+        {"calls_total": ("calls", "Calls made.")},
+        "group",
+        {"users": {"calls": 3}, "orders": {"calls": 1}},
+    )
+
+    # Assert
+    assert text == (
+        "# HELP calls_total Calls made.\n"
+        "# TYPE calls_total counter\n"
+        'calls_total{group="users"} 3\n'
+        'calls_total{group="orders"} 1\n'
+    )
+    assert text == render_samples(
+        {"calls_total": ("counter", "Calls made.")},
+        "group",
+        {"users": {"calls_total": 3}, "orders": {"calls_total": 1}},
+    )
@@ -1,16 +1,28 @@
 """Tests for UserRepositoryPostgresAdapter."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import sessionmaker
 
+from core.application.dto.user_dto import (
+    USER_FIELDS,
+    UserFilterDto,
+    UserResponseDto,
+)
 from core.domain.entities.user import User
+from core.domain.exceptions import DuplicateEmailError
 from core.domain.value_objects.email_address import EmailAddress
 from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
     UserRepositoryPostgresAdapter,
+    build_get_many_statement,
+    build_search_statement,
+    build_upsert_by_email_statement,
+    trigram_similarity,
+    user_columns,
 )
-from infrastructure.database.models.user_model import Base
+from infrastructure.database.models.user_model import Base, UserModel
 
 
 @pytest.fixture
@@ -61,6 +73,88 @@ def test_create_user(db_session) -> None:
     assert result.active is True
 
 
+def test_create_user_duplicate_email(db_session) -> None:
+    """Test creating a user with a taken email raises DuplicateEmailError."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    user = User(
+        id=None,
+        name="John Doe",
+        email=EmailAddress("test@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    adapter.create(user)
+
+    # Act & Assert
+    with pytest.raises(DuplicateEmailError, match="already exists"):
+        adapter.create(user)
+
+
+def test_upsert_by_email(db_session) -> None:
+    """Test upsert creates then updates the user with the same email."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    later = now + timedelta(seconds=1)
+    email = EmailAddress("test@example.com")
+
+    # Act
+    created, first_inserted = adapter.upsert_by_email(
+        User(
+            id=None,
+            name="John Doe",
+            email=email,
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    updated, second_inserted = adapter.upsert_by_email(
+        User(
+            id=None,
+            name="Jane Doe",
+            email=email,
+            active=False,
+            created_at=later,
+            updated_at=later,
+        )
+    )
+
+    # Assert
+    assert first_inserted is True
+    assert second_inserted is False
+    assert updated.id == created.id
+    assert updated.created_at == created.created_at
+    assert updated.name == "Jane Doe"
+    assert updated.active is False
+    assert len(adapter.get_all()) == 1
+
+
+def test_upsert_statement_reports_insert_on_postgresql() -> None:
+    """Test PostgreSQL tells an inserted row from an updated one by xmax."""
+    now = datetime.now(UTC)
+    user = User(
+        id=None,
+        name="John Doe",
+        email=EmailAddress("test@example.com"),
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+    sql = str(
+        build_upsert_by_email_statement("postgresql", user).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "ON CONFLICT (email) DO UPDATE" in sql
+    assert sql.endswith("xmax = 0 AS inserted")
+
+
 def test_get_by_id(db_session) -> None:
     """Test getting user by id."""
     # Arrange
@@ -98,6 +192,61 @@ def test_get_by_id_not_found(db_session) -> None:
     assert result is None
 
 
+def test_get_many(db_session) -> None:
+    """Test many users are read by id, leaving out unknown ids."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = [
+        adapter.create(
+            User(
+                id=None,
+                name=f"User {i}",
+                email=EmailAddress(f"test{i}@example.com"),
+                active=True,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for i in range(3)
+    ]
+    ids = [created[2].id, 999, created[0].id]
+
+    # Act
+    users = adapter.get_many(ids)
+    responses = adapter.get_many_responses(ids)
+
+    # Assert
+    assert sorted(user.id for user in users) == sorted(ids[::2])
+    assert {user.email for user in responses} == {
+        "test0@example.com",
+        "test2@example.com",
+    }
+    assert adapter.get_many([]) == []
+
+
+def test_get_many_statement_binds_one_array_on_postgresql() -> None:
+    """Test PostgreSQL gets ``id = ANY(:user_ids)`` whatever the count."""
+    sql = str(
+        build_get_many_statement([3, 1, 2], "postgresql").compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "users.id = ANY (%(user_ids)s::INTEGER[])" in sql
+
+
+def test_whole_rows_are_selected_in_user_fields_order() -> None:
+    """Test DTO-mapped rows name their columns instead of table order."""
+    statement = build_get_many_statement([1], "sqlite")
+
+    assert [column.name for column in user_columns()] == list(USER_FIELDS)
+    assert list(statement.selected_columns.keys()) == list(USER_FIELDS)
+    assert [column.name for column in user_columns(["email", "id"])] == [
+        "email",
+        "id",
+    ]
+
+
 def test_get_by_email(db_session) -> None:
     """Test getting user by email."""
     # Arrange
@@ -147,6 +296,443 @@ def test_get_all(db_session) -> None:
     assert len(results) == 3
 
 
+def test_get_all_after_id(db_session) -> None:
+    """Test keyset pagination returns users after the given id in order."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = []
+    for i in range(5):
+        email = EmailAddress(f"test{i}@example.com")
+        user = User(
+            id=None,
+            name=f"User {i}",
+            email=email,
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        created.append(adapter.create(user))
+
+    # Act
+    first_page = adapter.get_all(limit=2, after_id=0)
+    second_page = adapter.get_all(limit=2, after_id=first_page[-1].id)
+
+    # Assert
+    assert [u.id for u in first_page] == [created[0].id, created[1].id]
+    assert [u.id for u in second_page] == [created[2].id, created[3].id]
+
+
+def test_get_all_filters(db_session) -> None:
+    """Test listing filters on active, created_at range and updated_at."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    created = [
+        adapter.create(
+            User(
+                id=None,
+                name=f"User {day}",
+                email=EmailAddress(f"test{day}@example.com"),
+                active=day % 2 == 0,
+                created_at=start + timedelta(days=day),
+                updated_at=start + timedelta(days=day, hours=12),
+            )
+        )
+        for day in range(6)
+    ]
+
+    def ids(filters: UserFilterDto) -> list:
+        return [user.id for user in adapter.get_all(filters=filters)]
+
+    # Act & Assert
+    assert ids(UserFilterDto(active=True)) == [
+        created[0].id,
+        created[2].id,
+        created[4].id,
+    ]
+    assert ids(UserFilterDto(active=False)) == [
+        created[1].id,
+        created[3].id,
+        created[5].id,
+    ]
+    assert ids(
+        UserFilterDto(
+            created_after=start + timedelta(days=1),
+            created_before=start + timedelta(days=3),
+        )
+    ) == [created[1].id, created[2].id]
+    assert ids(
+        UserFilterDto(
+            active=True, updated_since=start + timedelta(days=2, hours=12)
+        )
+    ) == [created[2].id, created[4].id]
+
+
+def test_get_all_page_with_count(db_session) -> None:
+    """Test pages carry the count of all matching users."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = [
+        adapter.create(
+            User(
+                id=None,
+                name=f"User {i}",
+                email=EmailAddress(f"test{i}@example.com"),
+                active=i != 0,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for i in range(5)
+    ]
+    active = UserFilterDto(active=True)
+
+    # Act
+    first_page, first_total = adapter.get_all_page(limit=2, with_count=True)
+    keyset_page, keyset_total = adapter.get_all_page(
+        limit=2, after_id=created[2].id, filters=active, with_count=True
+    )
+    past_end, past_end_total = adapter.get_all_page(
+        skip=10, filters=active, with_count=True
+    )
+
+    # Assert
+    assert [user.id for user in first_page] == [
+        created[0].id,
+        created[1].id,
+    ]
+    assert first_total == 5
+    assert [user.id for user in keyset_page] == [
+        created[3].id,
+        created[4].id,
+    ]
+    assert keyset_total == 4
+    assert (past_end, past_end_total) == ([], 4)
+    assert adapter.estimate_count(active) == 4
+
+
+def test_responses_map_rows_to_dtos(db_session) -> None:
+    """Test reads as response DTOs match the users that were stored."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = [
+        adapter.create(
+            User(
+                id=None,
+                name=f"User {i}",
+                email=EmailAddress(f"test{i}@example.com"),
+                active=i != 0,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for i in range(3)
+    ]
+
+    # Act
+    by_id = adapter.get_response_by_id(created[1].id)
+    missing = adapter.get_response_by_id(999)
+    page, no_count = adapter.get_all_page(limit=2, after_id=created[0].id)
+    counted, total = adapter.get_all_page(
+        filters=UserFilterDto(active=True), with_count=True
+    )
+
+    # Assert
+    assert tuple(UserModel.__table__.columns.keys()) == USER_FIELDS
+    assert by_id == UserResponseDto(
+        id=created[1].id,
+        name="User 1",
+        email="test1@example.com",
+        active=True,
+        created_at=created[1].created_at,
+        updated_at=created[1].updated_at,
+    )
+    assert missing is None
+    assert [user.id for user in page] == [created[1].id, created[2].id]
+    assert no_count is None
+    assert [user.email for user in counted] == [
+        "test1@example.com",
+        "test2@example.com",
+    ]
+    assert total == 2
+
+
+def test_fields_read_only_requested_columns(db_session) -> None:
+    """Test sparse fieldsets come back as dicts of their columns."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = [
+        adapter.create(
+            User(
+                id=None,
+                name=f"User {i}",
+                email=EmailAddress(f"test{i}@example.com"),
+                active=True,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for i in range(3)
+    ]
+
+    # Act
+    by_id = adapter.get_fields_by_id(created[1].id, ("id", "email"))
+    missing = adapter.get_fields_by_id(999, ("email",))
+    page, _ = adapter.get_all_page(
+        limit=2, after_id=created[0].id, fields=("name",)
+    )
+    counted, total = adapter.get_all_page(
+        limit=1, fields=("email",), with_count=True
+    )
+    exported = list(adapter.iter_all_fields(("id",), batch_size=2))
+
+    # Assert
+    assert by_id == {"id": created[1].id, "email": "test1@example.com"}
+    assert missing is None
+    assert page == [{"name": "User 1"}, {"name": "User 2"}]
+    assert (counted, total) == ([{"email": "test0@example.com"}], 3)
+    assert exported == [{"id": user.id} for user in created]
+
+
+def test_cached_statements_bind_new_parameters(db_session) -> None:
+    """Test cached lookup statements use each call's own parameters."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = [
+        adapter.create(
+            User(
+                id=None,
+                name=f"User {i}",
+                email=EmailAddress(f"test{i}@example.com"),
+                active=True,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for i in range(4)
+    ]
+
+    # Act
+    by_id = [adapter.get_by_id(user.id) for user in created]
+    by_email = [adapter.get_by_email(str(user.email)) for user in created]
+    first_page = adapter.get_all(skip=0, limit=3)
+    second_page = adapter.get_all(skip=3, limit=3)
+
+    # Assert
+    assert [user.id for user in by_id] == [user.id for user in created]
+    assert [user.id for user in by_email] == [user.id for user in created]
+    assert [user.id for user in first_page] == [
+        user.id for user in created[:3]
+    ]
+    assert [user.id for user in second_page] == [created[3].id]
+
+
+def test_search(db_session) -> None:
+    """Test search matches names and emails and ranks the closest first."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    for name, email in [
+        ("Johnny Walker", "walker@example.com"),
+        ("Mary Smith", "mary@example.com"),
+        ("John", "jdoe@example.com"),
+        ("Ann Lee", "john.lee@example.com"),
+    ]:
+        adapter.create(
+            User(
+                id=None,
+                name=name,
+                email=EmailAddress(email),
+                active=True,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    # Act
+    results = adapter.search("JOHN", limit=2)
+
+    # Assert
+    assert [user.name for user in results] == ["John", "Johnny Walker"]
+    assert [user.name for user in adapter.search("john")] == [
+        "John",
+        "Johnny Walker",
+        "Ann Lee",
+    ]
+
+
+def test_search_ranks_every_match(db_session) -> None:
+    """Test the best match is found behind more than a thousand others."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    db_session.execute(
+        insert(UserModel),
+        [
+            {
+                "name": f"Johnathan Smith {i}",
+                "email": f"user{i}@example.com",
+                "active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(1500)
+        ],
+    )
+    best = adapter.create(
+        User(
+            id=None,
+            name="John",
+            email=EmailAddress("john@example.com"),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+
+    # Act
+    results = adapter.search("john", limit=3)
+
+    # Assert
+    assert results[0].id == best.id
+    assert len(results) == 3
+
+
+def test_search_statement_ranks_by_distance_on_postgresql() -> None:
+    """Test PostgreSQL ranks nearest matches per column before the limit."""
+    sql = str(
+        build_search_statement("john", 20, "postgresql").compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "ORDER BY users.name <-> %(name_2)s::VARCHAR, users.id" in sql
+    assert "ORDER BY users.email <-> %(email_2)s::VARCHAR, users.id" in sql
+    assert "ORDER BY least(users.name <-> " in sql
+
+
+def test_search_matches_wildcards_literally(db_session) -> None:
+    """Test LIKE wildcards in the query are not treated as wildcards."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    for email in ["a_b@example.com", "axb@example.com"]:
+        adapter.create(
+            User(
+                id=None,
+                name="User",
+                email=EmailAddress(email),
+                active=True,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    # Act
+    results = adapter.search("a_b")
+
+    # Assert
+    assert [str(user.email) for user in results] == ["a_b@example.com"]
+    assert adapter.search("%%%") == []
+
+
+def test_trigram_similarity_matches_pg_trgm() -> None:
+    """Test the in-memory similarity follows pg_trgm."""
+    # Act & Assert
+    assert trigram_similarity("word", "two words") == pytest.approx(
+        0.363636, abs=1e-6
+    )
+    assert trigram_similarity("John", "john") == 1.0
+    assert trigram_similarity("abc", "") == 0.0
+
+
+def test_iter_all(db_session) -> None:
+    """Test iterating over all users across several fetch batches."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = adapter.create_many(
+        [
+            User(
+                id=None,
+                name=f"User {i}",
+                email=EmailAddress(f"test{i}@example.com"),
+                active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(5)
+        ]
+    )
+
+    # Act
+    results = list(adapter.iter_all(batch_size=2))
+
+    # Assert
+    assert [user.id for user in results] == [
+        user.id for user in created if user
+    ]
+    assert str(results[0].email) == "test0@example.com"
+
+
+def test_create_many(db_session) -> None:
+    """Test creating many users skips emails that already exist."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    users = [
+        User(
+            id=None,
+            name=f"User {i}",
+            email=EmailAddress(f"test{i}@example.com"),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(3)
+    ]
+    adapter.create(users[1])
+
+    # Act
+    results = adapter.create_many(users)
+
+    # Assert
+    assert results[0] is not None and results[0].id is not None
+    assert results[1] is None
+    assert results[2] is not None
+    assert str(results[2].email) == "test2@example.com"
+    assert len(adapter.get_all()) == 3
+
+
+def test_get_existing_emails(db_session) -> None:
+    """Test only emails that belong to a user are returned."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    adapter.create(
+        User(
+            id=None,
+            name="John Doe",
+            email=EmailAddress("test@example.com"),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+
+    # Act
+    result = adapter.get_existing_emails(
+        ["test@example.com", "other@example.com"]
+    )
+
+    # Assert
+    assert result == {"test@example.com"}
+
+
 def test_update_user(db_session) -> None:
     """Test updating a user."""
     # Arrange
@@ -171,6 +757,95 @@ def test_update_user(db_session) -> None:
     assert result.name == "Jane Doe"
 
 
+def test_update_fields(db_session) -> None:
+    """Test partial update returns the updated user."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = adapter.create(
+        User(
+            id=None,
+            name="John Doe",
+            email=EmailAddress("test@example.com"),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+
+    # Act
+    result = adapter.update_fields(
+        created.id or 0,
+        {"name": "Jane Doe", "active": False, "updated_at": now},
+        {"active": True},
+    )
+
+    # Assert
+    assert result is not None
+    assert result.name == "Jane Doe"
+    assert result.active is False
+    assert str(result.email) == "test@example.com"
+
+
+def test_update_fields_skips_noop_and_failed_precondition(
+    db_session,
+) -> None:
+    """Test partial update writes nothing when it would not apply."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    created = adapter.create(
+        User(
+            id=None,
+            name="John Doe",
+            email=EmailAddress("test@example.com"),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    user_id = created.id or 0
+
+    # Act
+    noop = adapter.update_fields(user_id, {"name": "John Doe"})
+    precondition = adapter.update_fields(
+        user_id, {"active": True}, {"active": False}
+    )
+    missing = adapter.update_fields(999, {"name": "Jane Doe"})
+
+    # Assert
+    assert noop is None
+    assert precondition is None
+    assert missing is None
+
+
+def test_update_fields_duplicate_email(db_session) -> None:
+    """Test changing email to a taken one raises DuplicateEmailError."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+    first, second = (
+        adapter.create(
+            User(
+                id=None,
+                name="John Doe",
+                email=EmailAddress(f"test{i}@example.com"),
+                active=True,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for i in range(2)
+    )
+
+    # Act & Assert
+    with pytest.raises(DuplicateEmailError):
+        adapter.update_fields(
+            second.id or 0, {"email": str(first.email)}
+        )
+    assert adapter.get_by_id(second.id or 0) is not None
+
+
 def test_delete_user(db_session) -> None:
     """Test deleting a user."""
     # Arrange
@@ -205,3 +880,44 @@ def test_delete_user_not_found(db_session) -> None:
 
     # Assert
     assert result is False
+
+
+def test_import_users(db_session) -> None:
+    """Test importing skips existing emails, or updates them on upsert."""
+    # Arrange
+    adapter = UserRepositoryPostgresAdapter(db_session)
+    now = datetime.now(UTC)
+
+    def user(name: str, email: str) -> User:
+        return User(
+            id=None,
+            name=name,
+            email=EmailAddress(email),
+            active=True,
+            created_at=now,
+            updated_at=now,
+        )
+
+    existing = adapter.create(user("John Doe", "john@example.com"))
+    chunks = [
+        [
+            user("John Again", "john@example.com"),
+            user("Jane", "jane@example.com"),
+            user("Jane Again", "jane@example.com"),
+        ],
+        [user("Ana", "ana@example.com")],
+    ]
+
+    # Act
+    skipped_counts = adapter.import_users(iter(chunks))
+    upserted_counts = adapter.import_users(iter(chunks), upsert=True)
+
+    # Assert
+    assert skipped_counts == (2, 0)
+    assert upserted_counts == (0, 3)
+    john = adapter.get_by_email("john@example.com")
+    assert john is not None
+    assert john.id == existing.id
+    assert john.name == "John Again"
+    jane = adapter.get_by_email("jane@example.com")
+    assert jane is not None and jane.name == "Jane Again"
@@ -0,0 +1,155 @@
+"""Tests for WriteBatcher and AsyncWriteBatcher."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from infrastructure.adapters.batching.write_batcher import (
+    AsyncWriteBatcher,
+    WriteBatcher,
+    render_metrics,
+)
+
+
+def test_concurrent_writes_share_one_flush() -> None:
+    """Test writes submitted while a batch is open are flushed together."""
+    # Arrange
+    batcher = WriteBatcher(max_size=4, max_wait_seconds=5)
+    flushes = []
+
+    def flush(items: List[int]) -> List[object]:
+        flushes.append(list(items))
+        return [ValueError("odd") if item % 2 else item for item in items]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(batcher.submit, item, flush) for item in range(4)
+        ]
+        started = time.perf_counter()
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result(timeout=5))
+            except ValueError as e:
+                outcomes.append(str(e))
+
+    # Assert
+    assert time.perf_counter() - started < 5
+    assert len(flushes) == 1
+    assert sorted(flushes[0]) == [0, 1, 2, 3]
+    assert outcomes == [0, "odd", 2, "odd"]
+    assert batcher.snapshot() == {"batches": 1, "items": 4}
+
+
+def test_batch_is_flushed_after_max_wait() -> None:
+    """Test a lone write is flushed once the wait is over."""
+    # Arrange
+    batcher = WriteBatcher(max_size=100, max_wait_seconds=0.001)
+
+    # Act
+    first = batcher.submit(1, lambda items: [item * 10 for item in items])
+    second = batcher.submit(2, lambda items: [item * 10 for item in items])
+
+    # Assert
+    assert (first, second) == (10, 20)
+    assert batcher.stats.batches == 2
+
+
+def test_flush_errors_are_raised_for_every_item() -> None:
+    """Test a failed flush raises its error for every write of the batch."""
+    # Arrange
+    batcher = WriteBatcher(max_size=1, max_wait_seconds=0)
+
+    def flush(items: List[int]) -> List[int]:
+        raise RuntimeError("database is down")
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="database is down"):
+        batcher.submit(1, flush)
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_writes_share_one_flush() -> None:
+    """Test coroutines writing while a batch is open share one flush."""
+    # Arrange
+    batcher = AsyncWriteBatcher(max_size=3, max_wait_seconds=0.01)
+    flushes = []
+
+    async def flush(items: List[int]) -> List[int]:
+        flushes.append(list(items))
+        return [item * 10 for item in items]
+
+    # Act
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(item, flush) for item in range(3))),
+        timeout=5,
+    )
+    later = await asyncio.wait_for(batcher.submit(3, flush), timeout=5)
+
+    # Assert
+    assert results == [0, 10, 20]
+    assert later == 30
+    assert flushes == [[0, 1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_caller_does_not_cancel_flush() -> None:
+    """Test cancelling the first writer still flushes the others' writes."""
+    # Arrange
+    batcher = AsyncWriteBatcher(max_size=10, max_wait_seconds=0.01)
+
+    async def flush(items: List[str]) -> List[str]:
+        return [item.upper() for item in items]
+
+    first = asyncio.ensure_future(batcher.submit("a", flush))
+    second = asyncio.ensure_future(batcher.submit("b", flush))
+    await asyncio.sleep(0)
+
+    # Act
+    first.cancel()
+
+    # Assert
+    assert await second == "B"
+    assert first.cancelled()
+    assert batcher.stats.items == 2
+
+
+@pytest.mark.asyncio
+async def test_async_flush_errors_are_copied_for_every_item() -> None:
+    """Test each write of a failed batch raises its own error."""
+    # Arrange
+    batcher = AsyncWriteBatcher(max_size=3, max_wait_seconds=0.01)
+    original = RuntimeError("database is down")
+
+    async def flush(items: List[int]) -> List[int]:
+        raise original
+
+    # Act
+    errors = await asyncio.wait_for(
+        asyncio.gather(
+            *(batcher.submit(item, flush) for item in range(3)),
+            return_exceptions=True,
+        ),
+        timeout=5,
+    )
+
+    # Assert
+    assert len({id(error) for error in errors}) == 3
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert all(error.__cause__ is original for error in errors)
+
+
+def test_render_metrics() -> None:
+    """Test batcher counters are rendered as labelled Prometheus counters."""
+    batcher = WriteBatcher(max_size=1, max_wait_seconds=0)
+    batcher.submit(1, lambda items: items)
+
+    text = render_metrics({"users": batcher})
+
+    assert "# TYPE write_batcher_batches_total counter" in text
+    assert 'write_batcher_batches_total{group="users"} 1' in text
+    assert 'write_batcher_items_total{group="users"} 1' in text
@@ -0,0 +1,173 @@
+"""Tests for adaptive admission control."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from infrastructure.api.admission_control import (
+    BULK,
+    READ,
+    WRITE,
+    AdaptiveLimiter,
+    AdmissionControlMiddleware,
+    render_metrics,
+    route_class,
+)
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def _limiter(clock: FakeClock, initial_limit: int = 4) -> AdaptiveLimiter:
+    """Build a limiter with a 100 ms latency target."""
+    return AdaptiveLimiter(
+        initial_limit=initial_limit,
+        min_limit=1,
+        max_limit=5,
+        latency_target_seconds=0.1,
+        backoff_ratio=0.5,
+        clock=clock,
+    )
+
+
+def test_route_class() -> None:
+    """Test users routes are classified and other routes are not limited."""
+    assert route_class("GET", "/users/1") == READ
+    assert route_class("POST", "/users/batch-get") == READ
+    assert route_class("POST", "/users") == WRITE
+    assert route_class("DELETE", "/users/1") == WRITE
+    assert route_class("GET", "/users/export") == BULK
+    assert route_class("OPTIONS", "/users") is None
+    assert route_class("GET", "/health") is None
+    assert route_class("GET", "/usersx") is None
+
+
+def test_requests_over_the_limit_are_shed() -> None:
+    """Test no more than ``limit`` requests are in flight."""
+    # Arrange
+    limiter = _limiter(FakeClock(), initial_limit=2)
+
+    # Act
+    admitted = [limiter.try_acquire() for _ in range(3)]
+
+    # Assert
+    assert admitted[2] is None
+    assert (limiter.in_flight, limiter.stats.admitted) == (2, 2)
+    assert limiter.stats.shed == 1
+
+
+def test_limit_grows_while_busy_and_fast() -> None:
+    """Test fast requests grow a used limit additively, up to the max."""
+    # Arrange
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    # Act
+    for _ in range(40):
+        admitted_at = [limiter.try_acquire() for _ in range(3)]
+        clock.now += 0.01
+        for started in admitted_at:
+            limiter.release(started)
+
+    # Assert
+    assert limiter.limit == 5
+    assert limiter.in_flight == 0
+
+
+def test_limit_shrinks_once_per_generation() -> None:
+    """Test slow requests admitted together halve the limit once."""
+    # Arrange
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    admitted_at = [limiter.try_acquire() for _ in range(4)]
+
+    # Act
+    clock.now += 1
+    for started in admitted_at:
+        limiter.release(started)
+    first_decrease = limiter.limit
+    limiter.release(limiter.try_acquire(), failed=True)
+
+    # Assert
+    assert first_decrease == 2
+    assert limiter.limit == 1
+
+
+def test_limit_is_fixed_without_latency_target() -> None:
+    """Test a limiter without latency target never adapts."""
+    limiter = AdaptiveLimiter(2, 2, 2, None)
+
+    limiter.release(limiter.try_acquire(), failed=True)
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_with_retry_after() -> None:
+    """Test a request over the limit gets a fast 503 with Retry-After."""
+    # Arrange
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: int) -> dict:
+        await release.wait()
+        return {"id": user_id}
+
+    @app.post("/users")
+    async def create_user() -> dict:
+        raise HTTPException(status_code=500)
+
+    limiters = {
+        READ: AdaptiveLimiter(1, 1, 1, None),
+        WRITE: _limiter(FakeClock()),
+    }
+    app.add_middleware(
+        AdmissionControlMiddleware, limiters=limiters, retry_after_seconds=2
+    )
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        # Act
+        first = asyncio.ensure_future(client.get("/users/1"))
+        while limiters[READ].in_flight == 0:
+            await asyncio.sleep(0)
+        shed = await client.get("/users/2")
+        release.set()
+        admitted = await first
+        failed = await client.post("/users")
+
+    # Assert
+    assert admitted.status_code == 200
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "2"
+    assert limiters[READ].stats.shed == 1
+    assert limiters[READ].in_flight == 0
+    assert failed.status_code == 500
+    assert limiters[WRITE].limit == 2
+
+
+def test_render_metrics() -> None:
+    """Test limits and counters are rendered per route class."""
+    limiter = AdaptiveLimiter(3, 1, 5, 0.1)
+    limiter.try_acquire()
+
+    text = render_metrics({READ: limiter})
+
+    assert "# TYPE admission_limit gauge" in text
+    assert 'admission_limit{route_class="read"} 3' in text
+    assert 'admission_in_flight{route_class="read"} 1' in text
+    assert 'admission_shed_total{route_class="read"} 0' in text
@@ -0,0 +1,346 @@
+"""Tests for async user router."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from infrastructure.api.routers import async_user_router
+from infrastructure.api.routers.async_user_router import router
+from infrastructure.database.models.user_model import Base
+from infrastructure.database.async_session import get_async_db
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a test client for an app serving the async router."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool
+    )
+    session_factory = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_async_db():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Sessions opened outside of the request dependencies (write batches)
+    monkeypatch.setattr(
+        async_user_router, "get_async_session_factory", lambda: session_factory
+    )
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _create(client, email: str = "john@example.com") -> dict:
+    """Create a user via API and return its JSON."""
+    response = client.post(
+        "/users",
+        json={"name": "John Doe", "email": email, "active": True},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_create_and_get_user(client) -> None:
+    """Test creating and getting a user via async API."""
+    user_id = _create(client)["id"]
+
+    response = client.get(f"/users/{user_id}")
+    assert response.status_code == 200
+    assert response.json()["email"] == "john@example.com"
+
+
+def test_create_user_duplicate_email(client) -> None:
+    """Test creating user with duplicate email returns error."""
+    _create(client)
+
+    response = client.post(
+        "/users",
+        json={"name": "Jane Doe", "email": "john@example.com"},
+    )
+    assert response.status_code == 400
+
+
+def test_create_user_upsert(client) -> None:
+    """Test upsert answers 201 for a new email and 200 for a taken one."""
+    upsert = {"upsert": True}
+    created = client.post(
+        "/users",
+        params=upsert,
+        json={"name": "John Doe", "email": "john@example.com"},
+    )
+    updated = client.post(
+        "/users",
+        params=upsert,
+        json={"name": "Jane Doe", "email": "john@example.com"},
+    )
+
+    assert created.status_code == 201
+    assert updated.status_code == 200
+    assert updated.json()["id"] == created.json()["id"]
+    assert updated.json()["name"] == "Jane Doe"
+
+
+def test_batch_get_users(client) -> None:
+    """Test getting many users by id via async API."""
+    first = _create(client)["id"]
+    second = _create(client, "jane@example.com")["id"]
+
+    response = client.post(
+        "/users/batch-get", json={"ids": [second, 999, first]}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [user["id"] for user in data["users"]] == [second, first]
+    assert data["missing_ids"] == [999]
+
+
+def test_list_users_cursor_pagination(client) -> None:
+    """Test walking all users with the next cursor header."""
+    for i in range(3):
+        _create(client, f"user{i}@example.com")
+
+    first = client.get("/users", params={"limit": 2})
+    second = client.get(
+        "/users",
+        params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+    )
+
+    assert len(first.json()) == 2
+    assert [u["email"] for u in second.json()] == ["user2@example.com"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_list_users_filters(client) -> None:
+    """Test filtering the listing via async API."""
+    _create(client, "john@example.com")
+    jane_id = _create(client, "jane@example.com")["id"]
+    client.put(f"/users/{jane_id}", json={"active": False})
+
+    active = client.get("/users", params={"active": True})
+    inactive = client.get("/users", params={"active": False, "skip": 0})
+
+    assert [user["email"] for user in active.json()] == ["john@example.com"]
+    assert [user["email"] for user in inactive.json()] == [
+        "jane@example.com"
+    ]
+
+
+def test_list_users_total_count(client) -> None:
+    """Test the total count header via async API."""
+    _create(client, "john@example.com")
+    _create(client, "jane@example.com")
+
+    response = client.get("/users", params={"limit": 1, "count": "auto"})
+
+    assert response.headers["X-Total-Count"] == "2"
+    assert response.headers["X-Total-Count-Mode"] == "exact"
+
+
+def test_update_and_delete_user(client) -> None:
+    """Test updating and deleting a user via async API."""
+    user_id = _create(client)["id"]
+
+    response = client.put(f"/users/{user_id}", json={"active": False})
+    assert response.status_code == 200
+    assert response.json()["active"] is False
+
+    assert client.delete(f"/users/{user_id}").status_code == 204
+    assert client.get(f"/users/{user_id}").status_code == 404
+
+
+def test_bulk_create_users(client) -> None:
+    """Test bulk creating users via async API."""
+    _create(client, "taken@example.com")
+
+    response = client.post(
+        "/users/bulk",
+        json={
+            "users": [
+                {"name": "User 0", "email": "user0@example.com"},
+                {"name": "User 1", "email": "taken@example.com"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 1
+    assert "already exists" in data["results"][1]["error"]
+
+
+def test_export_users(client) -> None:
+    """Test exporting users as NDJSON and CSV via async API."""
+    _create(client, "john@example.com")
+    _create(client, "jane@example.com")
+
+    ndjson = client.get("/users/export")
+    csv_export = client.get("/users/export", params={"format": "csv"})
+
+    assert ndjson.status_code == 200
+    assert [
+        json.loads(line)["email"] for line in ndjson.text.splitlines()
+    ] == ["john@example.com", "jane@example.com"]
+    assert csv_export.status_code == 200
+    assert csv_export.text.splitlines()[0] == (
+        "id,name,email,active,created_at,updated_at"
+    )
+    assert len(csv_export.text.splitlines()) == 3
+
+
+def test_sparse_fieldsets(client) -> None:
+    """Test getting, listing and exporting only some fields via async API."""
+    user_id = _create(client, "john@example.com")["id"]
+    _create(client, "jane@example.com")
+
+    one = client.get(f"/users/{user_id}", params={"fields": "email"})
+    page = client.get("/users", params={"fields": "email", "limit": 1})
+    export = client.get(
+        "/users/export", params={"format": "csv", "fields": "id,email"}
+    )
+
+    assert one.json() == {"email": "john@example.com"}
+    assert page.json() == [{"email": "john@example.com"}]
+    assert "X-Next-Cursor" in page.headers
+    assert export.text.splitlines()[0] == "id,email"
+    assert client.get(
+        "/users", params={"fields": "nope"}
+    ).status_code == 400
+
+
+def test_search_users(client) -> None:
+    """Test searching users via async API."""
+    _create(client, "john@example.com")
+    _create(client, "jane@example.com")
+
+    response = client.get("/users/search", params={"q": "jane"})
+    too_short = client.get("/users/search", params={"q": " ja "})
+
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()] == [
+        "jane@example.com"
+    ]
+    assert too_short.status_code == 400
+
+
+def test_import_users(client) -> None:
+    """Test importing an NDJSON body via async API."""
+    _create(client, "john@example.com")
+    body = "\n".join(
+        json.dumps({"name": "User", "email": email})
+        for email in ("john@example.com", "jane@example.com", "bad")
+    )
+
+    response = client.post("/users/import", content=body.encode())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["skipped"], data["rejected"]) == (1, 1, 1)
+    assert data["rejections"][0]["line"] == 3
+
+
+def test_get_user_with_cache_enabled(client, monkeypatch) -> None:
+    """Test async reads and writes stay consistent with the cache on."""
+    from infrastructure.api.routers import async_user_router
+
+    monkeypatch.setattr(
+        async_user_router.settings, "user_cache_enabled", True
+    )
+    async_user_router.get_async_user_cache.cache_clear()
+
+    user_id = _create(client)["id"]
+    assert client.get(f"/users/{user_id}").status_code == 200
+    assert async_user_router.get_async_user_cache().stats.hits == 1
+
+    client.put(f"/users/{user_id}", json={"name": "John Doe Updated"})
+    assert client.get(f"/users/{user_id}").json()["name"] == (
+        "John Doe Updated"
+    )
+
+    client.delete(f"/users/{user_id}")
+    assert client.get(f"/users/{user_id}").status_code == 404
+    async_user_router.get_async_user_cache.cache_clear()
+
+
+def test_get_user_with_single_flight_enabled(client, monkeypatch) -> None:
+    """Test async reads go through the single-flight group when enabled."""
+    from infrastructure.api.routers import async_user_router
+
+    monkeypatch.setattr(
+        async_user_router.settings, "user_single_flight_enabled", True
+    )
+    async_user_router.get_async_user_single_flight.cache_clear()
+
+    user_id = _create(client)["id"]
+    assert client.get(f"/users/{user_id}").json()["id"] == user_id
+    group = async_user_router.get_async_user_single_flight()
+    assert (group.stats.calls, group.stats.collapsed) == (1, 0)
+    async_user_router.get_async_user_single_flight.cache_clear()
+
+
+def test_create_user_with_write_batching_enabled(client, monkeypatch) -> None:
+    """Test async creates go through the write batcher when enabled."""
+    from infrastructure.api.routers import async_user_router
+
+    monkeypatch.setattr(
+        async_user_router.settings, "user_write_batch_enabled", True
+    )
+    monkeypatch.setattr(
+        async_user_router.settings, "user_write_batch_max_wait_ms", 0.0
+    )
+    async_user_router.get_async_user_write_batcher.cache_clear()
+
+    user_id = _create(client)["id"]
+    duplicate = client.post(
+        "/users", json={"name": "John Doe", "email": "john@example.com"}
+    )
+
+    assert client.get(f"/users/{user_id}").json()["id"] == user_id
+    assert duplicate.status_code == 400
+    batcher = async_user_router.get_async_user_write_batcher()
+    assert (batcher.stats.batches, batcher.stats.items) == (2, 2)
+    async_user_router.get_async_user_write_batcher.cache_clear()
+
+
+def test_reads_use_replica_except_after_own_write(
+    client, monkeypatch, tmp_path
+) -> None:
+    """Test async reads go to the replica until the client writes."""
+    from sqlalchemy import create_engine
+
+    from infrastructure.config.settings import settings
+    from infrastructure.database import async_session
+
+    replica_path = tmp_path / "replica.sqlite3"
+    replica_engine = create_engine(f"sqlite:///{replica_path}")
+    Base.metadata.create_all(bind=replica_engine)
+    replica_engine.dispose()
+    monkeypatch.setattr(
+        settings,
+        "database_replica_urls",
+        f"sqlite+aiosqlite:///{replica_path}",
+    )
+    async_session.get_async_replica_set.cache_clear()
+
+    try:
+        client.cookies.clear()
+        assert client.get("/users").json() == []
+
+        _create(client)
+        assert len(client.get("/users").json()) == 1
+
+        client.cookies.clear()
+        assert client.get("/users").json() == []
+    finally:
+        async_session.get_async_replica_set.cache_clear()
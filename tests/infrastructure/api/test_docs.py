@@ -0,0 +1,56 @@
+"""Tests for the cached API documentation."""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from infrastructure.api.docs import (
+    DOCS_CACHE_CONTROL,
+    CachedDocument,
+    etag_matches,
+)
+from main import app
+
+
+def test_etag_matches() -> None:
+    """Test If-None-Match lists, weak tags and wildcards are understood."""
+    etag = CachedDocument.of(b"{}", "application/json").etag
+
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_openapi_is_served_with_etag_and_revalidated() -> None:
+    """Test the schema carries validators and unchanged ones get a 304."""
+    client = TestClient(app)
+
+    response = client.get("/openapi.json")
+    not_modified = client.get(
+        "/openapi.json", headers={"If-None-Match": response.headers["etag"]}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == DOCS_CACHE_CONTROL
+    assert json.loads(response.content) == app.openapi()
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == response.headers["etag"]
+
+
+def test_docs_pages_are_built_once() -> None:
+    """Test Swagger UI and ReDoc pages are served identically each time."""
+    client = TestClient(app)
+
+    for url in ("/docs", "/redoc"):
+        first = client.get(url)
+        second = client.get(url)
+
+        assert first.status_code == 200
+        assert first.headers["content-type"].startswith("text/html")
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+    assert b"window.OPENAPI_SPEC = {" in client.get("/redoc").content
+    assert b"/openapi.json" in client.get("/docs").content
@@ -0,0 +1,29 @@
+"""Tests for API response classes."""
+
+import json
+from datetime import UTC, datetime
+
+from core.application.dto.user_dto import UserResponseDto
+from infrastructure.api.responses import FastJSONResponse
+from infrastructure.api.schemas.user_schema import UserResponseSchema
+
+
+def test_fast_json_response_matches_response_model() -> None:
+    """Test DTOs encode like their response schema, datetimes included."""
+    for created_at in (
+        datetime(2025, 1, 2, 3, 4, 5, 678901),
+        datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+    ):
+        dto = UserResponseDto(
+            id=1,
+            name="John Doe",
+            email="john@example.com",
+            active=True,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+        body = FastJSONResponse([dto]).body
+
+        schema = UserResponseSchema.model_validate(dto)
+        assert json.loads(body) == [json.loads(schema.model_dump_json())]
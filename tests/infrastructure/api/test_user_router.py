@@ -1,5 +1,9 @@
 """Tests for user router."""
 
+import csv
+import io
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -90,6 +94,62 @@ def test_create_user_duplicate_email(client) -> None:
     assert response.status_code == 400
 
 
+def test_create_user_upsert(client) -> None:
+    """Test upsert mode updates the user that has the email."""
+    first = client.post(
+        "/users",
+        params={"upsert": True},
+        json={"name": "John Doe", "email": "john@example.com"},
+    )
+    assert first.status_code == 201
+
+    response = client.post(
+        "/users",
+        params={"upsert": True},
+        json={
+            "name": "John Doe Synced",
+            "email": "john@example.com",
+            "active": False,
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == first.json()["id"]
+    assert data["name"] == "John Doe Synced"
+    assert data["active"] is False
+
+
+def test_bulk_create_users(client) -> None:
+    """Test bulk creating users reports per-row results."""
+    client.post(
+        "/users",
+        json={"name": "Taken", "email": "taken@example.com"},
+    )
+
+    response = client.post(
+        "/users/bulk",
+        json={
+            "users": [
+                {"name": "User 0", "email": "user0@example.com"},
+                {"name": "User 1", "email": "not-an-email"},
+                {"name": "User 2", "email": "taken@example.com"},
+                {"name": "User 3", "email": "user3@example.com"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 2
+    assert data["results"][0]["user"]["email"] == "user0@example.com"
+    assert data["results"][1]["error"].startswith("Invalid email format")
+    assert "already exists" in data["results"][2]["error"]
+    assert data["results"][3]["user"]["id"] is not None
+    assert len(client.get("/users").json()) == 3
+
+
 def test_get_user(client) -> None:
     """Test getting a user via API."""
     # Create user
@@ -117,6 +177,46 @@ def test_get_user_not_found(client) -> None:
     assert response.status_code == 404
 
 
+def test_get_user_fields(client) -> None:
+    """Test getting only some fields of a user."""
+    user_id = client.post(
+        "/users", json={"name": "John Doe", "email": "john@example.com"}
+    ).json()["id"]
+
+    response = client.get(
+        f"/users/{user_id}", params={"fields": "email,id"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"id": user_id, "email": "john@example.com"}
+
+    response = client.get(f"/users/{user_id}", params={"fields": "password"})
+    assert response.status_code == 400
+    response = client.get("/users/999", params={"fields": "email"})
+    assert response.status_code == 404
+
+
+def test_batch_get_users(client) -> None:
+    """Test getting many users by id in request order."""
+    ids = [
+        client.post(
+            "/users", json={"name": f"User {i}", "email": f"u{i}@example.com"}
+        ).json()["id"]
+        for i in range(3)
+    ]
+
+    response = client.post(
+        "/users/batch-get", json={"ids": [ids[2], 999, ids[0], ids[2]]}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [user["id"] for user in data["users"]] == [ids[2], ids[0]]
+    assert data["users"][0]["email"] == "u2@example.com"
+    assert data["missing_ids"] == [999]
+
+    response = client.post("/users/batch-get", json={"ids": []})
+    assert response.status_code == 422
+
+
 def test_list_users(client) -> None:
     """Test listing users via API."""
     # Create multiple users
@@ -137,6 +237,191 @@ def test_list_users(client) -> None:
     assert len(data) == 3
 
 
+def test_list_users_cursor_pagination(client) -> None:
+    """Test walking all users with the next cursor header."""
+    # Create multiple users
+    for i in range(5):
+        client.post(
+            "/users",
+            json={
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "active": True,
+            },
+        )
+
+    # Walk pages
+    seen = []
+    response = client.get("/users", params={"limit": 2})
+    while True:
+        assert response.status_code == 200
+        seen.extend(user["email"] for user in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        response = client.get(
+            "/users", params={"limit": 2, "cursor": next_cursor}
+        )
+
+    assert seen == [f"user{i}@example.com" for i in range(5)]
+
+
+def test_list_users_filters(client) -> None:
+    """Test filtering the listing, on every page of it."""
+    for i in range(5):
+        client.post(
+            "/users",
+            json={
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "active": i % 2 == 0,
+            },
+        )
+
+    # Walk active users created from the start of 2000 on
+    params = {"active": True, "created_after": "2000-01-01T00:00:00Z"}
+    response = client.get("/users", params={**params, "limit": 2})
+    assert response.status_code == 200
+    seen = [user["email"] for user in response.json()]
+    next_cursor = response.headers["X-Next-Cursor"]
+    response = client.get(
+        "/users", params={**params, "limit": 2, "cursor": next_cursor}
+    )
+    seen.extend(user["email"] for user in response.json())
+
+    assert seen == [
+        "user0@example.com",
+        "user2@example.com",
+        "user4@example.com",
+    ]
+    response = client.get(
+        "/users", params={"created_before": "2000-01-01T00:00:00Z"}
+    )
+    assert response.json() == []
+
+
+def test_list_users_invalid_filters(client) -> None:
+    """Test an empty created range returns 400 and a bad date 422."""
+    response = client.get(
+        "/users",
+        params={
+            "created_after": "2025-01-02T00:00:00Z",
+            "created_before": "2025-01-01T00:00:00Z",
+        },
+    )
+    assert response.status_code == 400
+
+    response = client.get("/users", params={"updated_since": "yesterday"})
+    assert response.status_code == 422
+
+
+def test_list_users_total_count(client) -> None:
+    """Test the total count headers of exact and estimated counts."""
+    for i in range(3):
+        client.post(
+            "/users",
+            json={
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "active": True,
+            },
+        )
+
+    response = client.get("/users", params={"limit": 1, "count": "exact"})
+    assert response.headers["X-Total-Count"] == "3"
+    assert response.headers["X-Total-Count-Mode"] == "exact"
+    assert len(response.json()) == 1
+
+    response = client.get(
+        "/users", params={"skip": 1, "limit": 1, "count": "estimate"}
+    )
+    assert response.headers["X-Total-Count"] == "3"
+    assert response.headers["X-Total-Count-Mode"] == "estimate"
+
+    response = client.get("/users")
+    assert "X-Total-Count" not in response.headers
+
+    response = client.get("/users", params={"count": "approximate"})
+    assert response.status_code == 422
+
+
+def test_list_users_fields(client) -> None:
+    """Test paging through a sparse fieldset without its id."""
+    for i in range(3):
+        client.post(
+            "/users",
+            json={"name": f"User {i}", "email": f"user{i}@example.com"},
+        )
+
+    response = client.get(
+        "/users", params={"fields": "email", "limit": 2, "count": "exact"}
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"email": "user0@example.com"},
+        {"email": "user1@example.com"},
+    ]
+    assert response.headers["X-Total-Count"] == "3"
+    response = client.get(
+        "/users",
+        params={
+            "fields": "email",
+            "cursor": response.headers["X-Next-Cursor"],
+        },
+    )
+    assert response.json() == [{"email": "user2@example.com"}]
+
+    response = client.get(
+        "/users", params={"fields": "name,created_at", "skip": 2}
+    )
+    assert list(response.json()[0]) == ["name", "created_at"]
+
+    response = client.get("/users", params={"fields": ""})
+    assert response.status_code == 400
+
+
+def test_list_users_invalid_cursor(client) -> None:
+    """Test listing users with malformed cursor returns 400."""
+    response = client.get("/users", params={"cursor": "bogus"})
+    assert response.status_code == 400
+
+
+def test_search_users(client) -> None:
+    """Test searching users by partial name or email via API."""
+    for name, email in [
+        ("Alice Johnson", "alice@example.com"),
+        ("Bob Stone", "bob@example.com"),
+        ("Carol", "johnson.carol@example.com"),
+    ]:
+        client.post(
+            "/users",
+            json={"name": name, "email": email, "active": True},
+        )
+
+    response = client.get("/users/search", params={"q": "johnson"})
+    assert response.status_code == 200
+    assert [user["name"] for user in response.json()] == [
+        "Alice Johnson",
+        "Carol",
+    ]
+
+    response = client.get(
+        "/users/search", params={"q": "example", "limit": 1}
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_search_users_query_too_short(client) -> None:
+    """Test a search query under three characters is rejected."""
+    response = client.get("/users/search", params={"q": "jo"})
+    assert response.status_code == 422
+
+    # Long enough, but not once trimmed
+    response = client.get("/users/search", params={"q": " jo "})
+    assert response.status_code == 400
+
+
 def test_update_user(client) -> None:
     """Test updating a user via API."""
     # Create user
@@ -164,6 +449,34 @@ def test_update_user(client) -> None:
     assert data["active"] is False
 
 
+def test_update_user_already_active(client) -> None:
+    """Test activating an already active user returns 400."""
+    create_response = client.post(
+        "/users",
+        json={"name": "John Doe", "email": "john@example.com"},
+    )
+    user_id = create_response.json()["id"]
+
+    response = client.put(f"/users/{user_id}", json={"active": True})
+    assert response.status_code == 400
+
+    not_found = client.put("/users/999", json={"name": "Nobody"})
+    assert not_found.status_code == 404
+
+
+def test_update_user_duplicate_email(client) -> None:
+    """Test updating user to a taken email returns 400."""
+    for email in ("john@example.com", "jane@example.com"):
+        client.post("/users", json={"name": "Someone", "email": email})
+    user_id = client.get("/users").json()[1]["id"]
+
+    response = client.put(
+        f"/users/{user_id}", json={"email": "john@example.com"}
+    )
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
+
+
 def test_delete_user(client) -> None:
     """Test deleting a user via API."""
     # Create user
@@ -184,3 +497,331 @@ def test_delete_user(client) -> None:
     # Verify deleted
     get_response = client.get(f"/users/{user_id}")
     assert get_response.status_code == 404
+
+
+def test_get_user_with_cache_enabled(client, monkeypatch) -> None:
+    """Test reads and writes stay consistent with the user cache on."""
+    from infrastructure.api.routers import user_router
+
+    monkeypatch.setattr(user_router.settings, "user_cache_enabled", True)
+    user_router.get_user_cache.cache_clear()
+
+    create_response = client.post(
+        "/users",
+        json={"name": "John Doe", "email": "john@example.com"},
+    )
+    user_id = create_response.json()["id"]
+    assert client.get(f"/users/{user_id}").status_code == 200
+    assert user_router.get_user_cache().stats.hits == 1
+
+    client.put(f"/users/{user_id}", json={"name": "John Doe Updated"})
+    assert client.get(f"/users/{user_id}").json()["name"] == (
+        "John Doe Updated"
+    )
+
+    client.delete(f"/users/{user_id}")
+    assert client.get(f"/users/{user_id}").status_code == 404
+    text = client.get("/internal/metrics").text
+    assert 'cache_hits_total{cache="users"} 2' in text
+    user_router.get_user_cache.cache_clear()
+
+
+def test_get_user_with_single_flight_enabled(client, monkeypatch) -> None:
+    """Test reads go through the single-flight group when enabled."""
+    from infrastructure.api.routers import user_router
+
+    monkeypatch.setattr(
+        user_router.settings, "user_single_flight_enabled", True
+    )
+    user_router.get_user_single_flight.cache_clear()
+
+    user_id = client.post(
+        "/users", json={"name": "John Doe", "email": "john@example.com"}
+    ).json()["id"]
+    assert client.get(f"/users/{user_id}").json()["id"] == user_id
+    assert client.get("/users/999").status_code == 404
+    assert user_router.get_user_single_flight().stats.calls == 2
+
+    text = client.get("/internal/metrics").text
+    assert 'single_flight_calls_total{group="users"} 2' in text
+    user_router.get_user_single_flight.cache_clear()
+
+
+def test_create_user_with_write_batching_enabled(client, monkeypatch) -> None:
+    """Test creates go through the write batcher when enabled."""
+    from infrastructure.api.routers import user_router
+
+    monkeypatch.setattr(
+        user_router.settings, "user_write_batch_enabled", True
+    )
+    monkeypatch.setattr(
+        user_router.settings, "user_write_batch_max_wait_ms", 0.0
+    )
+    user_router.get_user_write_batcher.cache_clear()
+    user = {"name": "John Doe", "email": "john@example.com"}
+
+    created = client.post("/users", json=user)
+    duplicate = client.post("/users", json=user)
+
+    assert created.status_code == 201
+    assert client.get(f"/users/{created.json()['id']}").status_code == 200
+    assert duplicate.status_code == 400
+    assert "already exists" in duplicate.json()["detail"]
+    text = client.get("/internal/metrics").text
+    assert 'write_batcher_items_total{group="users"} 2' in text
+    user_router.get_user_write_batcher.cache_clear()
+
+
+def test_export_users_ndjson(client) -> None:
+    """Test exporting users as NDJSON streams one object per line."""
+    for i in range(3):
+        client.post(
+            "/users",
+            json={"name": f"User {i}", "email": f"user{i}@example.com"},
+        )
+
+    response = client.get("/users/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["email"] for line in lines] == [
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
+    assert set(lines[0]) == {
+        "id", "name", "email", "active", "created_at", "updated_at"
+    }
+
+
+def test_export_users_csv(client, monkeypatch) -> None:
+    """Test exporting users as CSV across several body chunks."""
+    from infrastructure.api.routers import user_router
+
+    monkeypatch.setattr(user_router, "EXPORT_BATCH_SIZE", 2)
+    for i in range(3):
+        client.post(
+            "/users",
+            json={"name": f"User, {i}", "email": f"user{i}@example.com"},
+        )
+
+    response = client.get("/users/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "users.csv" in response.headers["content-disposition"]
+    records = list(csv.reader(io.StringIO(response.text)))
+    assert records[0] == [
+        "id", "name", "email", "active", "created_at", "updated_at"
+    ]
+    assert [record[1] for record in records[1:]] == [
+        "User, 0", "User, 1", "User, 2"
+    ]
+
+
+def test_export_users_fields(client) -> None:
+    """Test exporting only some columns, in CSV and NDJSON."""
+    for i in range(2):
+        client.post(
+            "/users",
+            json={"name": f"User {i}", "email": f"user{i}@example.com"},
+        )
+
+    response = client.get(
+        "/users/export", params={"format": "csv", "fields": "email,id"}
+    )
+    records = list(csv.reader(io.StringIO(response.text)))
+    assert records[0] == ["id", "email"]
+    assert [record[1] for record in records[1:]] == [
+        "user0@example.com", "user1@example.com"
+    ]
+
+    response = client.get("/users/export", params={"fields": "created_at"})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [set(line) for line in lines] == [{"created_at"}] * 2
+
+    response = client.get("/users/export", params={"fields": "secret"})
+    assert response.status_code == 400
+
+
+def test_export_users_invalid_format(client) -> None:
+    """Test exporting in an unknown format is rejected."""
+    response = client.get("/users/export", params={"format": "xml"})
+    assert response.status_code == 422
+
+
+def test_import_users_ndjson(client) -> None:
+    """Test importing an NDJSON body reports counts and rejected rows."""
+    client.post(
+        "/users", json={"name": "John Doe", "email": "john@example.com"}
+    )
+    body = "\n".join(
+        [
+            json.dumps({"name": "John Doe", "email": "john@example.com"}),
+            json.dumps({"name": "Jane Doe", "email": "jane@example.com"}),
+            json.dumps({"name": "Bad", "email": "not-an-email"}),
+            "not json",
+        ]
+    )
+
+    response = client.post(
+        "/users/import",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["received"] == 4
+    assert data["created"] == 1
+    assert data["skipped"] == 1
+    assert data["rejected"] == 2
+    assert [rejection["line"] for rejection in data["rejections"]] == [3, 4]
+    assert len(client.get("/users").json()) == 2
+
+
+def test_import_users_csv_upsert(client) -> None:
+    """Test importing a CSV body with upsert updates existing users."""
+    client.post(
+        "/users", json={"name": "John Doe", "email": "john@example.com"}
+    )
+    body = "name,email,active\nJohn Updated,john@example.com,false\n"
+
+    response = client.post(
+        "/users/import",
+        params={"format": "csv", "upsert": "true"},
+        content=body.encode(),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["updated"] == 1
+    users = client.get("/users").json()
+    assert users[0]["name"] == "John Updated"
+    assert users[0]["active"] is False
+
+
+def test_import_users_invalid_csv_header(client) -> None:
+    """Test a CSV body without the required columns is rejected."""
+    response = client.post(
+        "/users/import",
+        params={"format": "csv"},
+        content=b"name,mail\nJohn,john@example.com\n",
+    )
+
+    assert response.status_code == 400
+    assert "missing columns" in response.json()["detail"]
+
+
+def test_reads_use_replica_except_after_own_write(
+    client, monkeypatch, tmp_path
+) -> None:
+    """Test reads go to a healthy replica until the client writes."""
+    from infrastructure.config.settings import settings
+    from infrastructure.database import session
+
+    replica_url = f"sqlite:///{tmp_path / 'replica.sqlite3'}"
+    replica_engine = create_engine(replica_url)
+    Base.metadata.create_all(bind=replica_engine)
+    with replica_engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO users (name, email, active, created_at, updated_at)"
+            " VALUES ('Replica', 'replica@example.com', 1,"
+            " '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+        )
+    replica_engine.dispose()
+    unreachable_url = f"sqlite:///{tmp_path / 'missing' / 'db.sqlite3'}"
+    monkeypatch.setattr(
+        settings, "database_replica_urls", f"{unreachable_url},{replica_url}"
+    )
+    session.get_replica_set.cache_clear()
+
+    try:
+        # The unreachable replica drops out; the healthy one serves reads
+        for _ in range(2):
+            emails = [user["email"] for user in client.get("/users").json()]
+            assert emails == ["replica@example.com"]
+
+        create_response = client.post(
+            "/users", json={"name": "John Doe", "email": "john@example.com"}
+        )
+        assert session.LAST_WRITE_COOKIE in create_response.cookies
+
+        emails = [user["email"] for user in client.get("/users").json()]
+        assert emails == ["john@example.com"]
+
+        client.cookies.clear()
+        emails = [user["email"] for user in client.get("/users").json()]
+        assert emails == ["replica@example.com"]
+    finally:
+        session.get_replica_set.cache_clear()
+
+
+def test_replica_reads_do_not_fill_user_cache(
+    client, monkeypatch, tmp_path
+) -> None:
+    """Test a lagging replica cannot hide a client's write behind the cache."""
+    from infrastructure.api.routers import user_router
+    from infrastructure.config.settings import settings
+    from infrastructure.database import session
+
+    replica_url = f"sqlite:///{tmp_path / 'replica.sqlite3'}"
+    replica_engine = create_engine(replica_url)
+    Base.metadata.create_all(bind=replica_engine)
+    with replica_engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO users (name, email, active, created_at, updated_at)"
+            " VALUES ('John Doe', 'john@example.com', 1,"
+            " '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+        )
+    replica_engine.dispose()
+    monkeypatch.setattr(settings, "database_replica_urls", replica_url)
+    monkeypatch.setattr(user_router.settings, "user_cache_enabled", True)
+    session.get_replica_set.cache_clear()
+    user_router.get_user_cache.cache_clear()
+
+    try:
+        user_id = client.post(
+            "/users", json={"name": "John Doe", "email": "john@example.com"}
+        ).json()["id"]
+        client.put(f"/users/{user_id}", json={"name": "John Updated"})
+        last_write = client.cookies[session.LAST_WRITE_COOKIE]
+        # As if the write went through another worker, whose cache it
+        # refreshed
+        user_router.get_user_cache().clear()
+
+        client.cookies.clear()
+        stale = client.get(f"/users/{user_id}").json()
+        client.cookies.set(session.LAST_WRITE_COOKIE, last_write)
+        fresh = client.get(f"/users/{user_id}").json()
+
+        assert stale["name"] == "John Doe"
+        assert fresh["name"] == "John Updated"
+        assert len(user_router.get_user_cache()) == 0
+    finally:
+        session.get_replica_set.cache_clear()
+        user_router.get_user_cache.cache_clear()
+
+
+def test_pool_metrics(client) -> None:
+    """Test the internal metrics endpoint exposes pool statistics."""
+    from infrastructure.database import session
+
+    # The primary engine is created on first use, which get_db overrides
+    session.get_engine()
+    response = client.get("/internal/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'db_pool_size{pool="primary"}' in response.text
+    assert "admission_limit" not in response.text
+
+
+def test_admission_metrics(client, monkeypatch) -> None:
+    """Test admission metrics are exposed once admission control is on."""
+    from infrastructure.config.settings import settings
+
+    monkeypatch.setattr(settings, "admission_control_enabled", True)
+    response = client.get("/internal/metrics")
+
+    assert 'admission_limit{route_class="read"}' in response.text
@@ -0,0 +1,87 @@
+"""Tests for connection pool instrumentation."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from infrastructure.database.pool_metrics import (
+    InstrumentedQueuePool,
+    instrument_engine,
+    render_metrics,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create a registered engine with a single pooled connection."""
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.sqlite3'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_engine("test-pool", test_engine)
+    yield test_engine
+    test_engine.dispose()
+
+
+def test_checkout_duration_and_timeout_are_recorded(engine) -> None:
+    """Test checkouts are timed and pool timeouts counted."""
+    # Arrange
+    connection = engine.connect()
+
+    # Act
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    connection.close()
+
+    # Assert
+    stats = engine.pool.stats
+    assert stats.checkouts == 2
+    assert stats.checkout_timeouts == 1
+    assert stats.connections_created == 1
+    assert stats.checkout_seconds_sum >= 0.05
+
+
+def test_invalidated_connections_are_counted(engine) -> None:
+    """Test connections discarded as unusable are counted."""
+    # Arrange
+    connection = engine.connect()
+
+    # Act
+    connection.invalidate()
+    connection.close()
+
+    # Assert
+    assert engine.pool.stats.connections_invalidated == 1
+
+
+def test_stats_survive_dispose(engine) -> None:
+    """Test recreating the pool keeps its statistics."""
+    # Arrange
+    engine.connect().close()
+
+    # Act
+    engine.dispose()
+
+    # Assert
+    assert engine.pool.stats.checkouts == 1
+
+
+def test_render_metrics(engine) -> None:
+    """Test metrics are rendered in Prometheus text format."""
+    # Arrange
+    connection = engine.connect()
+
+    # Act
+    text = render_metrics()
+    connection.close()
+
+    # Assert
+    histogram = "db_pool_checkout_duration_seconds"
+    assert f"# TYPE {histogram} histogram" in text
+    assert 'db_pool_checked_out{pool="test-pool"} 1' in text
+    assert 'db_pool_size{pool="test-pool"} 1' in text
+    assert f'{histogram}_bucket{{pool="test-pool",le="+Inf"}} 1' in text
+    assert f'{histogram}_count{{pool="test-pool"}} 1' in text
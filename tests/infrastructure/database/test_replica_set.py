@@ -0,0 +1,50 @@
+"""Tests for ReplicaSet."""
+
+from infrastructure.database.replicas import ReplicaSet
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_candidates_rotate() -> None:
+    """Test each call starts with the next replica."""
+    # Arrange
+    replicas = ReplicaSet(["a", "b", "c"])
+
+    # Act
+    first = replicas.candidates()
+    second = replicas.candidates()
+
+    # Assert
+    assert first == ["a", "b", "c"]
+    assert second == ["b", "c", "a"]
+
+
+def test_failed_replica_is_skipped_then_retried() -> None:
+    """Test a replica marked down drops out until its retry time."""
+    # Arrange
+    clock = FakeClock()
+    replicas = ReplicaSet(["a", "b"], retry_after_seconds=30, clock=clock)
+
+    # Act
+    replicas.mark_down("a")
+
+    # Assert
+    assert replicas.candidates() == ["b"]
+    assert replicas.candidates() == ["b"]
+    clock.now = 30
+    assert "a" in replicas.candidates()
+
+
+def test_no_replicas() -> None:
+    """Test an empty set has no candidates."""
+    assert ReplicaSet([]).candidates() == []
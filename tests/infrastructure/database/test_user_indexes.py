@@ -0,0 +1,153 @@
+"""EXPLAIN tests for the indexes serving filtered user listings."""
+
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from core.application.dto.user_dto import UserFilterDto
+from infrastructure.adapters.repositories.user_repository_postgres_adapter import (  # noqa: E501
+    UserRepositoryPostgresAdapter,
+    build_search_statement,
+)
+from infrastructure.database.models.user_model import Base, UserModel
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+ROWS = 2000
+
+
+@pytest.fixture
+def engine():
+    """Create an analyzed users table where one user in ten is active."""
+    test_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=test_engine)
+    with test_engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [
+                {
+                    "name": f"User {i}",
+                    "email": f"user{i}@example.com",
+                    "active": i % 10 == 0,
+                    "created_at": START + timedelta(hours=i),
+                    "updated_at": START + timedelta(hours=i),
+                }
+                for i in range(ROWS)
+            ],
+        )
+        connection.exec_driver_sql("ANALYZE")
+    yield test_engine
+    test_engine.dispose()
+
+
+def _explain_get_all(engine, filters: UserFilterDto) -> str:
+    """Run a filtered listing and return the query plan of its SELECT."""
+    executed = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as session:
+            UserRepositoryPostgresAdapter(session).get_all(filters=filters)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = executed[-1]
+    with engine.connect() as connection:
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).all()
+    return "\n".join(row[-1] for row in plan)
+
+
+def test_active_filter_uses_partial_index(engine) -> None:
+    """Test active users are read from the partial index in id order."""
+    # Act
+    plan = _explain_get_all(engine, UserFilterDto(active=True))
+
+    # Assert
+    assert "USING INDEX ix_users_active_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_created_range_filter_uses_created_at_index(engine) -> None:
+    """Test a created_at range is an index range search, not a scan."""
+    # Act
+    plan = _explain_get_all(
+        engine,
+        UserFilterDto(
+            created_after=START + timedelta(hours=100),
+            created_before=START + timedelta(hours=110),
+        ),
+    )
+
+    # Assert
+    assert "SEARCH users USING INDEX ix_users_created_at" in plan
+
+
+@pytest.fixture
+def postgres_engine():
+    """
+    Create the users table on the database of ``TEST_POSTGRES_URL``.
+
+    The table is dropped and recreated, so never point it at real data.
+    Skipped when the variable is unset or the database is unreachable.
+    """
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    test_engine = create_engine(url)
+    try:
+        Base.metadata.drop_all(bind=test_engine)
+    except OperationalError as e:
+        test_engine.dispose()
+        pytest.skip(f"PostgreSQL is unreachable: {e}")
+    Base.metadata.create_all(bind=test_engine)
+    with test_engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [
+                {
+                    "name": f"User {i}",
+                    "email": f"user{i}@example.com",
+                    "active": True,
+                    "created_at": START,
+                    "updated_at": START,
+                }
+                for i in range(ROWS)
+            ],
+        )
+        connection.exec_driver_sql("ANALYZE users")
+    yield test_engine
+    Base.metadata.drop_all(bind=test_engine)
+    test_engine.dispose()
+
+
+@pytest.mark.postgres
+def test_search_reads_trigram_indexes_nearest_first(postgres_engine) -> None:
+    """Test search candidates come off the GiST indexes by KNN distance."""
+    # Arrange
+    statement = build_search_statement("user1", 20, "postgresql")
+    compiled = statement.compile(dialect=postgres_engine.dialect)
+
+    # Act
+    with postgres_engine.connect() as connection:
+        # A small table would be scanned anyway; check the indexes serve
+        connection.exec_driver_sql("SET enable_seqscan = off")
+        plan = "\n".join(
+            row[0]
+            for row in connection.exec_driver_sql(
+                f"EXPLAIN {compiled}", compiled.params
+            )
+        )
+
+    # Assert
+    assert "Index Scan using ix_users_name_trgm_gist" in plan
+    assert "Index Scan using ix_users_email_trgm_gist" in plan
+    assert "Order By: ((name)::text <-> " in plan
+    assert "Order By: ((email)::text <-> " in plan
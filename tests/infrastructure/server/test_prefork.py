@@ -0,0 +1,91 @@
+"""Tests for the pre-forking server helpers."""
+
+import asyncio
+import logging
+
+import uvicorn
+
+from infrastructure.server import prefork
+
+SMAPS_ROLLUP = """\
+55d0a0000000-7ffd00000000 ---p 00000000 00:00 0    [rollup]
+Rss:               67408 kB
+Pss:               27702 kB
+Shared_Clean:      52000 kB
+Shared_Dirty:       7200 kB
+Private_Clean:       208 kB
+Private_Dirty:      8000 kB
+Swap:                  0 kB
+"""
+
+
+def test_available_cpus_capped_by_cpu_quota(tmp_path, monkeypatch) -> None:
+    """Test a container CPU quota caps the CPUs, rounded up."""
+    # Arrange
+    monkeypatch.setattr(
+        prefork.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}
+    )
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("150000 100000\n")
+
+    # Act & Assert
+    assert prefork.available_cpus(str(cpu_max)) == 2
+    cpu_max.write_text("max 100000\n")
+    assert prefork.available_cpus(str(cpu_max)) == 4
+    assert prefork.available_cpus(str(tmp_path / "missing")) == 4
+
+
+def test_worker_count(monkeypatch) -> None:
+    """Test a configured count wins and 0 means one per CPU."""
+    monkeypatch.setattr(prefork, "available_cpus", lambda: 6)
+
+    assert prefork.worker_count(3) == 3
+    assert prefork.worker_count(0) == 6
+
+
+def test_memory_usage_reads_smaps_rollup(tmp_path) -> None:
+    """Test resident, proportional, shared and private sizes are read."""
+    # Arrange
+    smaps = tmp_path / "smaps_rollup"
+    smaps.write_text(SMAPS_ROLLUP)
+
+    # Act
+    usage = prefork.memory_usage(str(smaps))
+
+    # Assert
+    assert usage == {
+        "rss": 67408,
+        "pss": 27702,
+        "shared": 59200,
+        "private": 8208,
+    }
+    assert prefork.format_memory({"rss": 2048}) == "rss=2.0MiB"
+
+
+def test_memory_usage_without_smaps_rollup(tmp_path) -> None:
+    """Test only the peak resident size is reported elsewhere."""
+    usage = prefork.memory_usage(str(tmp_path / "missing"))
+
+    assert list(usage) == ["rss"]
+    assert usage["rss"] > 0
+
+
+def test_worker_not_reported_ready_when_startup_fails(
+    monkeypatch, caplog
+) -> None:
+    """Test a worker whose startup failed does not log it is ready."""
+    # Arrange
+    async def failed_startup(self, sockets=None) -> None:
+        self.should_exit = True
+
+    monkeypatch.setattr(uvicorn.Server, "startup", failed_startup)
+    server = prefork._WorkerServer(
+        uvicorn.Config(app=None, log_config=None), started=0.0
+    )
+
+    # Act
+    with caplog.at_level(logging.INFO, logger=prefork.logger.name):
+        asyncio.run(server.startup())
+
+    # Assert
+    assert "ready" not in caplog.text